@@ -0,0 +1,75 @@
+import asyncio
+import hashlib
+
+
+# ============================================================
+# SINGLE-FLIGHT
+# Upstream retries often post the same document several times
+# within a second. Concurrent requests with the same key (content
+# hash + rules version + options) await one shared computation
+# instead of each running ingestion and validation. Nothing is
+# kept once the computation finishes; this is not a result cache.
+# ============================================================
+
+def content_key(content: bytes, *parts) -> str:
+    digest = hashlib.sha256(content).hexdigest()
+    return ":".join([digest, *(str(p) for p in parts)])
+
+
+def file_key(path: str, *parts) -> str:
+    """content_key() for a file on disk, hashed in 1 MB blocks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return ":".join([digest.hexdigest(), *(str(p) for p in parts)])
+
+
+class SingleFlight:
+
+    def __init__(self):
+        self._inflight = {}  # key -> asyncio.Task
+        self.started = 0
+        self.coalesced = 0
+
+    async def do(self, key: str, factory):
+        """
+        Runs factory() (a coroutine function) once per key at a time.
+        Returns (result, shared) where shared is True for callers that
+        joined a computation started by another request.
+        """
+        task = self._inflight.get(key)
+        # A task from another event loop (another thread's loop) cannot be awaited here.
+        shared = task is not None and task.get_loop() is asyncio.get_running_loop()
+
+        if shared:
+            self.coalesced += 1
+        else:
+            self.started += 1
+            task = asyncio.ensure_future(factory())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._forget(key, t))
+
+        # shield: a caller that disconnects must not cancel the others' work
+        return await asyncio.shield(task), shared
+
+    def _forget(self, key: str, task):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+    def stats(self) -> dict:
+        return {
+            "in_flight": len(self._inflight),
+            "started": self.started,
+            "coalesced": self.coalesced,
+        }
+
+
+_single_flight = None
+
+
+def get_single_flight() -> SingleFlight:
+    global _single_flight
+    if _single_flight is None:
+        _single_flight = SingleFlight()
+    return _single_flight
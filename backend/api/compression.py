@@ -0,0 +1,260 @@
+import os
+import zlib
+
+from fastapi import HTTPException
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import PlainTextResponse
+
+from .uploads import UPLOAD_MAX_BYTES
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+# ============================================================
+# CONFIGURATION
+# ============================================================
+
+# JSON / NDJSON responses smaller than this go out uncompressed.
+COMPRESS_MIN_BYTES = int(os.environ.get("AUDIT_COMPRESS_MIN_BYTES", 1024))
+GZIP_LEVEL = int(os.environ.get("AUDIT_GZIP_LEVEL", 6))
+ZSTD_LEVEL = int(os.environ.get("AUDIT_ZSTD_LEVEL", 3))
+
+# Compressed uploads: decompressed/compressed ratio allowed once a body
+# is past DECOMPRESS_FREE_BYTES (small, repetitive CSVs legitimately
+# compress very well). Never more than the upload size limit in total.
+DECOMPRESS_MAX_RATIO = float(os.environ.get("AUDIT_DECOMPRESS_MAX_RATIO", 100))
+DECOMPRESS_FREE_BYTES = 10 * 1024 * 1024
+DECOMPRESS_MAX_BYTES = UPLOAD_MAX_BYTES
+
+COMPRESSIBLE_TYPES = ("application/json", "application/x-ndjson")
+
+# Input is fed to the decoders in slices this big, so one network chunk
+# can never inflate to more than a bounded amount before the guard runs.
+FEED_BYTES = 1024
+
+
+def available_encodings() -> tuple:
+    return ("zstd", "gzip") if zstandard is not None else ("gzip",)
+
+
+# ============================================================
+# CODECS
+# ============================================================
+
+class _GzipEncoder:
+    def __init__(self):
+        self._obj = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def chunk(self, data: bytes) -> bytes:
+        # sync flush: each streamed message is decodable on arrival
+        return self._obj.compress(data) + self._obj.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self, data: bytes = b"") -> bytes:
+        return self._obj.compress(data) + self._obj.flush()
+
+
+class _ZstdEncoder:
+    def __init__(self):
+        self._obj = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compressobj()
+
+    def chunk(self, data: bytes) -> bytes:
+        return self._obj.compress(data) + self._obj.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self, data: bytes = b"") -> bytes:
+        return self._obj.compress(data) + self._obj.flush()
+
+
+ENCODERS = {"gzip": _GzipEncoder, "zstd": _ZstdEncoder}
+
+
+def _decoder(encoding: str):
+    """Streaming decompressor (`decompress`, `eof`, `unused_data`), or None if unsupported."""
+    if encoding in ("gzip", "x-gzip"):
+        return zlib.decompressobj(16 + zlib.MAX_WBITS)
+    if encoding == "zstd" and zstandard is not None:
+        return zstandard.ZstdDecompressor().decompressobj()
+    return None
+
+
+def negotiate(accept_encoding: str):
+    """Best supported encoding in an Accept-Encoding header (zstd over gzip), or None."""
+    accepted = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[name.strip().lower()] = q
+
+    for encoding in available_encodings():
+        if accepted.get(encoding, accepted.get("*", 0.0)) > 0:
+            return encoding
+    return None
+
+
+# ============================================================
+# REQUEST BODIES
+# ============================================================
+
+class _DecodingReceive:
+    """
+    Wraps ASGI receive(): inflates the body while it streams in and stops
+    with 413 as soon as it grows past the ratio / size guard, and with 400
+    if the stream is corrupt, cut short or followed by trailing bytes.
+    """
+
+    def __init__(self, receive, decoder):
+        self.receive = receive
+        self.decoder = decoder
+        self.compressed = 0
+        self.decompressed = 0
+
+    async def __call__(self):
+        message = await self.receive()
+        if message["type"] != "http.request":
+            return message
+
+        body = message.get("body", b"")
+        self.compressed += len(body)
+
+        out = []
+        for start in range(0, len(body), FEED_BYTES):
+            try:
+                data = self.decoder.decompress(body[start:start + FEED_BYTES])
+            except Exception as e:  # zlib.error / zstandard.ZstdError
+                raise HTTPException(status_code=400, detail=f"Corrupt compressed body: {e}")
+            if self.decoder.unused_data:
+                raise HTTPException(status_code=400, detail="Trailing data after compressed body")
+            self.decompressed += len(data)
+            self._guard()
+            out.append(data)
+
+        if not message.get("more_body", False) and not self.decoder.eof:
+            raise HTTPException(status_code=400, detail="Truncated compressed body")
+
+        return {**message, "body": b"".join(out)}
+
+    def _guard(self):
+        if self.decompressed > DECOMPRESS_MAX_BYTES:
+            raise HTTPException(status_code=413, detail="Decompressed body too large")
+        if (self.decompressed > DECOMPRESS_FREE_BYTES
+                and self.decompressed > self.compressed * DECOMPRESS_MAX_RATIO):
+            raise HTTPException(status_code=413, detail="Compression ratio too high")
+
+
+# ============================================================
+# RESPONSES
+# ============================================================
+
+class _EncodingSend:
+    """
+    Wraps ASGI send(): compresses JSON / NDJSON bodies. A single-message
+    body is compressed only above COMPRESS_MIN_BYTES; streamed bodies are
+    compressed message by message with a flush after each.
+    """
+
+    def __init__(self, send, encoding: str, minimum_size: int):
+        self.send = send
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.start = None
+        self.encoder = None
+        self.passthrough = False
+
+    async def __call__(self, message):
+        if message["type"] == "http.response.start":
+            headers = Headers(raw=message["headers"])
+            content_type = headers.get("content-type", "")
+            self.passthrough = (
+                "content-encoding" in headers
+                or not content_type.startswith(COMPRESSIBLE_TYPES)
+            )
+            if self.passthrough:
+                await self.send(message)
+            else:
+                self.start = message  # held until we know the body size
+            return
+
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.start is not None:
+            start, self.start = self.start, None
+            headers = MutableHeaders(raw=start["headers"])
+            headers.add_vary_header("Accept-Encoding")
+
+            if not more_body and len(body) < self.minimum_size:
+                self.passthrough = True
+                await self.send(start)
+                await self.send(message)
+                return
+
+            self.encoder = ENCODERS[self.encoding]()
+            headers["Content-Encoding"] = self.encoding
+            if more_body:
+                del headers["Content-Length"]
+            else:
+                body = self.encoder.finish(body)
+                headers["Content-Length"] = str(len(body))
+                await self.send(start)
+                await self.send({**message, "body": body})
+                return
+            await self.send(start)
+
+        body = self.encoder.chunk(body) if more_body else self.encoder.finish(body)
+        await self.send({**message, "body": body})
+
+
+# ============================================================
+# MIDDLEWARE
+# ============================================================
+
+class CompressionMiddleware:
+    """gzip / zstd Content-Encoding on request bodies and JSON responses."""
+
+    def __init__(self, app, minimum_size: int = COMPRESS_MIN_BYTES):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+
+        encoding = headers.get("content-encoding", "identity").strip().lower()
+        if encoding != "identity":
+            decoder = _decoder(encoding)
+            if decoder is None:
+                response = PlainTextResponse(
+                    f"Unsupported Content-Encoding: {encoding}", status_code=415,
+                    headers={"Accept-Encoding": ", ".join(available_encodings())},
+                )
+                await response(scope, receive, send)
+                return
+
+            # Downstream sees a plain body of unknown length
+            scope = dict(scope)
+            scope["headers"] = [
+                (k, v) for k, v in scope["headers"]
+                if k not in (b"content-encoding", b"content-length")
+            ]
+            receive = _DecodingReceive(receive, decoder)
+
+        response_encoding = negotiate(headers.get("accept-encoding", ""))
+        if response_encoding is not None:
+            send = _EncodingSend(send, response_encoding, self.minimum_size)
+
+        await self.app(scope, receive, send)
@@ -0,0 +1,236 @@
+import json
+import math
+import os
+import sqlite3
+import threading
+import time
+
+
+# ============================================================
+# CONFIGURATION
+# ============================================================
+
+# Off by default: behind a reverse proxy every caller has the proxy's
+# address and would share a single bucket.
+RATE_LIMIT_ENABLED = os.environ.get("AUDIT_RATE_LIMIT", "0") == "1"
+
+# Default bucket per client: sustained requests/second and burst size.
+DEFAULT_RATE = float(os.environ.get("AUDIT_RATE_LIMIT_RPS", 10))
+DEFAULT_BURST = float(os.environ.get("AUDIT_RATE_LIMIT_BURST", 30))
+DEFAULT_WEIGHT = 1.0
+
+# API keys with their own bucket (and optional overrides):
+#   {"bulk-key": {"rate": 50, "burst": 200, "weight": 0.25}, "ui-key": {}, ...}
+# Keys not listed here are ignored; the caller is limited by address.
+CLIENTS_FILE = os.environ.get("AUDIT_CLIENTS_FILE")
+
+# Optional SQLite file; buckets are then shared by every worker on the host
+# and survive restarts.
+RATE_LIMIT_DB = os.environ.get("AUDIT_RATE_LIMIT_DB")
+
+API_KEY_HEADER = "X-API-Key"
+
+# Buckets that have refilled to their burst are dropped this often.
+SWEEP_SECONDS = 60
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS buckets (
+    client   TEXT PRIMARY KEY,
+    tokens   REAL NOT NULL,
+    updated  REAL NOT NULL
+)
+"""
+
+
+# ============================================================
+# CLIENTS
+# ============================================================
+
+class ClientPolicy:
+    """Rate, burst and fair-share weight for one API key."""
+
+    __slots__ = ("rate", "burst", "weight")
+
+    def __init__(self, rate=DEFAULT_RATE, burst=DEFAULT_BURST, weight=DEFAULT_WEIGHT):
+        self.rate = float(rate)
+        self.burst = float(burst)
+        self.weight = float(weight)
+
+
+def load_policies(path: str = None) -> dict:
+    path = path or CLIENTS_FILE
+    if not path:
+        return {}
+    try:
+        with open(path, encoding="utf-8") as f:
+            config = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Client limits not loaded from {path}: {e}")
+        return {}
+    return {key: ClientPolicy(**options) for key, options in config.items()}
+
+
+_policies = None
+_policies_lock = threading.Lock()
+
+
+def get_policies() -> dict:
+    """AUDIT_CLIENTS_FILE, loaded once. Needed for client ids and weights even with limiting off."""
+    global _policies
+    with _policies_lock:
+        if _policies is None:
+            _policies = load_policies()
+        return _policies
+
+
+def client_id(request, policies: dict) -> str:
+    """
+    The X-API-Key if it is one of the configured clients (`policies`),
+    otherwise the caller's address: a made-up key gets neither a fresh
+    bucket nor another client's weight.
+    """
+    key = request.headers.get(API_KEY_HEADER)
+    if key and key in policies:
+        return key
+    host = request.client.host if request.client else "unknown"
+    return f"ip:{host}"
+
+
+# ============================================================
+# TOKEN BUCKETS
+# ============================================================
+
+class Decision:
+    __slots__ = ("allowed", "limit", "remaining", "reset", "retry_after")
+
+    def __init__(self, allowed, limit, remaining, reset, retry_after):
+        self.allowed = allowed
+        self.limit = limit
+        self.remaining = remaining
+        self.reset = reset
+        self.retry_after = retry_after
+
+    def headers(self) -> dict:
+        headers = {
+            "X-RateLimit-Limit": str(int(self.limit)),
+            "X-RateLimit-Remaining": str(int(self.remaining)),
+            "X-RateLimit-Reset": str(int(math.ceil(self.reset))),
+        }
+        if not self.allowed:
+            headers["Retry-After"] = str(int(math.ceil(self.retry_after)))
+        return headers
+
+
+def _take(tokens: float, updated: float, now: float, policy: ClientPolicy, cost: float):
+    """Refills, then takes `cost` tokens if available. Returns (tokens, Decision)."""
+    tokens = min(policy.burst, tokens + (now - updated) * policy.rate)
+    allowed = tokens >= cost
+    if allowed:
+        tokens -= cost
+
+    rate = policy.rate or float("inf")
+    decision = Decision(
+        allowed=allowed,
+        limit=policy.burst,
+        remaining=tokens,
+        reset=(policy.burst - tokens) / rate,
+        retry_after=0.0 if allowed else (cost - tokens) / rate,
+    )
+    return tokens, decision
+
+
+class RateLimiter:
+    """
+    Per-client token buckets. In memory by default; with a SQLite path
+    each check is one short IMMEDIATE transaction, so all workers on the
+    host draw from the same bucket.
+    """
+
+    def __init__(self, policies: dict = None, db_path: str = None):
+        self.policies = policies if policies is not None else get_policies()
+        self.default_policy = ClientPolicy()
+        self._buckets = {}  # client -> (tokens, updated)
+        self._lock = threading.Lock()
+        self._next_sweep = 0.0
+        self.conn = None
+
+        if db_path:
+            self.conn = sqlite3.connect(db_path, isolation_level=None, check_same_thread=False)
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA busy_timeout=1000")
+            self.conn.execute(SCHEMA)
+
+    def policy(self, client: str) -> ClientPolicy:
+        return self.policies.get(client, self.default_policy)
+
+    def consume(self, client: str, cost: float = 1.0) -> Decision:
+        policy = self.policy(client)
+        now = time.time()
+
+        with self._lock:
+            if now >= self._next_sweep:
+                self._next_sweep = now + SWEEP_SECONDS
+                self._sweep(now)
+
+            if self.conn is None:
+                tokens, updated = self._buckets.get(client, (policy.burst, now))
+                tokens, decision = _take(tokens, updated, now, policy, cost)
+                self._buckets[client] = (tokens, now)
+                return decision
+
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self.conn.execute(
+                    "SELECT tokens, updated FROM buckets WHERE client = ?", (client,)
+                ).fetchone()
+                tokens, updated = row if row else (policy.burst, now)
+                tokens, decision = _take(tokens, updated, now, policy, cost)
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO buckets (client, tokens, updated) VALUES (?, ?, ?)",
+                    (client, tokens, now),
+                )
+                self.conn.execute("COMMIT")
+            except Exception:
+                self.conn.execute("ROLLBACK")
+                raise
+            return decision
+
+    def _sweep(self, now: float):
+        """Drops buckets that have refilled to their burst: same as having none."""
+        if self.conn is None:
+            for client, (tokens, updated) in list(self._buckets.items()):
+                policy = self.policy(client)
+                if tokens + (now - updated) * policy.rate >= policy.burst:
+                    del self._buckets[client]
+            return
+
+        known = list(self.policies)
+        default = self.default_policy
+        self.conn.execute(
+            f"DELETE FROM buckets WHERE client NOT IN ({','.join('?' * len(known))}) "
+            "AND tokens + (? - updated) * ? >= ?",
+            (*known, now, default.rate, default.burst),
+        )
+        for client, policy in self.policies.items():
+            self.conn.execute(
+                "DELETE FROM buckets WHERE client = ? AND tokens + (? - updated) * ? >= ?",
+                (client, now, policy.rate, policy.burst),
+            )
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+
+_limiter = None
+_limiter_lock = threading.Lock()
+
+
+def get_limiter() -> RateLimiter:
+    global _limiter
+    with _limiter_lock:
+        if _limiter is None:
+            _limiter = RateLimiter(db_path=RATE_LIMIT_DB)
+        return _limiter
@@ -0,0 +1,30 @@
+import json
+
+from fastapi.responses import JSONResponse
+
+from backend.audit.validation.models import json_default
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson when available (stdlib json otherwise).
+
+    Endpoints return this directly, so FastAPI skips jsonable_encoder and the
+    response_model validation pass; validation results (FieldResult, enums)
+    are serialized natively.
+    """
+
+    def render(self, content) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(content, default=json_default)
+        return json.dumps(
+            content,
+            ensure_ascii=False,
+            separators=(",", ":"),
+            default=json_default,
+        ).encode("utf-8")
@@ -1,28 +1,51 @@
-from fastapi import APIRouter, UploadFile, File, HTTPException
+from fastapi import APIRouter, UploadFile, File, HTTPException, Header, Request, Response
+from starlette.concurrency import run_in_threadpool
+from typing import Literal, Optional
 import os
 import tempfile
+import uuid
 
-from backend.audit.ingestion.router import ingest_document
-from backend.audit.validation.validator import validate_document
-from backend.audit.normalization.normalizer import normalize_for_validation
+from backend.audit.ingestion.router import SUPPORTED_EXTENSIONS
+from backend.audit.ingestion.sandbox import SANDBOX_ENABLED
+from backend.audit.pipeline import run_pipeline
+from backend.audit.results_store import get_results_store
+from backend.audit.validation.models import FieldStatus, field_label
+from backend.audit.validation.memo import rule_cache_stats
+from backend.audit.validation.profiles import get_profile, list_profiles
+from backend.audit.validation.validator import PAGE_1_FIELDS, apply_corrections
+
+from .coalesce import content_key, file_key, get_single_flight
+from .limits import DEFAULT_WEIGHT, RATE_LIMIT_ENABLED, client_id, get_limiter, get_policies
+from .responses import FastJSONResponse
+from .scheduler import get_scheduler
+from .uploads import UploadError, get_upload_store
+from .validations import get_validation_store
+from .schemas import CorrectionRequest, ValidationResponse
 
 router = APIRouter()
 
+# Page-1 result key → normalized key (provenance is keyed by the latter)
+PAGE_1_SOURCES = {key: source for key, source, _, _ in PAGE_1_FIELDS}
+
 
-def build_frontend_response(validation_result: dict):
+def build_frontend_response(validation_result: dict, include_rows: bool = True):
     """
     Converts backend validation output into frontend-friendly response.
     Shows ONLY missing or incorrect fields (Page 1 + Page 2).
+
+    Single pass: issues are collected while the Page-2 rows are serialized,
+    using the precomputed field labels. With include_rows=False the full
+    Page-2 row echo is left out of the response.
     """
     issues = []
 
     # -------- Page 1 --------
     page_1_fields = validation_result.get("page_1", {}).get("fields", {})
     for field, res in page_1_fields.items():
-        if res.get("status") != "FOUND_AND_VALID":
+        if res.status is not FieldStatus.VALID:
             issues.append({
-                "field": field.replace("_", " ").title(),
-                "message": res.get("error", "Invalid or missing value")
+                "field": field_label(field),
+                "message": res.error or "Invalid or missing value"
             })
 
     # -------- Page 2 --------
@@ -36,74 +59,486 @@ def build_frontend_response(validation_result: dict):
         })
 
     # ✅ Row-level Page-2 validation
+    rows_out = []
     for row in page_2.get("rows", []):
-        for field, res in row.get("fields", {}).items():
-            if res.get("status") != "FOUND_AND_VALID":
+        row_number = row["row_number"]
+        fields_out = {}
+
+        for field, res in row["fields"].items():
+            if include_rows:
+                fields_out[field] = res.to_dict()
+            if res.status is not FieldStatus.VALID:
                 issues.append({
-                    "field": f"{field.replace('_', ' ').title()} (Row {row.get('row_number')})",
-                    "message": res.get("error", "Invalid or missing value")
+                    "field": f"{field_label(field)} (Row {row_number})",
+                    "message": res.error or "Invalid or missing value"
                 })
 
-    return {
+        if include_rows:
+            rows_out.append({"row_number": row_number, "fields": fields_out})
+
+    page_2_out = {
+        "status": page_2.get("status"),
+        "detail": page_2.get("detail"),
+    }
+    if include_rows:
+        page_2_out["rows"] = rows_out
+
+    response = {
         "overall_status": validation_result.get("overall_status"),
         "can_proceed": validation_result.get("overall_status") == "PASS",
         "issues": issues,
-        "page_2": {
-            "status": page_2.get("status"),
-            "detail": page_2.get("detail"),
-            "rows": page_2.get("rows", [])
-        }
+        "page_2": page_2_out
     }
 
+    # fail_fast mode: issues list is incomplete by design
+    if "stopped_early" in validation_result:
+        response["stopped_early"] = validation_result["stopped_early"]
+
+    # PDFs: which extraction tier produced each field, and how reliable it is
+    if "provenance" in validation_result:
+        response["provenance"] = validation_result["provenance"]
+
+    return response
+
+
+def _client_id(request: Request) -> str:
+    # Policy table only: the limiter (and its SQLite file) is not built
+    # unless limiting is on.
+    return client_id(request, get_policies())
+
+
+def _client_weight(client: str) -> float:
+    policy = get_policies().get(client)
+    return policy.weight if policy is not None else DEFAULT_WEIGHT
 
-@router.post("/validate-document")
-async def validate_document_endpoint(file: UploadFile = File(...)):
 
-    allowed_exts = {".pdf", ".docx", ".xlsx", ".csv"}
-    ext = os.path.splitext(file.filename)[1].lower()
+def _check_rate_limit(client: str) -> dict:
+    """Per-client token bucket (configured X-API-Key, else caller address). Returns the X-RateLimit-* headers."""
+    if not RATE_LIMIT_ENABLED:
+        return {}
+    decision = get_limiter().consume(client)
+    rate_headers = decision.headers()
+    if not decision.allowed:
+        raise HTTPException(
+            status_code=429,
+            detail="Rate limit exceeded. Retry later.",
+            headers=rate_headers,
+        )
+    return rate_headers
 
-    if ext not in allowed_exts:
+
+def _check_extension(filename: str) -> str:
+    ext = os.path.splitext(filename or "")[1].lower()
+    if ext not in SUPPORTED_EXTENSIONS:
         raise HTTPException(
             status_code=400,
-            detail=f"Unsupported file type. Allowed: {sorted(allowed_exts)}"
+            detail=f"Unsupported file type. Allowed: {sorted(SUPPORTED_EXTENSIONS)}"
         )
+    return ext
+
+
+def _resolve_profile(tenant: Optional[str], x_tenant_id: Optional[str]):
+    # Rule profile: ?tenant= wins over the X-Tenant-ID header
+    tenant = tenant or x_tenant_id
+    profile = get_profile(tenant)
+    if profile is None:
+        raise HTTPException(status_code=400, detail=f"Unknown rule profile: {tenant}")
+    return profile
+
+
+async def _validate_path(path: str, filename: str, mode: str, profile, client: str):
+    # Queued fairly between clients, then run on a thread; ingestion
+    # itself runs in a resource-limited sandbox process (AUDIT_SANDBOX)
+    return await get_scheduler().run(
+        client,
+        _client_weight(client),
+        run_pipeline,
+        path, filename, mode, profile,
+        sandbox=SANDBOX_ENABLED,
+        keep_normalized=True,
+    )
 
-    tmp_path = None
 
+async def _validate_upload(content: bytes, ext: str, filename: str, mode: str, profile, client: str):
+    """
+    Temp file → ingest → validate for one upload. Runs once per single-flight
+    key; the temp file belongs to this call, not to any one request.
+    """
+    tmp_path = None
     try:
-        # 1️⃣ Save file
         with tempfile.NamedTemporaryFile(delete=False, suffix=ext) as tmp:
-            tmp.write(await file.read())
+            tmp.write(content)
             tmp_path = tmp.name
+        return await _validate_path(tmp_path, filename, mode, profile, client)
+    finally:
+        if tmp_path and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
 
-        # 2️⃣ Extract
-        extracted_content = await ingest_document(file, tmp_path)
+async def _validate_spooled(path: str, filename: str, mode: str, profile, client: str):
+    """Same as _validate_upload() for a finished resumable upload's spool file."""
+    try:
+        return await _validate_path(path, filename, mode, profile, client)
+    finally:
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def _remember(validation_result: Optional[dict], profile, filename: str) -> str:
+    """
+    Keeps a validated document under a new result id: its normalized payload
+    for corrections (when there is one) and its outcome in the results
+    store (AUDIT_RESULTS_DB). Returns the result id.
+    """
+    result_id = uuid.uuid4().hex
 
-        if not extracted_content:
-            return {
-                "success": False,
-                "overall_status": "INSUFFICIENT_DATA",
-                "can_proceed": False,
-                "issues": ["No data extracted from document"]
-            }
+    if validation_result and "normalized" in validation_result:
+        get_validation_store().put(
+            validation_result["normalized"], validation_result, profile, filename,
+            result_id=result_id,
+        )
 
-        # 3️⃣ Normalize
-        normalized_payload = normalize_for_validation(extracted_content)
+    _record_result(result_id, validation_result, profile, filename)
+    return result_id
 
-        # 4️⃣ Validate
-        validation_result = validate_document(normalized_payload)
 
-        # 5️⃣ Frontend response
-        frontend_response = build_frontend_response(validation_result)
+def _record_result(result_id: str, validation_result: Optional[dict], profile, filename: str):
+    results = get_results_store()
+    if results is not None:
+        results.add(
+            result_id, validation_result,
+            source=filename,
+            tenant=profile.name,
+            rules_version=profile.rules_version,
+            overall_status=None if validation_result else "INSUFFICIENT_DATA",
+        )
 
+
+def _build_payload(validation_result: Optional[dict], include_rows: bool) -> dict:
+    if validation_result is None:
+        return {
+            "success": False,
+            "overall_status": "INSUFFICIENT_DATA",
+            "can_proceed": False,
+            "issues": ["No data extracted from document"]
+        }
+
+    # Killed in the sandbox (timeout / CPU / memory limit)
+    if validation_result.get("aborted"):
         return {
-            "success": True,
-            **frontend_response
+            "success": False,
+            "overall_status": validation_result["overall_status"],
+            "can_proceed": False,
+            "issues": validation_result["errors"],
+            "aborted": validation_result["aborted"],
         }
 
+    # 3️⃣ Frontend response
+    return {
+        "success": True,
+        **build_frontend_response(validation_result, include_rows)
+    }
+
+
+@router.post(
+    "/validate-document",
+    response_model=ValidationResponse,
+    response_class=FastJSONResponse,
+)
+async def validate_document_endpoint(
+    request: Request,
+    file: UploadFile = File(...),
+    include_rows: bool = True,
+    mode: Literal["full", "fail_fast"] = "full",
+    tenant: Optional[str] = None,
+    x_tenant_id: Optional[str] = Header(None),
+):
+
+    ext = _check_extension(file.filename)
+    client = _client_id(request)
+    rate_headers = _check_rate_limit(client)
+    profile = _resolve_profile(tenant, x_tenant_id)
+
+    try:
+        # 1️⃣ Read upload
+        content = await file.read()
+
+        # 2️⃣ Extract → Normalize → Validate
+        # Identical bytes under the same rules already in flight (upstream
+        # retries) join that computation instead of starting another.
+        key = content_key(content, ext, mode, profile.rules_version)
+        validation_result, shared = await get_single_flight().do(
+            key,
+            lambda: _validate_upload(content, ext, file.filename, mode, profile, client),
+        )
+        if shared:
+            rate_headers["X-Coalesced"] = "1"
+
+        payload = _build_payload(validation_result, include_rows)
+        payload["result_id"] = await run_in_threadpool(
+            _remember, validation_result, profile, file.filename
+        )
+
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-    finally:
-        if tmp_path and os.path.exists(tmp_path):
-            os.remove(tmp_path)
+    return FastJSONResponse(payload, headers=rate_headers)
+
+
+# ============================================================
+# RESUMABLE UPLOADS
+# POST   /uploads?filename=&length=   → upload_id, chunk_size
+# GET    /uploads/{id}                → current offset (resume point)
+# PATCH  /uploads/{id}                → raw chunk at Upload-Offset
+# POST   /uploads/{id}/finalize       → same response as /validate-document
+# DELETE /uploads/{id}                → abandon
+# ============================================================
+
+def _upload_error(e: UploadError) -> HTTPException:
+    headers = {} if e.offset is None else {"Upload-Offset": str(e.offset)}
+    return HTTPException(status_code=e.status, detail=str(e), headers=headers)
+
+
+@router.post("/uploads", status_code=201)
+async def create_upload_endpoint(request: Request, filename: str, length: int):
+    _check_extension(filename)
+    # One rate-limit token per document, taken before any bytes are sent
+    client = _client_id(request)
+    rate_headers = _check_rate_limit(client)
+
+    try:
+        status = await run_in_threadpool(
+            get_upload_store().create, filename, length, client
+        )
+    except UploadError as e:
+        raise _upload_error(e)
+
+    rate_headers["Location"] = f"{request.url.path}/{status['upload_id']}"
+    return FastJSONResponse(status, status_code=201, headers=rate_headers)
+
+
+@router.get("/uploads/{upload_id}")
+async def upload_status_endpoint(upload_id: str):
+    try:
+        status = await run_in_threadpool(get_upload_store().status, upload_id)
+    except UploadError as e:
+        raise _upload_error(e)
+    return FastJSONResponse(status, headers={"Upload-Offset": str(status["offset"])})
+
+
+@router.patch("/uploads/{upload_id}")
+async def upload_chunk_endpoint(upload_id: str, request: Request, upload_offset: int = Header(...)):
+    store = get_upload_store()
+    # Content-Length may be missing (chunked encoding) or wrong: count what
+    # actually arrives and stop buffering as soon as it passes the cap
+    chunk = bytearray()
+    async for part in request.stream():
+        chunk += part
+        if len(chunk) > store.chunk_bytes:
+            raise HTTPException(status_code=413, detail=f"Chunk exceeds {store.chunk_bytes} bytes")
+
+    try:
+        offset = await run_in_threadpool(store.append, upload_id, upload_offset, chunk)
+    except UploadError as e:
+        raise _upload_error(e)
+    return FastJSONResponse({"offset": offset}, headers={"Upload-Offset": str(offset)})
+
+
+@router.delete("/uploads/{upload_id}", status_code=204)
+async def delete_upload_endpoint(upload_id: str):
+    try:
+        await run_in_threadpool(get_upload_store().delete, upload_id)
+    except UploadError as e:
+        raise _upload_error(e)
+    return Response(status_code=204)
+
+
+@router.post(
+    "/uploads/{upload_id}/finalize",
+    response_model=ValidationResponse,
+    response_class=FastJSONResponse,
+)
+async def finalize_upload_endpoint(
+    upload_id: str,
+    request: Request,
+    include_rows: bool = True,
+    mode: Literal["full", "fail_fast"] = "full",
+    tenant: Optional[str] = None,
+    x_tenant_id: Optional[str] = Header(None),
+):
+    client = _client_id(request)
+    profile = _resolve_profile(tenant, x_tenant_id)
+
+    try:
+        path, filename = await run_in_threadpool(get_upload_store().claim, upload_id)
+    except UploadError as e:
+        raise _upload_error(e)
+
+    try:
+        ext = os.path.splitext(filename)[1].lower()
+        key = await run_in_threadpool(file_key, path, ext, mode, profile.rules_version)
+        validation_result, shared = await get_single_flight().do(
+            key,
+            lambda: _validate_spooled(path, filename, mode, profile, client),
+        )
+
+        headers = {}
+        if shared:
+            # Another request's run answered us; our spool file was never used
+            os.remove(path)
+            headers["X-Coalesced"] = "1"
+
+        payload = _build_payload(validation_result, include_rows)
+        payload["result_id"] = await run_in_threadpool(
+            _remember, validation_result, profile, filename
+        )
+
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+    return FastJSONResponse(payload, headers=headers)
+
+
+# ============================================================
+# CORRECTIONS
+# PATCH /validations/{result_id} with corrected field values:
+# only those fields are re-validated against the stored
+# normalized payload (kept AUDIT_VALIDATION_TTL_SECONDS).
+# ============================================================
+
+def _correct(result_id: str, corrections: dict):
+    store = get_validation_store()
+    with store.lock(result_id):
+        record = store.get(result_id)
+        if record is None:
+            raise HTTPException(status_code=404, detail="Unknown or expired validation result")
+
+        profile = get_profile(record["tenant"])
+        if profile is None:
+            raise HTTPException(
+                status_code=409,
+                detail=f"Rule profile {record['tenant']} no longer exists; re-upload the document",
+            )
+
+        previous = record["result"]
+        try:
+            normalized, result = apply_corrections(
+                record["normalized"], previous, corrections, profile,
+                # rules reloaded since: nothing from the old run can be reused
+                reuse=profile.rules_version == record["rules_version"],
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        provenance = dict(previous.get("provenance") or {})
+        for key in corrections["page_1"]:
+            provenance[PAGE_1_SOURCES.get(key, key)] = {"source": "user", "confidence": 1.0}
+        if provenance:
+            result["provenance"] = provenance
+
+        store.put(normalized, result, profile, record["filename"], result_id=result_id)
+        _record_result(result_id, result, profile, record["filename"])
+        return result
+
+
+@router.patch(
+    "/validations/{result_id}",
+    response_model=ValidationResponse,
+    response_class=FastJSONResponse,
+)
+async def correct_validation_endpoint(
+    result_id: str,
+    body: CorrectionRequest,
+    request: Request,
+    include_rows: bool = True,
+):
+    rate_headers = _check_rate_limit(_client_id(request))
+
+    corrections = {
+        "page_1": body.page_1,
+        "rows": {row.row_number: row.fields for row in body.rows},
+    }
+    result = await run_in_threadpool(_correct, result_id, corrections)
+
+    payload = _build_payload(result, include_rows)
+    payload["result_id"] = result_id
+    return FastJSONResponse(payload, headers=rate_headers)
+
+
+# ============================================================
+# RESULTS (AUDIT_RESULTS_DB)
+# Reporting queries served from the results store's indexes.
+# ============================================================
+
+def _results_store():
+    store = get_results_store()
+    if store is None:
+        raise HTTPException(status_code=503, detail="Results store disabled (set AUDIT_RESULTS_DB)")
+    return store
+
+
+@router.get("/results")
+async def list_results_endpoint(
+    company: Optional[str] = None,
+    status: Optional[str] = None,
+    rules_version: Optional[str] = None,
+    tenant: Optional[str] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    limit: int = 50,
+    cursor: Optional[str] = None,
+):
+    """Validated documents, newest first; pass next_cursor back for the next page."""
+    store = _results_store()
+    try:
+        page = await run_in_threadpool(
+            store.list_documents, limit, cursor,
+            company=company, status=status, rules_version=rules_version,
+            tenant=tenant, since=since, until=until,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return FastJSONResponse(page)
+
+
+@router.get("/results/summary")
+async def results_summary_endpoint(
+    group_by: str = "status",
+    company: Optional[str] = None,
+    status: Optional[str] = None,
+    rules_version: Optional[str] = None,
+    tenant: Optional[str] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+):
+    """Document counts per status (and per group_by key) and field outcome counts."""
+    store = _results_store()
+    try:
+        summary = await run_in_threadpool(
+            store.summary, group_by,
+            company=company, status=status, rules_version=rules_version,
+            tenant=tenant, since=since, until=until,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return FastJSONResponse(summary)
+
+
+@router.get("/results/{result_id}")
+async def get_result_endpoint(result_id: str):
+    document = await run_in_threadpool(_results_store().get_document, result_id)
+    if document is None:
+        raise HTTPException(status_code=404, detail="Unknown result")
+    return FastJSONResponse(document)
+
+
+@router.get("/rule-cache")
+async def rule_cache_endpoint():
+    """Memoization hit rates for the field rules (this worker only)."""
+    return rule_cache_stats()
+
+
+@router.get("/profiles")
+async def profiles_endpoint():
+    """Loaded tenant rule profiles and their versions (this worker only)."""
+    return list_profiles()
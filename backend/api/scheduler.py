@@ -0,0 +1,100 @@
+import asyncio
+import functools
+import heapq
+import itertools
+import os
+
+
+# ============================================================
+# WEIGHTED FAIR QUEUING
+# Validation jobs wait here for one of AUDIT_INGEST_CONCURRENCY
+# slots before they run on a thread. Each job gets a virtual
+# finish tag  max(virtual time, client's last tag) + cost/weight
+# and free slots go to the smallest tag. A client with hundreds of
+# queued uploads therefore spaces its own tags out, while a user
+# sending a single document is served next; when only one client
+# is waiting it still gets every slot (work conserving).
+# ============================================================
+
+INGEST_CONCURRENCY = int(
+    os.environ.get("AUDIT_INGEST_CONCURRENCY", os.environ.get("AUDIT_SANDBOX_WORKERS", 2))
+)
+
+
+class FairScheduler:
+
+    def __init__(self, concurrency: int = INGEST_CONCURRENCY):
+        self.concurrency = max(1, concurrency)
+        self.running = 0
+        self.virtual_time = 0.0
+        self._last_finish = {}  # client -> finish tag of its latest job
+        self._queue = []        # heap of (finish, seq, start, future)
+        self._seq = itertools.count()
+
+    @property
+    def queued(self) -> int:
+        return sum(1 for *_, fut in self._queue if not fut.done())
+
+    async def run(self, client: str, weight: float, func, *args, cost: float = 1.0, **kwargs):
+        """Waits for a fair-share slot, then runs func(*args, **kwargs) in a thread."""
+        await self._acquire(client, weight, cost)
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
+        finally:
+            self._release()
+
+    async def _acquire(self, client: str, weight: float, cost: float):
+        start = max(self.virtual_time, self._last_finish.get(client, 0.0))
+        finish = start + cost / max(weight, 1e-6)
+        self._last_finish[client] = finish
+
+        if self.running < self.concurrency and not self._queue:
+            self.running += 1
+            self.virtual_time = start
+            return
+
+        fut = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._queue, (finish, next(self._seq), start, fut))
+        try:
+            await fut
+        except asyncio.CancelledError:
+            # Client went away. If a slot was already handed over, pass it on.
+            if fut.done() and not fut.cancelled():
+                self._release()
+            raise
+
+    def _release(self):
+        self.running -= 1
+        while self._queue and self.running < self.concurrency:
+            _, _, start, fut = heapq.heappop(self._queue)
+            if fut.done():
+                continue
+            self.running += 1
+            self.virtual_time = start
+            fut.set_result(None)
+
+        if self.running == 0 and not self._queue:
+            # Idle: forget history so tags cannot grow without bound.
+            self._last_finish.clear()
+            self.virtual_time = 0.0
+        else:
+            self._forget_finished()
+
+    def _forget_finished(self):
+        # A tag at or behind virtual time no longer affects the client's
+        # next start (max(virtual time, tag)), so one-off clients are
+        # dropped instead of accumulating under sustained load.
+        vt = self.virtual_time
+        for client in [c for c, finish in self._last_finish.items() if finish <= vt]:
+            del self._last_finish[client]
+
+
+_scheduler = None
+
+
+def get_scheduler() -> FairScheduler:
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = FairScheduler()
+    return _scheduler
@@ -0,0 +1,64 @@
+from typing import Dict, List, Optional, Union
+
+from pydantic import BaseModel
+
+
+# ============================================================
+# RESPONSE MODELS
+# Declared once for the OpenAPI schema. Handlers return
+# FastJSONResponse directly, so these are never used to
+# validate or re-encode responses at request time.
+# ============================================================
+
+class FieldOut(BaseModel):
+    status: str
+    value: Optional[str] = None
+    error: Optional[str] = None
+
+
+class RowOut(BaseModel):
+    row_number: int
+    fields: Dict[str, FieldOut]
+
+
+class Page2Out(BaseModel):
+    status: Optional[str] = None
+    detail: Optional[str] = None
+    rows: Optional[List[RowOut]] = None
+
+
+class IssueOut(BaseModel):
+    field: str
+    message: str
+
+
+class ProvenanceOut(BaseModel):
+    source: str
+    confidence: float
+
+
+class ValidationResponse(BaseModel):
+    success: bool
+    overall_status: Optional[str] = None
+    can_proceed: bool
+    issues: List[Union[IssueOut, str]]
+    page_2: Optional[Page2Out] = None
+    stopped_early: Optional[bool] = None
+    provenance: Optional[Dict[str, ProvenanceOut]] = None
+    aborted: Optional[str] = None
+    result_id: Optional[str] = None
+
+
+# ============================================================
+# REQUEST MODELS
+# ============================================================
+
+class RowCorrection(BaseModel):
+    row_number: int
+    fields: Dict[str, Optional[str]]
+
+
+class CorrectionRequest(BaseModel):
+    """Corrected values, keyed like the validation response's fields."""
+    page_1: Dict[str, Optional[str]] = {}
+    rows: List[RowCorrection] = []
@@ -0,0 +1,209 @@
+import json
+import os
+import tempfile
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows: single-process servers only
+    fcntl = None
+
+
+# ============================================================
+# CONFIGURATION
+# ============================================================
+
+# Spool files for resumable uploads. Shared by every worker on the host:
+# the offset of an upload is the size of its spool file, so a chunk can
+# land on any worker and a restarted server picks up where it left off.
+UPLOAD_DIR = os.environ.get(
+    "AUDIT_UPLOAD_DIR", os.path.join(tempfile.gettempdir(), "audit-uploads")
+)
+UPLOAD_MAX_BYTES = int(os.environ.get("AUDIT_UPLOAD_MAX_MB", 500)) * 1024 * 1024
+UPLOAD_CHUNK_BYTES = int(os.environ.get("AUDIT_UPLOAD_CHUNK_MB", 8)) * 1024 * 1024
+# Unfinished uploads untouched for this long are deleted.
+UPLOAD_TTL_SECONDS = float(os.environ.get("AUDIT_UPLOAD_TTL_SECONDS", 24 * 3600))
+
+
+class UploadError(Exception):
+    """Rejected upload operation; `status` is the HTTP status to answer with."""
+
+    def __init__(self, status: int, message: str, offset: int = None):
+        super().__init__(message)
+        self.status = status
+        self.offset = offset
+
+
+# ============================================================
+# SPOOL STORE
+# <id>.json  filename, declared length, owner
+# <id>.part  bytes received so far (its size is the offset)
+# ============================================================
+
+class UploadStore:
+
+    def __init__(self, directory: str = UPLOAD_DIR, max_bytes: int = UPLOAD_MAX_BYTES,
+                 chunk_bytes: int = UPLOAD_CHUNK_BYTES, ttl: float = UPLOAD_TTL_SECONDS):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.chunk_bytes = chunk_bytes
+        self.ttl = ttl
+        self._locks = {}  # upload id -> Lock (chunks of one upload are serialized)
+        self._locks_guard = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, upload_id: str, suffix: str) -> str:
+        # ids are uuid4 hex; anything else never touches the filesystem
+        if len(upload_id) != 32 or not all(c in "0123456789abcdef" for c in upload_id):
+            raise UploadError(404, "Unknown upload")
+        return os.path.join(self.directory, upload_id + suffix)
+
+    def _lock(self, upload_id: str) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault(upload_id, threading.Lock())
+
+    @contextmanager
+    def _locked_part(self, upload_id: str):
+        """
+        Open `.part` file, exclusively locked across workers (flock) as well
+        as threads. Raises 404 if another worker claimed or deleted the
+        upload while we waited for the lock.
+        """
+        part = self._path(upload_id, ".part")
+        with self._lock(upload_id):
+            try:
+                f = open(part, "r+b")
+            except FileNotFoundError:
+                raise UploadError(404, "Unknown upload") from None
+            with f:
+                if fcntl is not None:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+                try:
+                    current = os.path.samestat(os.fstat(f.fileno()), os.stat(part))
+                except FileNotFoundError:
+                    current = False
+                if not current:
+                    raise UploadError(404, "Unknown upload")
+                yield f  # closing the file releases the flock
+
+    def _meta(self, upload_id: str) -> dict:
+        try:
+            with open(self._path(upload_id, ".json"), encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            raise UploadError(404, "Unknown upload") from None
+
+    def create(self, filename: str, length: int, client: str = None) -> dict:
+        if length < 0:
+            raise UploadError(400, "Upload length must not be negative")
+        if length > self.max_bytes:
+            raise UploadError(413, f"Upload exceeds {self.max_bytes // (1024 * 1024)} MB")
+
+        self.purge_expired()
+
+        upload_id = uuid.uuid4().hex
+        open(self._path(upload_id, ".part"), "wb").close()
+        meta = {"filename": filename, "length": length, "client": client, "created": time.time()}
+        with open(self._path(upload_id, ".json"), "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+
+        return self.status(upload_id)
+
+    def status(self, upload_id: str) -> dict:
+        meta = self._meta(upload_id)
+        return {
+            "upload_id": upload_id,
+            "filename": meta["filename"],
+            "length": meta["length"],
+            "offset": os.path.getsize(self._path(upload_id, ".part")),
+            "chunk_size": self.chunk_bytes,
+        }
+
+    def append(self, upload_id: str, offset: int, chunk: bytes) -> int:
+        """
+        Writes `chunk` at `offset`, which must be the current offset (a
+        client resuming after a dropped connection asks for it first).
+        Returns the new offset.
+        """
+        if len(chunk) > self.chunk_bytes:
+            raise UploadError(413, f"Chunk exceeds {self.chunk_bytes} bytes")
+
+        with self._locked_part(upload_id) as f:
+            meta = self._meta(upload_id)
+            current = os.fstat(f.fileno()).st_size
+
+            if offset != current:
+                raise UploadError(409, "Upload offset mismatch", offset=current)
+            if current + len(chunk) > meta["length"]:
+                raise UploadError(413, "Chunk runs past the declared upload length", offset=current)
+
+            f.seek(current)
+            f.write(chunk)
+            f.flush()
+            os.utime(self._path(upload_id, ".json"))  # active: keep clear of the TTL purge
+            return current + len(chunk)
+
+    def claim(self, upload_id: str):
+        """
+        Complete upload → (path, filename). The spool file is renamed out of
+        the store, so a second finalize of the same id gets 404; the caller
+        owns (and deletes) the returned file.
+        """
+        with self._locked_part(upload_id) as f:
+            meta = self._meta(upload_id)
+            part = self._path(upload_id, ".part")
+            offset = os.fstat(f.fileno()).st_size
+            if offset != meta["length"]:
+                raise UploadError(409, "Upload is incomplete", offset=offset)
+
+            ext = os.path.splitext(meta["filename"])[1].lower()
+            ready = self._path(upload_id, ".ready" + ext)
+            os.replace(part, ready)
+            os.remove(self._path(upload_id, ".json"))
+
+        self._forget(upload_id)
+        return ready, meta["filename"]
+
+    def delete(self, upload_id: str):
+        with self._locked_part(upload_id):
+            self._meta(upload_id)
+            for suffix in (".part", ".json"):
+                try:
+                    os.remove(self._path(upload_id, suffix))
+                except FileNotFoundError:
+                    pass
+        self._forget(upload_id)
+
+    def _forget(self, upload_id: str):
+        with self._locks_guard:
+            self._locks.pop(upload_id, None)
+
+    def purge_expired(self) -> int:
+        """Deletes spool files (any state) not modified within the TTL."""
+        cutoff = time.time() - self.ttl
+        removed = 0
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            try:
+                if os.path.getmtime(path) < cutoff:
+                    os.remove(path)
+                    removed += 1
+                    self._forget(name.split(".", 1)[0])
+            except OSError:
+                pass
+        return removed
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_upload_store() -> UploadStore:
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = UploadStore()
+        return _store
@@ -0,0 +1,126 @@
+import json
+import os
+import tempfile
+import threading
+import time
+import uuid
+
+from backend.audit.validation.models import json_default, result_from_dict, result_to_dict
+
+
+# ============================================================
+# CONFIGURATION
+# ============================================================
+
+# Validated documents kept for corrections (PATCH /api/validations/{id}).
+# One JSON file per result: any worker on the host can serve a correction.
+VALIDATIONS_DIR = os.environ.get(
+    "AUDIT_VALIDATIONS_DIR", os.path.join(tempfile.gettempdir(), "audit-validations")
+)
+VALIDATION_TTL_SECONDS = float(os.environ.get("AUDIT_VALIDATION_TTL_SECONDS", 3600))
+
+
+# ============================================================
+# STORE
+# {"normalized", "result", "tenant", "rules_version", "filename", "expires"}
+# ============================================================
+
+class ValidationStore:
+
+    def __init__(self, directory: str = VALIDATIONS_DIR, ttl: float = VALIDATION_TTL_SECONDS):
+        self.directory = directory
+        self.ttl = ttl
+        self._locks = {}
+        self._locks_guard = threading.Lock()
+        self._next_purge = 0.0
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, result_id: str):
+        if len(result_id) != 32 or not all(c in "0123456789abcdef" for c in result_id):
+            return None
+        return os.path.join(self.directory, result_id + ".json")
+
+    def lock(self, result_id: str) -> threading.Lock:
+        """Serializes corrections of one result within this worker."""
+        with self._locks_guard:
+            return self._locks.setdefault(result_id, threading.Lock())
+
+    def put(self, normalized: dict, result: dict, profile, filename: str = None,
+            result_id: str = None) -> str:
+        """Stores (or replaces) a validated document; returns its result id (new if not given)."""
+        if time.monotonic() >= self._next_purge:
+            self._next_purge = time.monotonic() + 60
+            self.purge_expired()
+        if result_id is None:
+            result_id = uuid.uuid4().hex
+
+        result = {k: v for k, v in result.items() if k != "normalized"}
+        record = {
+            "normalized": normalized,
+            "result": result_to_dict(result),
+            "tenant": profile.name,
+            "rules_version": profile.rules_version,
+            "filename": filename,
+            "expires": time.time() + self.ttl,
+        }
+
+        path = self._path(result_id)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(record, f, default=json_default)
+        os.replace(tmp, path)  # readers never see a half-written record
+        return result_id
+
+    def get(self, result_id: str):
+        """Record with the result rehydrated (FieldResult objects), or None if unknown/expired."""
+        path = self._path(result_id)
+        if path is None:
+            return None
+        try:
+            with open(path, encoding="utf-8") as f:
+                record = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+
+        if record["expires"] < time.time():
+            self.delete(result_id)
+            return None
+
+        record["result"] = result_from_dict(record["result"])
+        return record
+
+    def delete(self, result_id: str):
+        path = self._path(result_id)
+        if path is not None:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+        with self._locks_guard:
+            self._locks.pop(result_id, None)
+
+    def purge_expired(self) -> int:
+        """Deletes records past their TTL (by file age; records refresh it on every write)."""
+        cutoff = time.time() - self.ttl
+        removed = 0
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            try:
+                if os.path.getmtime(path) < cutoff:
+                    os.remove(path)
+                    removed += 1
+            except OSError:
+                pass
+        return removed
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_validation_store() -> ValidationStore:
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = ValidationStore()
+        return _store
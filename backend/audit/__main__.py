@@ -0,0 +1,99 @@
+"""
+Command-line interface.
+
+    python -m backend.audit validate PATH [PATH ...] -o results.jsonl --jobs 8
+"""
+
+import argparse
+import os
+import sys
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m backend.audit")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    validate = sub.add_parser(
+        "validate",
+        help="Validate files, directories and .zip archives without the web server.",
+    )
+    validate.add_argument("paths", nargs="+", help="Files, directories or .zip archives.")
+    validate.add_argument(
+        "-o", "--output", default="validation_results.jsonl",
+        help="Output file (.jsonl, .csv, .parquet; .arrow or .arrows for per-field rows).",
+    )
+    validate.add_argument(
+        "--format", choices=["jsonl", "csv", "parquet", "fields-parquet", "fields-arrow", "fields-arrow-file"],
+        help="Output format (default: from the output extension). fields-* write "
+             "one row per validated field instead of one per document.",
+    )
+    validate.add_argument(
+        "-j", "--jobs", type=int, default=None,
+        help="Worker processes (default: number of CPUs).",
+    )
+    validate.add_argument(
+        "--resume", action="store_true",
+        help="Skip documents recorded in the checkpoint and append to the output.",
+    )
+    validate.add_argument(
+        "--checkpoint", default=None,
+        help="Checkpoint file (default: <output>.ckpt).",
+    )
+    validate.add_argument(
+        "--manifest", default=None,
+        help="SQLite manifest; unchanged documents are reused instead of re-ingested.",
+    )
+    validate.add_argument(
+        "--tenant", default=None,
+        help="Rule profile from AUDIT_PROFILES_DIR (default: built-in rules).",
+    )
+    validate.add_argument(
+        "--results-db", default=os.environ.get("AUDIT_RESULTS_DB"),
+        help="SQLite results store for reporting queries (default: AUDIT_RESULTS_DB).",
+    )
+    validate.add_argument("-v", "--verbose", action="store_true")
+
+    return parser
+
+
+def cmd_validate(args) -> int:
+    from backend.audit.batch.runner import run_batch
+
+    from backend.audit.validation.profiles import get_profile
+
+    if get_profile(args.tenant) is None:
+        print(f"Unknown rule profile: {args.tenant}", file=sys.stderr)
+        return 2
+
+    summary = run_batch(
+        args.paths,
+        output=args.output,
+        fmt=args.format,
+        jobs=args.jobs,
+        resume=args.resume,
+        checkpoint=args.checkpoint,
+        verbose=args.verbose,
+        manifest=args.manifest,
+        tenant=args.tenant,
+        results_db=args.results_db,
+    )
+
+    total = sum(summary.values())
+    print(f"Validated {total} document(s) -> {args.output}", file=sys.stderr)
+    for status, count in sorted(summary.items()):
+        print(f"  {status}: {count}", file=sys.stderr)
+
+    return 1 if summary.get("ERROR") else 0
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+
+    if args.command == "validate":
+        return cmd_validate(args)
+
+    return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
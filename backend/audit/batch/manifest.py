@@ -0,0 +1,92 @@
+import json
+import sqlite3
+import time
+
+from backend.audit.validation.models import json_default
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    source        TEXT PRIMARY KEY,
+    size          INTEGER NOT NULL,
+    mtime_ns      INTEGER NOT NULL,
+    content_hash  TEXT,
+    rules_version TEXT NOT NULL,
+    result_json   TEXT NOT NULL,
+    validated_at  REAL NOT NULL
+)
+"""
+
+
+class Manifest:
+    """
+    Persistent record of what was validated, keyed by source id.
+
+    A document is reused without re-ingesting when either
+      - size and mtime match and the rules version is unchanged, or
+      - its content hash matches the stored one (touched but not modified).
+    Any change to the rules version invalidates every entry.
+    """
+
+    def __init__(self, path: str, rules_version: str, commit_every: int = 200):
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute(SCHEMA)
+        self.rules_version = rules_version
+        self.commit_every = commit_every
+        self._pending = 0
+
+    def lookup(self, source: str):
+        """Returns the stored row as a dict if it is valid for the current rules."""
+        row = self.conn.execute(
+            "SELECT size, mtime_ns, content_hash, rules_version, result_json "
+            "FROM documents WHERE source = ?",
+            (source,),
+        ).fetchone()
+
+        if row is None or row[3] != self.rules_version:
+            return None
+
+        return {
+            "size": row[0],
+            "mtime_ns": row[1],
+            "content_hash": row[2],
+            "result_json": row[4],
+        }
+
+    @staticmethod
+    def cached_record(entry: dict) -> dict:
+        record = json.loads(entry["result_json"])
+        record["cached"] = True
+        return record
+
+    def record(self, source: str, size: int, mtime_ns: int, content_hash: str, record: dict):
+        self.conn.execute(
+            "INSERT OR REPLACE INTO documents "
+            "(source, size, mtime_ns, content_hash, rules_version, result_json, validated_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                source, size, mtime_ns, content_hash, self.rules_version,
+                json.dumps(record, default=json_default), time.time(),
+            ),
+        )
+        self._maybe_commit()
+
+    def touch(self, source: str, size: int, mtime_ns: int):
+        """Content unchanged: refresh the stat fingerprint so the next scan skips hashing."""
+        self.conn.execute(
+            "UPDATE documents SET size = ?, mtime_ns = ? WHERE source = ?",
+            (size, mtime_ns, source),
+        )
+        self._maybe_commit()
+
+    def _maybe_commit(self):
+        self._pending += 1
+        if self._pending >= self.commit_every:
+            self.conn.commit()
+            self._pending = 0
+
+    def close(self):
+        self.conn.commit()
+        self.conn.close()
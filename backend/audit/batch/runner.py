@@ -0,0 +1,263 @@
+import os
+import sys
+import uuid
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+from backend.audit.pipeline import run_pipeline
+from backend.audit.results_store import ResultsStore
+from backend.audit.validation.validator import STATUS_PASS, STATUS_INSUFFICIENT_DATA
+
+from backend.audit.validation.profiles import resolve_profile
+
+from .manifest import Manifest
+from .sources import iter_sources, materialize, stat_source, hash_source
+from .writers import open_writer, segment_paths
+
+
+# ============================================================
+# SINGLE DOCUMENT (RUNS INSIDE A WORKER PROCESS)
+# ============================================================
+
+def validate_source(
+    source: str,
+    hash_content: bool = False,
+    known_hash: str = None,
+    tenant: str = None,
+) -> dict:
+    """
+    ingest → normalize → validate for one source id.
+    Never raises: failures are reported in the "error" key.
+
+    With hash_content the document's sha256 is returned as "content_hash";
+    if it equals known_hash the document is not ingested at all and
+    {"source", "content_hash", "unchanged": True} is returned instead.
+
+    tenant selects a rule profile (loaded once per worker process).
+    """
+    content_hash = None
+    try:
+        if hash_content:
+            content_hash = hash_source(source)
+            if known_hash and content_hash == known_hash:
+                return {"source": source, "content_hash": content_hash, "unchanged": True}
+
+        with materialize(source) as (file_path, filename):
+            result = run_pipeline(file_path, filename, profile=resolve_profile(tenant))
+
+        if result is None:
+            return {
+                "source": source,
+                "overall_status": STATUS_INSUFFICIENT_DATA,
+                "can_proceed": False,
+                "errors": ["No data extracted from document"],
+                "validation": None,
+                "error": None,
+                "content_hash": content_hash,
+            }
+
+        return {
+            "source": source,
+            "overall_status": result["overall_status"],
+            "can_proceed": result["overall_status"] == STATUS_PASS,
+            "errors": result.get("errors", []),
+            "validation": result,
+            "error": None,
+            "content_hash": content_hash,
+        }
+
+    except Exception as e:
+        return {
+            "source": source,
+            "overall_status": None,
+            "can_proceed": False,
+            "errors": [],
+            "validation": None,
+            "error": f"{type(e).__name__}: {e}",
+            "content_hash": content_hash,
+        }
+
+
+def _init_worker(verbose: bool):
+    # The ingestion / normalization layers print debug dumps per document;
+    # at batch volume that is pure overhead.
+    if not verbose:
+        sys.stdout = open(os.devnull, "w")
+
+
+# ============================================================
+# CHECKPOINT
+# ============================================================
+
+def load_checkpoint(path: str) -> dict:
+    """
+    source id -> output segments it was written to. One "<source>\t<segment>"
+    line per document, appended once the output has flushed it.
+    """
+    entries = {}
+    if not path or not os.path.exists(path):
+        return entries
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.rstrip("\n")
+            if not line.strip():
+                continue
+            source, tab, segment = line.rpartition("\t")
+            if not tab or not segment.isdigit():  # written before output segments
+                source, segment = line, "0"
+            entries.setdefault(source, set()).add(int(segment))
+    return entries
+
+
+# ============================================================
+# BATCH
+# ============================================================
+
+def run_batch(
+    paths,
+    output: str,
+    fmt: str = None,
+    jobs: int = None,
+    resume: bool = False,
+    checkpoint: str = None,
+    verbose: bool = False,
+    manifest: str = None,
+    tenant: str = None,
+    results_db: str = None,
+) -> Counter:
+    """
+    Validates every supported document under `paths` in a process pool and
+    streams results to `output` as they complete.
+
+    Each source id is appended to the checkpoint file once the writer has
+    flushed its result to disk; with resume=True those sources are skipped
+    and output is appended to (Parquet: a new segment file per resumed run,
+    see writers.segment_paths()). Sources whose segment was never closed
+    by a killed run are validated again.
+
+    With a manifest (SQLite path), documents whose fingerprint and rules
+    version are unchanged since the last run are emitted from the manifest
+    instead of being re-ingested (marked "cached": true).
+
+    tenant selects a rule profile; its version is part of the manifest's
+    rules version, so editing the profile invalidates cached results.
+    Raises ValueError for an unknown tenant.
+
+    results_db: SQLite results store (the API's AUDIT_RESULTS_DB) that every
+    emitted record is also written to, for reporting queries. A source keeps
+    one entry per tenant; re-running replaces it.
+
+    Returns a Counter of overall statuses ("ERROR" for crashed documents).
+    """
+    profile = resolve_profile(tenant)
+    jobs = jobs or os.cpu_count() or 1
+    checkpoint = checkpoint or f"{output}.ckpt"
+
+    entries = load_checkpoint(checkpoint) if resume else {}
+    segment = max((max(s) for s in entries.values()), default=-1) + 1
+    writer = open_writer(output, fmt, append=resume, segment=segment)
+    lost = writer.lost_segments({s for segments in entries.values() for s in segments})
+    done = {source for source, segments in entries.items() if segments - lost}
+
+    # Never pick up our own output when it lives inside a scanned directory.
+    own_files = {os.path.abspath(p) for p in (output, checkpoint, manifest, results_db) if p}
+    own_files.update(os.path.abspath(p) for p in segment_paths(output))
+    sources = (
+        s for s in iter_sources(paths)
+        if s not in done and os.path.abspath(s) not in own_files
+    )
+
+    ckpt = open(checkpoint, "a" if resume else "w", encoding="utf-8")
+    store = Manifest(manifest, profile.rules_version) if manifest else None
+    results = ResultsStore(results_db, background=False) if results_db else None
+    summary = Counter()
+    unflushed = []
+
+    def checkpoint_flushed():
+        writer.flush()
+        for source in unflushed:
+            ckpt.write(f"{source}\t{writer.segment}\n")
+        ckpt.flush()
+        unflushed.clear()
+
+    def emit(record):
+        writer.write(record)
+        unflushed.append(record["source"])
+        if len(unflushed) >= writer.batch_size:
+            checkpoint_flushed()
+        summary[record["overall_status"] or "ERROR"] += 1
+
+        if results is not None:
+            results.add(
+                uuid.uuid5(uuid.NAMESPACE_URL, f"{profile.name}:{record['source']}").hex,
+                record["validation"],
+                source=record["source"],
+                tenant=profile.name,
+                rules_version=profile.rules_version,
+                overall_status=record["overall_status"] or "ERROR",
+            )
+
+    # Bounded submission window: keeps every core busy without holding a
+    # future per document for archives with hundreds of thousands of files.
+    max_in_flight = jobs * 4
+
+    try:
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=_init_worker,
+            initargs=(verbose,),
+        ) as pool:
+            pending = {}
+            exhausted = False
+
+            while pending or not exhausted:
+                while not exhausted and len(pending) < max_in_flight:
+                    source = next(sources, None)
+                    if source is None:
+                        exhausted = True
+                        break
+
+                    if store is None:
+                        pending[pool.submit(validate_source, source, False, None, tenant)] = (source, None, None, None)
+                        continue
+
+                    size, mtime_ns = stat_source(source)
+                    entry = store.lookup(source)
+
+                    if entry and entry["size"] == size and entry["mtime_ns"] == mtime_ns:
+                        emit(store.cached_record(entry))
+                        continue
+
+                    known_hash = entry["content_hash"] if entry else None
+                    future = pool.submit(validate_source, source, True, known_hash, tenant)
+                    pending[future] = (source, size, mtime_ns, entry)
+
+                if not pending:
+                    break
+
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    source, size, mtime_ns, entry = pending.pop(future)
+                    record = future.result()
+
+                    if store is not None:
+                        if record.get("unchanged"):
+                            store.touch(source, size, mtime_ns)
+                            record = store.cached_record(entry)
+                        elif record["error"] is None:
+                            store.record(source, size, mtime_ns, record["content_hash"], record)
+
+                    emit(record)
+
+    finally:
+        try:
+            checkpoint_flushed()
+        finally:
+            writer.close()
+            ckpt.close()
+        if store is not None:
+            store.close()
+        if results is not None:
+            results.close()
+
+    return summary
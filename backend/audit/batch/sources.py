@@ -0,0 +1,127 @@
+import functools
+import hashlib
+import os
+import shutil
+import tempfile
+import zipfile
+from contextlib import contextmanager
+
+from backend.audit.ingestion.router import SUPPORTED_EXTENSIONS
+
+
+# Separator between an archive path and a member inside it:
+#   /archive/2023.zip!/client_a/header.pdf
+ZIP_MEMBER_SEP = "!/"
+
+
+def _is_supported(name: str) -> bool:
+    return os.path.splitext(name)[1].lower() in SUPPORTED_EXTENSIONS
+
+
+def iter_zip_members(zip_path: str):
+    with zipfile.ZipFile(zip_path) as zf:
+        for info in zf.infolist():
+            if info.is_dir() or not _is_supported(info.filename):
+                continue
+            yield f"{zip_path}{ZIP_MEMBER_SEP}{info.filename}"
+
+
+def iter_sources(paths):
+    """
+    Expands files, directories (recursively) and .zip archives into a flat,
+    deterministic stream of source ids. Unsupported files are skipped.
+    """
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                for name in sorted(files):
+                    full = os.path.join(root, name)
+                    if name.lower().endswith(".zip"):
+                        yield from iter_zip_members(full)
+                    elif _is_supported(name):
+                        yield full
+
+        elif path.lower().endswith(".zip") and os.path.isfile(path):
+            yield from iter_zip_members(path)
+
+        elif os.path.isfile(path) and _is_supported(path):
+            yield path
+
+        else:
+            print(f"Skipping unsupported or missing path: {path}")
+
+
+def split_source(source: str):
+    """Returns (zip_path, member) for archive members, (path, None) otherwise."""
+    if ZIP_MEMBER_SEP in source:
+        zip_path, member = source.split(ZIP_MEMBER_SEP, 1)
+        return zip_path, member
+    return source, None
+
+
+@contextmanager
+def materialize(source: str):
+    """
+    Yields (file_path, filename) for a source id. Archive members are copied
+    to a temporary file because the PDF backends need a real path.
+    """
+    path, member = split_source(source)
+
+    if member is None:
+        yield path, os.path.basename(path)
+        return
+
+    ext = os.path.splitext(member)[1].lower()
+    fd, tmp_path = tempfile.mkstemp(suffix=ext)
+    try:
+        with zipfile.ZipFile(path) as zf, zf.open(member) as src, os.fdopen(fd, "wb") as dst:
+            shutil.copyfileobj(src, dst)
+        yield tmp_path, os.path.basename(member)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+# ============================================================
+# FINGERPRINTS (USED BY THE INCREMENTAL MANIFEST)
+# ============================================================
+
+@functools.lru_cache(maxsize=64)
+def _zip_index(zip_path: str, zip_mtime_ns: int) -> dict:
+    with zipfile.ZipFile(zip_path) as zf:
+        return {
+            info.filename: (info.file_size, info.CRC)
+            for info in zf.infolist()
+        }
+
+
+def stat_source(source: str):
+    """
+    Cheap change detector: (size, mtime_ns). For archive members the CRC32
+    stored in the central directory stands in for mtime.
+    """
+    path, member = split_source(source)
+    st = os.stat(path)
+
+    if member is None:
+        return st.st_size, st.st_mtime_ns
+
+    return _zip_index(path, st.st_mtime_ns)[member]
+
+
+def hash_source(source: str, chunk_size: int = 1024 * 1024) -> str:
+    """sha256 of the document bytes (archive members are hashed uncompressed)."""
+    path, member = split_source(source)
+    digest = hashlib.sha256()
+
+    if member is None:
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(chunk_size), b""):
+                digest.update(chunk)
+    else:
+        with zipfile.ZipFile(path) as zf, zf.open(member) as f:
+            for chunk in iter(lambda: f.read(chunk_size), b""):
+                digest.update(chunk)
+
+    return digest.hexdigest()
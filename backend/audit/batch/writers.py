@@ -0,0 +1,355 @@
+import csv
+import glob
+import json
+import os
+
+from backend.audit.results_store import field_rows
+from backend.audit.validation.models import json_default
+
+
+# Flat columns used by CSV / Parquet output. JSONL keeps the full record.
+FLAT_COLUMNS = [
+    "source",
+    "overall_status",
+    "can_proceed",
+    "error_count",
+    "errors",
+    "error",
+]
+
+
+def flatten_record(record: dict) -> dict:
+    errors = record.get("errors") or []
+    return {
+        "source": record.get("source"),
+        "overall_status": record.get("overall_status"),
+        "can_proceed": bool(record.get("can_proceed")),
+        "error_count": len(errors),
+        "errors": "; ".join(errors),
+        "error": record.get("error"),
+    }
+
+
+# Per-field columns (fields-parquet / fields-arrow): one row per validated
+# field, the shape analytics jobs load. Every document has at least one row.
+FIELD_COLUMNS = [
+    "document",
+    "page",
+    "row_number",
+    "field",
+    "status",
+    "value",
+    "error",
+]
+
+
+def _text(value):
+    return value if value is None or isinstance(value, str) else str(value)
+
+
+def flatten_fields(record: dict) -> list:
+    fields = field_rows(record.get("validation"))
+    if not fields:
+        # Nothing extracted / crashed: one document-level row keeps it visible
+        errors = record.get("errors") or []
+        error = record.get("error") or "; ".join(errors) or None
+        fields = [(None, None, None, record.get("overall_status") or "ERROR", None, error)]
+
+    return [
+        {
+            "document": record.get("source"),
+            "page": page,
+            "row_number": row_number,
+            "field": field,
+            "status": status,
+            "value": _text(value),
+            "error": _text(error),
+        }
+        for page, row_number, field, status, value, error in fields
+    ]
+
+
+# Documents per Parquet row group. The runner checkpoints a document only
+# once flush() has put it on disk, so this is also the checkpoint interval.
+ROW_GROUP_DOCUMENTS = int(os.environ.get("AUDIT_BATCH_ROW_GROUP", 500))
+
+
+# ============================================================
+# SEGMENTS
+# results.parquet, results.1.parquet, results.2.parquet, ...
+# ============================================================
+
+def segment_path(path: str, segment: int) -> str:
+    if segment == 0:
+        return path
+    stem, ext = os.path.splitext(path)
+    return f"{stem}.{segment}{ext}"
+
+
+def _segments(path: str) -> dict:
+    stem, ext = os.path.splitext(path)
+    found = {0: path} if os.path.exists(path) else {}
+    for candidate in glob.glob(glob.escape(stem) + ".*" + glob.escape(ext)):
+        middle = candidate[len(stem) + 1:len(candidate) - len(ext)]
+        if middle.isdigit():
+            found[int(middle)] = candidate
+    return found
+
+
+def segment_paths(path: str) -> list:
+    """Every file written for `path` by a run and its resumes, in order."""
+    found = _segments(path)
+    return [found[n] for n in sorted(found)]
+
+
+# ============================================================
+# WRITERS
+# write(record) -> flush() -> records are on disk -> checkpoint
+# ============================================================
+
+class JsonlWriter:
+    batch_size = 1
+
+    def __init__(self, path: str, append: bool = False, segment: int = 0):
+        self.f = open(path, "a" if append else "w", encoding="utf-8")
+        self.segment = segment
+
+    def write(self, record: dict):
+        self.f.write(json.dumps(record, default=json_default) + "\n")
+
+    def flush(self):
+        self.f.flush()
+
+    def lost_segments(self, segments) -> set:
+        return set()
+
+    def close(self):
+        self.f.close()
+
+
+class CsvWriter:
+    batch_size = 1
+
+    def __init__(self, path: str, append: bool = False, segment: int = 0):
+        write_header = not (append and os.path.exists(path) and os.path.getsize(path) > 0)
+        self.f = open(path, "a" if append else "w", encoding="utf-8", newline="")
+        self.writer = csv.DictWriter(self.f, fieldnames=FLAT_COLUMNS)
+        if write_header:
+            self.writer.writeheader()
+        self.segment = segment
+
+    def write(self, record: dict):
+        self.writer.writerow(flatten_record(record))
+
+    def flush(self):
+        self.f.flush()
+
+    def lost_segments(self, segments) -> set:
+        return set()
+
+    def close(self):
+        self.f.close()
+
+
+class ArrowSegmentWriter:
+    """
+    Arrow-backed output written one record batch per flush(). These files
+    cannot be appended to, so a resumed run writes the next segment
+    (segment_path()). A segment only becomes readable once it is closed:
+    one left behind by a killed run is reported by lost_segments() and its
+    documents are validated again.
+
+    Subclasses implement build_schema(pa), rows(record), _open(path) and
+    _readable(path).
+    """
+    batch_size = ROW_GROUP_DOCUMENTS
+    label = "Arrow"
+
+    def __init__(self, path: str, append: bool = False, segment: int = 0):
+        # fail before the batch runs, not on the first flush
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise ImportError(f"{self.label} output requires pyarrow.")
+        self.schema = self.build_schema(pa)
+
+        existing = _segments(path)
+        if not append:
+            for stale in existing.values():
+                os.remove(stale)
+            existing = {}
+
+        self.base = path
+        self.segment = max([segment, *(n + 1 for n in existing)])
+        self.path = segment_path(path, self.segment)
+        self.buffer = []
+        self._out = None
+
+    def write(self, record: dict):
+        self.buffer.extend(self.rows(record))
+
+    def flush(self):
+        if not self.buffer:
+            return
+        import pyarrow as pa
+
+        if self._out is None:
+            self._out = self._open(self.path)
+        self._out.write_batch(pa.RecordBatch.from_pylist(self.buffer, schema=self.schema))
+        self.buffer = []
+
+    def lost_segments(self, segments) -> set:
+        """Segments among `segments` that are missing or unreadable; unreadable files are removed."""
+        found = _segments(self.base)
+        lost = set()
+        for segment in segments:
+            path = found.get(segment)
+            if path is not None and self._readable(path):
+                continue
+            lost.add(segment)
+            if path is not None:
+                os.remove(path)
+        return lost
+
+    def close(self):
+        self.flush()
+        if self._out is None and self.segment == 0:
+            self._out = self._open(self.path)  # a run with no documents still leaves a file
+        if self._out is not None:
+            self._out.close()
+            self._out = None
+
+
+class ParquetWriter(ArrowSegmentWriter):
+    """One flat row per document (FLAT_COLUMNS), a row group per flush(). Requires pyarrow."""
+    label = "Parquet"
+
+    def build_schema(self, pa):
+        return pa.schema([
+            ("source", pa.string()),
+            ("overall_status", pa.string()),
+            ("can_proceed", pa.bool_()),
+            ("error_count", pa.int64()),
+            ("errors", pa.string()),
+            ("error", pa.string()),
+        ])
+
+    def rows(self, record: dict) -> list:
+        return [flatten_record(record)]
+
+    def _open(self, path: str):
+        import pyarrow.parquet as pq
+
+        return pq.ParquetWriter(path, self.schema)
+
+    def _readable(self, path: str) -> bool:
+        import pyarrow.parquet as pq
+
+        try:
+            pq.ParquetFile(path)
+            return True
+        except Exception:  # no footer: the run was killed before close()
+            return False
+
+
+def _field_schema(pa):
+    return pa.schema([
+        ("document", pa.string()),
+        ("page", pa.int32()),
+        ("row_number", pa.int64()),
+        ("field", pa.string()),
+        ("status", pa.string()),
+        ("value", pa.string()),
+        ("error", pa.string()),
+    ])
+
+
+class FieldsParquetWriter(ParquetWriter):
+    """One row per validated field (FIELD_COLUMNS), a row group per flush(). Requires pyarrow."""
+
+    def build_schema(self, pa):
+        return _field_schema(pa)
+
+    def rows(self, record: dict) -> list:
+        return flatten_fields(record)
+
+
+class FieldsArrowWriter(ArrowSegmentWriter):
+    """
+    One row per validated field (FIELD_COLUMNS) as an Arrow IPC stream
+    (.arrows), a record batch per flush(). Requires pyarrow.
+    """
+    label = "Arrow IPC"
+
+    def build_schema(self, pa):
+        return _field_schema(pa)
+
+    def rows(self, record: dict) -> list:
+        return flatten_fields(record)
+
+    def _open(self, path: str):
+        import pyarrow as pa
+
+        return pa.ipc.new_stream(path, self.schema)
+
+    def _readable(self, path: str) -> bool:
+        import pyarrow as pa
+
+        try:
+            with pa.ipc.open_stream(path) as reader:
+                for _ in reader:
+                    pass
+            return True
+        except Exception:  # cut off mid-batch by a killed run
+            return False
+
+
+class FieldsArrowFileWriter(FieldsArrowWriter):
+    """
+    Same rows as an Arrow IPC file (.arrow / Feather v2: pa.ipc.open_file,
+    pd.read_feather). Like Parquet, only readable once closed.
+    """
+
+    def _open(self, path: str):
+        import pyarrow as pa
+
+        return pa.ipc.new_file(path, self.schema)
+
+    def _readable(self, path: str) -> bool:
+        import pyarrow as pa
+
+        try:
+            pa.ipc.open_file(path)
+            return True
+        except Exception:  # no footer: the run was killed before close()
+            return False
+
+
+WRITERS = {
+    "jsonl": JsonlWriter,
+    "csv": CsvWriter,
+    "parquet": ParquetWriter,
+    "fields-parquet": FieldsParquetWriter,
+    "fields-arrow": FieldsArrowWriter,
+    "fields-arrow-file": FieldsArrowFileWriter,
+}
+
+
+def detect_format(path: str) -> str:
+    ext = os.path.splitext(path)[1].lower().lstrip(".")
+    if ext in ("jsonl", "ndjson", "json"):
+        return "jsonl"
+    if ext == "arrows":
+        return "fields-arrow"
+    if ext in ("arrow", "feather"):
+        return "fields-arrow-file"
+    if ext in WRITERS:
+        return ext
+    return "jsonl"
+
+
+def open_writer(path: str, fmt: str = None, append: bool = False, segment: int = 0):
+    fmt = fmt or detect_format(path)
+    if fmt not in WRITERS:
+        raise ValueError(f"Unsupported output format: {fmt}. Allowed: {sorted(WRITERS)}")
+    return WRITERS[fmt](path, append=append, segment=segment)
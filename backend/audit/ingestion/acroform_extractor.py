@@ -1,10 +1,124 @@
+import os
 import re
 from pypdf import PdfReader
 
 
-def extract_acroform_data(pdf_path: str) -> dict:
+# ============================================================
+# PAGE-SCOPED ACROFORM READER
+# reader.get_fields() materializes the whole field tree, which
+# for packets with hundreds of pages of attached forms costs far
+# more than the two pages we read. Instead only the widget
+# annotations on the form pages are walked; names and /V are
+# resolved through each widget's own /Parent chain, and /V only
+# for fields whose label we actually use.
+# ============================================================
+
+# 1-based pages holding the header and related-party fields.
+ACROFORM_PAGES = tuple(
+    int(p) for p in os.environ.get("AUDIT_ACROFORM_PAGES", "1,2").split(",") if p.strip()
+)
+
+# Guards against malformed /Parent cycles.
+MAX_FIELD_DEPTH = 32
+
+ROW_PATTERN = re.compile(r"row[_\s]?(\d+)")
+
+
+def _classify(label: str):
+    """
+    ("header", key) | ("row", row_no, key) | None for a lower-cased label.
+    Same matching rules as the full-tree reader used.
+    """
+    row_match = ROW_PATTERN.search(label)
+
+    # ==========================
+    # PAGE 1 — STRICT MATCHING
+    # ==========================
+    if not row_match:
+        if "company name" in label:
+            return "header", "company_name"
+        if "year end" in label or "year period" in label:
+            return "header", "year_period_end"
+        if "completed by" in label:
+            return "header", "completed_by"
+        if label.startswith("date"):
+            return "header", "date"
+        return None
+
+    # ==========================
+    # PAGE 2 — ROWS
+    # ==========================
+    row_no = int(row_match.group(1))
+    if "business" in label:
+        return "row", row_no, "business_name"
+    if "criteria" in label or "designates" in label:
+        return "row", row_no, "criteria_code"
+    if "transaction" in label:
+        return "row", row_no, "transaction_type"
+    return "row", row_no, None
+
+
+def _field_chain(widget):
+    """[terminal field, parent, ...]; a widget without /T belongs to its parent."""
+    node = widget if "/T" in widget else widget.get("/Parent")
+    chain = []
+    while node is not None and len(chain) < MAX_FIELD_DEPTH:
+        node = node.get_object()
+        chain.append(node)
+        node = node.get("/Parent")
+    return chain
+
+
+def _inherited(chain, key):
+    for node in chain:
+        if key in node:
+            return node[key]
+    return None
+
+
+def iter_page_fields(reader: PdfReader, pages=ACROFORM_PAGES):
+    """
+    Yields (qualified name, label, chain) once per field that has a widget
+    on `pages`. Nothing outside those pages' /Annots is touched.
+    """
+    seen = set()
+    for page_num in pages:
+        if page_num < 1 or page_num > len(reader.pages):
+            continue
+
+        annots = reader.pages[page_num - 1].get("/Annots")
+        if annots is None:
+            continue
+
+        for annot in annots.get_object():
+            widget = annot.get_object()
+            if widget.get("/Subtype") != "/Widget":
+                continue
+
+            chain = _field_chain(widget)
+            if not chain:
+                continue
+
+            field = chain[0]
+            key = field.indirect_reference or id(field)
+            if key in seen:
+                continue
+            seen.add(key)
+
+            name = ".".join(str(n["/T"]) for n in reversed(chain) if "/T" in n)
+            label = field.get("/TU") or field.get("/T") or name or ""
+            yield name, str(label).lower(), chain
+
+
+def _iter_all_fields(reader: PdfReader):
+    """Fallback: full field tree (forms whose widgets are not on `pages`)."""
+    for field_name, field in (reader.get_fields() or {}).items():
+        label = field.get("/TU") or field.get("/T") or field_name or ""
+        yield field_name, str(label).lower(), [field]
+
+
+def extract_acroform_data(pdf_path: str, pages=ACROFORM_PAGES) -> dict:
     reader = PdfReader(pdf_path)
-    fields = reader.get_fields() or {}
 
     header = {
         "company_name": None,
@@ -15,51 +129,34 @@ def extract_acroform_data(pdf_path: str) -> dict:
 
     rows = {}
 
-    for field_name, field in fields.items():
+    fields = list(iter_page_fields(reader, pages))
+    if not fields and "/AcroForm" in reader.trailer["/Root"]:
+        print(f"No form widgets on pages {list(pages)}; reading the full field tree")
+        fields = _iter_all_fields(reader)
 
-        label = (
-            field.get("/TU")
-            or field.get("/T")
-            or field_name
-            or ""
-        ).lower()
+    for field_name, label, chain in fields:
+        target = _classify(label)
+        if target is None:
+            continue
+        if target[0] == "header" and header[target[1]]:
+            continue
+        if target[0] == "row" and target[2] is None:
+            continue
 
-        value = field.get("/V")
+        # /V resolved only now, for fields we actually use
+        value = _inherited(chain, "/V")
+        if value is not None:
+            value = value.get_object()
         if not value:
             continue
 
         value = str(value).strip()
 
-        is_row_field = bool(re.search(r"row[_\s]?(\d+)", label))
-
-        # ==========================
-        # PAGE 1 — STRICT MATCHING
-        # ==========================
-        if not is_row_field:
-            if "company name" in label and not header["company_name"]:
-                header["company_name"] = value
-                continue
-
-            if ("year end" in label or "year period" in label) and not header["year_period_end"]:
-                header["year_period_end"] = value
-                continue
-
-            if "completed by" in label and not header["completed_by"]:
-                header["completed_by"] = value
-                continue
-
-            if label.startswith("date") and not header["date"]:
-                header["date"] = value
-                continue
-
-        # ==========================
-        # PAGE 2 — ROWS
-        # ==========================
-        row_match = re.search(r"row[_\s]?(\d+)", label)
-        if not row_match:
+        if target[0] == "header":
+            header[target[1]] = value
             continue
 
-        row_no = int(row_match.group(1))
+        _, row_no, key = target
 
         if row_no not in rows:
             rows[row_no] = {
@@ -68,12 +165,7 @@ def extract_acroform_data(pdf_path: str) -> dict:
                 "transaction_type": None,
             }
 
-        if "business" in label:
-            rows[row_no]["business_name"] = value
-        elif "criteria" in label or "designates" in label:
-            rows[row_no]["criteria_code"] = value
-        elif "transaction" in label:
-            rows[row_no]["transaction_type"] = value
+        rows[row_no][key] = value
 
     return {
         "page_1": header,
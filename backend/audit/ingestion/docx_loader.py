@@ -1,18 +1,59 @@
 from docx import Document
+from docx.table import Table
 import io
 
-def ingest_docx(file_bytes: bytes) -> dict:
+from .field_extractor import extract_headers_from_lines
+
+
+def _row_line(row) -> str:
+    # Merged cells repeat; "Company Name | Acme" reads as "Company Name Acme"
+    texts = []
+    for cell in row.cells:
+        text = cell.text.strip()
+        if text and (not texts or texts[-1] != text):
+            texts.append(text)
+    return " ".join(texts)
+
+
+def _iter_lines(doc):
+    """
+    Body lines in document order, lazily: non-empty paragraph lines and one
+    line per table row (header blocks are often laid out as tables).
+    """
+    if hasattr(doc, "iter_inner_content"):
+        blocks = doc.iter_inner_content()
+    else:
+        blocks = list(doc.paragraphs) + list(doc.tables)
+
+    for block in blocks:
+        if isinstance(block, Table):
+            for row in block.rows:
+                line = _row_line(row)
+                if line:
+                    yield line
+        elif block.text.strip():
+            yield from block.text.splitlines()
+
+
+def ingest_docx(file_bytes: bytes, pages=None) -> dict:
     """
     Ingests DOCX file.
-    Page 1 Text: All paragraphs concatenated.
+    Page 1: Header fields, streamed paragraph by paragraph (and table row
+            by row) through the header extractor until all are found.
     Page 2 Rows: Content of the FIRST table found.
+    pages: optional {1} / {2} to skip the other page's work (key omitted).
     """
     doc = Document(io.BytesIO(file_bytes))
-    
-    # 1. Extract Text (Page 1)
-    # We treat the body text as "Page 1" for header parsing
-    full_text = "\n".join([p.text for p in doc.paragraphs if p.text.strip()])
-    
+    result = {}
+
+    # 1. Extract Header (Page 1)
+    # We treat the body as "Page 1" for header parsing
+    if pages is None or 1 in pages:
+        result["page_1"] = extract_headers_from_lines(_iter_lines(doc))
+
+    if pages is not None and 2 not in pages:
+        return result
+
     # 2. Extract Table (Page 2)
     # detecting the first table for Related Party logic
     rows_data = []
@@ -38,7 +79,5 @@ def ingest_docx(file_bytes: bytes) -> dict:
                 "transaction_type": cell_texts[2]
             })
 
-    return {
-        "page_1": {"text": full_text},
-        "page_2": {"rows": rows_data}
-    }
+    result["page_2"] = {"rows": rows_data}
+    return result
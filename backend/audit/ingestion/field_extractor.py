@@ -27,115 +27,187 @@ def _is_valid_value(field: str, value: str) -> bool:
 
 # ============================================================
 # PAGE 1 – HEADER EXTRACTION (EXTRACTION ONLY, NO VALIDATION)
+# Regexes are compiled once at import. HeaderExtractor consumes
+# one line at a time (with one line of lookahead for values on
+# the following line) and reports when every field is found, so
+# loaders can stream paragraphs/cells and stop early.
 # ============================================================
 
-def extract_headers(
-    all_pages_text: Dict[Any, str]
-) -> Tuple[Dict[str, Any], Dict[str, Any]]:
-
-    field_definitions = {
-        "company_name": [r"Company\s*Name"],
-        "year_period_end": [
-            r"Year\s*/\s*Period\s*End",
-            r"Year\s*End",
-            r"Period\s*End"
-        ],
-        "completed_by": [
-            r"Completed\s*By",
-            r"Prepared\s*By"
-        ],
-        "date": [
-            r"Dated",
-            r"Date"
-        ]
-    }
-
+HEADER_FIELD_DEFINITIONS = {
+    "company_name": [r"Company\s*Name"],
+    "year_period_end": [
+        r"Year\s*/\s*Period\s*End",
+        r"Year\s*End",
+        r"Period\s*End"
+    ],
+    "completed_by": [
+        r"Completed\s*By",
+        r"Prepared\s*By"
+    ],
+    "date": [
+        r"Dated",
+        r"Date"
+    ]
+}
+
+
+def _compile_field_regexes(definitions: dict) -> dict:
     field_regexes = {}
-    for field, aliases in field_definitions.items():
+    for field, aliases in definitions.items():
+        # Aliases are already regex fragments (e.g. r"Company\s*Name");
+        # escaping them again would make them match literally.
         aliases = sorted(aliases, key=len, reverse=True)
-        escaped = [re.escape(a).replace(r"\ ", r"\s*") for a in aliases]
         pattern = (
             r"(?i)(?:"
-            + "|".join(escaped)
+            + "|".join(aliases)
             + r")\s*[:\n]?\s*(?P<value>.*)"
         )
         field_regexes[field] = re.compile(pattern)
+    return field_regexes
 
-    DATE_PATTERN = re.compile(
-        r"\b(\d{1,2}[/-]\d{1,2}[/-]\d{2,4}|\w+\s+\d{1,2},\s*\d{4})\b"
-    )
 
-    try:
-        page_keys = sorted(
-            all_pages_text.keys(),
-            key=lambda x: int(x) if str(x).isdigit() else str(x)
-        )
-    except Exception:
-        page_keys = sorted(all_pages_text.keys(), key=str)
+HEADER_FIELD_REGEXES = _compile_field_regexes(HEADER_FIELD_DEFINITIONS)
 
-    extracted_data = {
-        "company_name": None,
-        "year_period_end": None,
-        "completed_by": None,
-        "date": None
-    }
+DATE_PATTERN = re.compile(
+    r"\b(\d{1,2}[/-]\d{1,2}[/-]\d{2,4}|\w+\s+\d{1,2},\s*\d{4})\b"
+)
+_HAS_DIGIT = re.compile(r"\d")
+_WHITESPACE = re.compile(r"\s+")
 
-    debug_log = []
 
-    for page_key in page_keys:
-        text = all_pages_text.get(page_key, "")
-        if not text:
-            continue
+class HeaderExtractor:
+    """
+    Streaming header extractor:
+
+        extractor = HeaderExtractor()
+        for line in lines:
+            if extractor.feed(line):   # True once every field is found
+                break
+        headers = extractor.finish()
 
-        lines = text.splitlines()
+    A line is evaluated when the next one arrives (a label with an empty
+    value takes the following line). close_block() ends a page/section so
+    values never come from the next page.
+    """
 
-        for idx, line in enumerate(lines):
-            if not line.strip():
+    def __init__(self, field_regexes: dict = None):
+        self.field_regexes = field_regexes or HEADER_FIELD_REGEXES
+        self.data = {field: None for field in self.field_regexes}
+        self.debug_log = []
+        self.block = None
+        self._pending = None
+        self._missing = len(self.data)
+
+    @property
+    def done(self) -> bool:
+        return self._missing == 0
+
+    def feed(self, line: str, block=None) -> bool:
+        if block != self.block:
+            self.close_block()
+            self.block = block
+        if self._pending is not None:
+            self._evaluate(self._pending, line)
+        self._pending = line
+        return self.done
+
+    def close_block(self):
+        if self._pending is not None:
+            self._evaluate(self._pending, None)
+            self._pending = None
+
+    def finish(self) -> dict:
+        self.close_block()
+        return self.data
+
+    def _evaluate(self, line: str, next_line):
+        if self.done or not line.strip():
+            return
+
+        for field, regex in self.field_regexes.items():
+
+            # Do not overwrite once found
+            if self.data[field] is not None:
                 continue
 
-            for field, regex in field_regexes.items():
+            for match in regex.finditer(line):
+                raw_val = match.group("value").strip()
 
-                # Do not overwrite once found
-                if extracted_data[field] is not None:
-                    continue
+                # Try next line if value missing
+                if not raw_val and next_line is not None:
+                    raw_val = next_line.strip()
 
-                for match in regex.finditer(line):
-                    raw_val = match.group("value").strip()
+                raw_val = raw_val.replace("\u00A0", " ")
+                raw_val = _WHITESPACE.sub(" ", raw_val)
 
-                    # Try next line if value missing
-                    if not raw_val and idx + 1 < len(lines):
-                        raw_val = lines[idx + 1].strip()
+                if not raw_val:
+                    continue
 
-                    raw_val = raw_val.replace("\u00A0", " ")
-                    raw_val = re.sub(r"\s+", " ", raw_val)
+                clean_val = raw_val.lstrip("/: ").rstrip(".,;")
+                if not clean_val:
+                    continue
 
-                    if not raw_val:
-                        continue
+                # Assist date/year extraction (NOT validation)
+                if field in ("year_period_end", "date") and not _HAS_DIGIT.search(clean_val):
+                    continue
 
-                    clean_val = raw_val.lstrip("/: ").rstrip(".,;")
-                    if not clean_val:
+                if field == "date":
+                    date_match = DATE_PATTERN.search(clean_val)
+                    if not date_match:
                         continue
+                    clean_val = date_match.group(1)
+
+                # ✅ FINAL FIX: NO VALIDATION HERE
+                self.data[field] = clean_val
+                self._missing -= 1
+                self.debug_log.append(
+                    f"[LOCKED] Page {self.block} [{field}] = {clean_val}"
+                )
+                break
 
-                    # Assist date/year extraction (NOT validation)
-                    if field in ("year_period_end", "date") and not re.search(r"\d", clean_val):
-                        continue
 
-                    if field == "date":
-                        date_match = DATE_PATTERN.search(clean_val)
-                        if not date_match:
-                            continue
-                        clean_val = date_match.group(1)
+def extract_headers_from_lines(lines, block=None) -> Dict[str, Any]:
+    """
+    Streams `lines` (any iterable, consumed lazily) through the extractor
+    and stops pulling as soon as every header field is found.
+    """
+    extractor = HeaderExtractor()
+    for line in lines:
+        if extractor.feed(line, block):
+            break
+    return extractor.finish()
+
+
+def extract_headers(
+    all_pages_text: Dict[Any, str]
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+
+    try:
+        page_keys = sorted(
+            all_pages_text.keys(),
+            key=lambda x: int(x) if str(x).isdigit() else str(x)
+        )
+    except Exception:
+        page_keys = sorted(all_pages_text.keys(), key=str)
+
+    extractor = HeaderExtractor()
+
+    for page_key in page_keys:
+        text = all_pages_text.get(page_key, "")
+        if not text:
+            continue
+
+        for line in text.splitlines():
+            if extractor.feed(line, block=page_key):
+                break
+        if extractor.done:
+            break
 
-                    # ✅ FINAL FIX: NO VALIDATION HERE
-                    extracted_data[field] = clean_val
-                    debug_log.append(
-                        f"[LOCKED] Page {page_key} [{field}] = {clean_val}"
-                    )
-                    break
+    extracted_data = extractor.finish()
 
     metadata = {
         "scanned_pages": len(page_keys),
-        "debug_log": debug_log
+        "debug_log": extractor.debug_log
     }
 
     return extracted_data, metadata
@@ -0,0 +1,171 @@
+import hashlib
+import os
+import shutil
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import pytesseract
+except ImportError:
+    pytesseract = None
+
+
+# ============================================================
+# CONFIGURATION
+# ============================================================
+
+# Hard cap on OCR processes for the whole worker; scanned uploads queue
+# behind each other instead of starving interactive requests of CPU.
+OCR_MAX_WORKERS = int(os.environ.get("AUDIT_OCR_WORKERS", 2))
+OCR_DPI = int(os.environ.get("AUDIT_OCR_DPI", 300))
+OCR_PAGE_TIMEOUT = float(os.environ.get("AUDIT_OCR_PAGE_TIMEOUT", 60))
+OCR_CACHE_SIZE = int(os.environ.get("AUDIT_OCR_CACHE_SIZE", 256))
+OCR_LANG = os.environ.get("AUDIT_OCR_LANG", "eng")
+
+# Only the header (1) and related-party (2) pages are ever OCR'd.
+OCR_PAGES = (1, 2)
+
+_pool = None
+_pool_lock = threading.Lock()
+
+# Set in sandbox workers: they are daemonic and may not start the OCR pool,
+# so the planner hands their rendered pages back to the parent instead.
+_deferred = False
+
+# page hash -> text
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def ocr_available() -> bool:
+    if pytesseract is None:
+        return False
+    cmd = getattr(pytesseract.pytesseract, "tesseract_cmd", "tesseract")
+    return shutil.which(cmd) is not None or os.path.exists(cmd)
+
+
+def defer_to_parent(deferred: bool = True):
+    global _deferred
+    _deferred = deferred
+
+
+def deferred() -> bool:
+    return _deferred
+
+
+def _get_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=OCR_MAX_WORKERS)
+        return _pool
+
+
+# ============================================================
+# RASTERIZE (CALLER PROCESS)
+# ============================================================
+
+def rasterize_pages(pdf_path: str, pages=OCR_PAGES, dpi: int = OCR_DPI) -> dict:
+    """
+    Renders the requested 1-based pages to 8-bit grayscale bitmaps.
+    Returns {page_num: (mode, size, raw_bytes)}.
+    """
+    import pypdfium2 as pdfium
+
+    bitmaps = {}
+    pdf = pdfium.PdfDocument(pdf_path)
+    try:
+        for page_num in pages:
+            if page_num > len(pdf):
+                continue
+            image = pdf[page_num - 1].render(scale=dpi / 72, grayscale=True).to_pil()
+            image = image.convert("L")
+            bitmaps[page_num] = (image.mode, image.size, image.tobytes())
+    finally:
+        pdf.close()
+    return bitmaps
+
+
+def page_hash(bitmap) -> str:
+    mode, size, data = bitmap
+    digest = hashlib.sha256(data)
+    digest.update(f"{mode}:{size[0]}x{size[1]}".encode())
+    return digest.hexdigest()
+
+
+# ============================================================
+# OCR (POOL PROCESS)
+# ============================================================
+
+def _ocr_bitmap(bitmap, lang: str) -> str:
+    from PIL import Image
+
+    mode, size, data = bitmap
+    image = Image.frombytes(mode, size, data)
+    return pytesseract.image_to_string(image, lang=lang)
+
+
+# ============================================================
+# ENTRY POINT
+# ============================================================
+
+def _cache_get(key):
+    with _cache_lock:
+        text = _cache.get(key)
+        if text is not None:
+            _cache.move_to_end(key)
+        return text
+
+
+def _cache_put(key, text):
+    with _cache_lock:
+        _cache[key] = text
+        _cache.move_to_end(key)
+        while len(_cache) > OCR_CACHE_SIZE:
+            _cache.popitem(last=False)
+
+
+def extract_ocr_text(pdf_path: str, pages=OCR_PAGES) -> dict:
+    """
+    Tier-3 for scanned PDFs: rasterizes only `pages` and OCRs them in the
+    shared process pool (see ocr_bitmaps()).
+
+    Returns {page_num: text}; empty dict when OCR is unavailable.
+    """
+    if not ocr_available():
+        return {}
+    return ocr_bitmaps(rasterize_pages(pdf_path, pages))
+
+
+def ocr_bitmaps(bitmaps: dict) -> dict:
+    """
+    OCRs rendered pages ({page_num: bitmap}) in the shared process pool, one
+    page per task with OCR_PAGE_TIMEOUT each. Results are cached by a hash
+    of the rendered page, so re-uploads and repeated cover pages are free.
+    """
+    texts = {}
+    missing = {}
+    for page_num, bitmap in bitmaps.items():
+        key = page_hash(bitmap)
+        cached = _cache_get(key)
+        if cached is not None:
+            texts[page_num] = cached
+        else:
+            missing[page_num] = (key, bitmap)
+
+    futures = {
+        page_num: _get_pool().submit(_ocr_bitmap, bitmap, OCR_LANG)
+        for page_num, (_, bitmap) in missing.items()
+    }
+
+    for page_num, (key, bitmap) in missing.items():
+        try:
+            text = futures[page_num].result(timeout=OCR_PAGE_TIMEOUT)
+        except Exception as e:
+            print(f"OCR failed on page {page_num}: {e}")
+            continue
+        _cache_put(key, text)
+        texts[page_num] = text
+
+    return texts
@@ -0,0 +1,93 @@
+import os
+import re
+
+
+# ============================================================
+# PAGE INDEX
+# A cheap keyword scan of the PDF text layer (pypdf, no layout
+# analysis) that tells the expensive pdfplumber pass which pages
+# actually hold the header block and the related-party table.
+# Handles cover pages and tables of contents in front of the form.
+# ============================================================
+
+# Pages scanned for keywords. Header/table pages sit near the front.
+PAGE_INDEX_MAX_PAGES = int(os.environ.get("AUDIT_PAGE_INDEX_MAX_PAGES", 50))
+
+HEADER_KEYWORDS = {
+    "company_name": re.compile(r"company\s*name", re.IGNORECASE),
+    "year_end": re.compile(r"(?:year|period)\s*(?:/\s*period\s*)?end", re.IGNORECASE),
+    "completed_by": re.compile(r"(?:completed|prepared)\s*by", re.IGNORECASE),
+}
+
+RELATED_PARTY_KEYWORDS = {
+    "related_party": re.compile(r"related\s*part(?:y|ies)", re.IGNORECASE),
+    "business_person": re.compile(r"business\s*/?\s*person", re.IGNORECASE),
+    "criteria": re.compile(r"criteria|designates", re.IGNORECASE),
+    "transaction": re.compile(r"(?:type|nature)\s*of\s*transaction", re.IGNORECASE),
+}
+
+
+def _score(text: str, keywords: dict) -> int:
+    return sum(1 for regex in keywords.values() if regex.search(text))
+
+
+def _flagged(scores: dict) -> list:
+    """
+    Pages with the strongest evidence. A table of contents usually mentions
+    a keyword once, the real page several; prefer pages with >= 2 hits.
+    """
+    strong = [p for p, s in scores.items() if s >= 2]
+    if strong:
+        return sorted(strong)
+    return sorted(p for p, s in scores.items() if s >= 1)
+
+
+def build_page_index(pdf_path: str, max_pages: int = PAGE_INDEX_MAX_PAGES) -> dict:
+    """
+    Returns:
+      {
+        "header_pages": [page_num, ...],     # 1-based, ascending
+        "table_page": page_num | None,       # best related-party page
+        "text_pages": {page_num, ...},       # pages with any text layer
+        "page_count": int
+      }
+    """
+    from pypdf import PdfReader
+
+    index = {
+        "header_pages": [],
+        "table_page": None,
+        "text_pages": set(),
+        "page_count": 0,
+    }
+
+    try:
+        reader = PdfReader(pdf_path)
+        index["page_count"] = len(reader.pages)
+
+        header_scores = {}
+        table_scores = {}
+
+        for i, page in enumerate(reader.pages):
+            if i >= max_pages:
+                break
+            page_num = i + 1
+
+            text = page.extract_text() or ""
+            if not text.strip():
+                continue
+            index["text_pages"].add(page_num)
+
+            header_scores[page_num] = _score(text, HEADER_KEYWORDS)
+            table_scores[page_num] = _score(text, RELATED_PARTY_KEYWORDS)
+
+        index["header_pages"] = _flagged(header_scores)
+
+        best = max(table_scores.values(), default=0)
+        if best:
+            index["table_page"] = min(p for p, s in table_scores.items() if s == best)
+
+    except Exception as e:
+        print(f"Page index failed: {e}")
+
+    return index
@@ -0,0 +1,270 @@
+from .acroform_extractor import extract_acroform_data
+
+
+# ============================================================
+# PDF EXTRACTION PLANNER
+# Tiers run cheapest/most reliable first and only for what is
+# still missing:
+#   1. AcroForm   – form field values (both pages, one pass)
+#   2. Text layer – only pages the keyword page index flags for
+#                   the fields that are still missing
+#   3. OCR        – only header/table pages without a text layer
+# Per-field results are merged first-wins (tiers are ordered by
+# confidence) with provenance; the plan stops as soon as every
+# required field has a value.
+# ============================================================
+
+TIER_ACROFORM = "acroform"
+TIER_TEXT = "text"
+TIER_OCR = "ocr"
+
+TIER_CONFIDENCE = {
+    TIER_ACROFORM: 0.95,
+    TIER_TEXT: 0.8,
+    TIER_OCR: 0.6,
+}
+
+REQUIRED_HEADER_FIELDS = ("company_name", "year_period_end", "completed_by", "date")
+
+
+class ExtractionPlan:
+    """Accumulates merged page data and provenance for one PDF."""
+
+    def __init__(self, pages=None):
+        self.want_page_1 = pages is None or 1 in pages
+        self.want_page_2 = pages is None or 2 in pages
+        self.page_1 = {}
+        self.page_2_rows = None
+        self.provenance = {}
+        self.ocr_pending = None  # rendered pages for the parent to OCR (sandbox)
+
+    @classmethod
+    def from_result(cls, result: dict):
+        plan = cls(pages=set())
+        plan.want_page_1 = "page_1" in result
+        plan.want_page_2 = "page_2" in result
+        plan.page_1 = dict(result.get("page_1") or {})
+        plan.page_2_rows = (result.get("page_2") or {}).get("rows") or None
+        plan.provenance = dict(result.get("provenance") or {})
+        return plan
+
+    # -------- state --------
+
+    def missing_header_fields(self):
+        if not self.want_page_1:
+            return []
+        return [f for f in REQUIRED_HEADER_FIELDS if not self.page_1.get(f)]
+
+    def needs_rows(self) -> bool:
+        return self.want_page_2 and not self.page_2_rows
+
+    def needed_pages(self) -> set:
+        pages = set()
+        if self.missing_header_fields():
+            pages.add(1)
+        if self.needs_rows():
+            pages.add(2)
+        return pages
+
+    def complete(self) -> bool:
+        return not self.needed_pages()
+
+    # -------- merge --------
+
+    def merge_header(self, fields: dict, tier: str):
+        for field in self.missing_header_fields():
+            value = fields.get(field)
+            if value:
+                self.page_1[field] = value
+                self.provenance[field] = {
+                    "source": tier,
+                    "confidence": TIER_CONFIDENCE[tier],
+                }
+
+    def merge_rows(self, rows: list, tier: str):
+        # Rows are taken as a block from a single tier, never mixed.
+        if rows and self.needs_rows():
+            self.page_2_rows = rows
+            self.provenance["page_2_rows"] = {
+                "source": tier,
+                "confidence": TIER_CONFIDENCE[tier],
+            }
+
+    def result(self) -> dict:
+        result = {}
+        if self.want_page_1 or self.page_1:
+            result["page_1"] = self.page_1
+        if self.want_page_2 or self.page_2_rows:
+            result["page_2"] = {"rows": self.page_2_rows or []}
+        result["provenance"] = self.provenance
+        if self.ocr_pending:
+            result["ocr_pending"] = self.ocr_pending
+        return result
+
+
+def _flatten(d: dict) -> dict:
+    return {k: v for k, v in d.items() if v}
+
+
+# ============================================================
+# TIERS
+# ============================================================
+
+def _run_acroform(file_path: str, plan: ExtractionPlan):
+    acro = extract_acroform_data(file_path)
+
+    print("\n================ ACROFORM DEBUG ================")
+    print("PAGE 1:", acro.get("page_1"))
+    print("PAGE 2 ROWS:", acro.get("page_2", {}).get("rows"))
+    print("================================================\n")
+
+    plan.merge_header(_flatten(acro.get("page_1", {})), TIER_ACROFORM)
+
+    # AcroForm covers both pages in one pass, so its rows are kept even
+    # when the caller only asked for Page 1.
+    rows = [r for r in map(_flatten, acro.get("page_2", {}).get("rows", [])) if r]
+    if rows:
+        plan.want_page_2 = True
+        plan.merge_rows(rows, TIER_ACROFORM)
+
+
+def _rows_from_table(raw_table) -> list:
+    from .field_extractor import extract_page_2_rows
+
+    rows = []
+    for r in extract_page_2_rows(raw_table):
+        flat_row = {}
+        if r.get("business_person_name"):
+            flat_row["business_name"] = r["business_person_name"]
+        if r.get("criteria_code"):
+            flat_row["criteria_code"] = r["criteria_code"]
+        if r.get("transaction_type"):
+            flat_row["transaction_type"] = r["transaction_type"]
+        if flat_row:
+            rows.append(flat_row)
+    return rows
+
+
+def _rows_from_text(text: str) -> list:
+    # Label/value related-party block in plain page text (text layer or OCR)
+    from .field_extractor import extract_page_2_data
+
+    if not text or not text.strip():
+        return []
+    row, _ = extract_page_2_data({"page_2": {"text": text}})
+    row = _flatten(row)
+    # a stray "1.a" alone is not a related-party row
+    return [row] if row.get("business_name") else []
+
+
+def _merge_text(pages_text: dict, plan: ExtractionPlan, tier: str):
+    from .field_extractor import extract_headers
+
+    texts = {p: t for p, t in pages_text.items() if t and t.strip()}
+    if texts and plan.missing_header_fields():
+        plan.page_1.setdefault("raw_text", texts[min(texts)])
+        headers, _ = extract_headers(texts)
+        plan.merge_header(headers, tier)
+
+
+def _run_text(file_path: str, plan: ExtractionPlan) -> dict:
+    """
+    Builds the cheap keyword page index first, then runs the full
+    pdfplumber text/table extraction only on the pages it flags
+    (falling back to page 1 for the header and page 2 for the table).
+    """
+    from .page_index import build_page_index
+    from .text_extractor import extract_pdf_data
+
+    index = build_page_index(file_path)
+
+    header_pages = []
+    table_page = None
+    text_pages = set()
+
+    if plan.missing_header_fields():
+        header_pages = index["header_pages"] or [1]
+        text_pages.update(header_pages)
+
+    if plan.needs_rows():
+        table_page = index["table_page"] or 2
+        text_pages.add(table_page)
+
+    pages_text, pages_tables = extract_pdf_data(
+        file_path, pages=text_pages, table_page=table_page
+    )
+
+    _merge_text({p: pages_text.get(p, "") for p in header_pages}, plan, TIER_TEXT)
+    if table_page in pages_tables:
+        plan.merge_rows(_rows_from_table(pages_tables[table_page]), TIER_TEXT)
+    if table_page is not None:
+        plan.merge_rows(_rows_from_text(pages_text.get(table_page, "")), TIER_TEXT)
+
+    return index
+
+
+def _run_ocr(file_path: str, plan: ExtractionPlan, index: dict):
+    # Only header/table pages (1–2) that are still needed AND have no text
+    # layer; OCR of a page with text would just re-read the same words.
+    ocr_pages = [
+        p for p in sorted(plan.needed_pages())
+        if p not in index["text_pages"]
+    ]
+    if not ocr_pages:
+        return
+
+    from . import ocr_extractor
+
+    if ocr_extractor.deferred():
+        # Sandbox worker: render here (untrusted PDF), OCR in the parent
+        if ocr_extractor.ocr_available():
+            plan.ocr_pending = ocr_extractor.rasterize_pages(file_path, ocr_pages)
+        return
+
+    _merge_ocr(ocr_extractor.extract_ocr_text(file_path, ocr_pages), plan)
+
+
+def _merge_ocr(pages_text: dict, plan: ExtractionPlan):
+    _merge_text(pages_text, plan, TIER_OCR)
+    if 2 in pages_text:
+        plan.merge_rows(_rows_from_text(pages_text[2]), TIER_OCR)
+
+
+# ============================================================
+# ENTRY POINT
+# ============================================================
+
+def extract_pdf(file_path: str, pages=None) -> dict:
+    """
+    Runs the tier plan for one PDF. Returns the router output contract plus
+    "provenance": {field | "page_2_rows": {"source", "confidence"}}.
+    """
+    plan = ExtractionPlan(pages)
+
+    _run_acroform(file_path, plan)
+    if plan.complete():
+        return plan.result()
+
+    index = _run_text(file_path, plan)
+    if plan.complete():
+        return plan.result()
+
+    _run_ocr(file_path, plan, index)
+    return plan.result()
+
+
+def finish_ocr(result: dict) -> dict:
+    """
+    Completes a result whose OCR tier was deferred by a sandbox worker
+    ("ocr_pending" pages): OCRs them through this process's capped pool and
+    merges the text. Any other result is returned unchanged.
+    """
+    bitmaps = result.pop("ocr_pending", None)
+    if not bitmaps:
+        return result
+
+    from .ocr_extractor import ocr_bitmaps
+
+    plan = ExtractionPlan.from_result(result)
+    _merge_ocr(ocr_bitmaps(bitmaps), plan)
+    return plan.result()
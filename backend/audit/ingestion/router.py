@@ -1,16 +1,49 @@
 import os
 
-from .docx_loader import ingest_docx
-from .spreadsheet_loader import ingest_spreadsheet
-from .text_extractor import extract_pdf_data
-from .field_extractor import extract_page_2_rows
-from .acroform_extractor import extract_acroform_data
+# NOTE:
+# Format backends (pypdf, pdfplumber, python-docx, pandas/openpyxl) are
+# imported lazily inside the branch that needs them. Importing this module
+# must stay cheap: a worker that only ever sees PDFs never loads pandas.
 
+SUPPORTED_EXTENSIONS = {".pdf", ".docx", ".xlsx", ".csv"}
 
-async def ingest_document(file, file_path: str) -> dict:
+# Those backends dominate import time / RSS; the production server and
+# the sandbox forkserver load them once, before forking workers.
+HEAVY_MODULES = (
+    "pandas",
+    "openpyxl",
+    "pdfplumber",
+    "pypdf",
+    "docx",
+)
+
+
+async def ingest_document(file, file_path: str, pages=None) -> dict:
+    """
+    Async entry point for callers holding an UploadFile (`file` only
+    supplies the filename). See ingest_file() for the output contract.
+
+    Runs in a sandbox worker process (see sandbox.py) unless AUDIT_SANDBOX=0,
+    off the event loop either way; raises SandboxAbort when the document
+    was killed.
+    """
+    import asyncio
+
+    from .sandbox import SANDBOX_ENABLED, sandboxed_ingest
+
+    ingest = sandboxed_ingest if SANDBOX_ENABLED else ingest_file
+    return await asyncio.to_thread(ingest, file_path, file.filename, pages)
+
+
+def ingest_file(file_path: str, filename: str, pages=None) -> dict:
     """
     Router for document ingestion.
 
+    `pages` ({1}, {2} or None for both) tells the loaders which logical
+    pages the caller needs. Loaders skip work for pages that are not
+    requested and omit their keys, but may still return a page that came
+    for free from the same pass (e.g. AcroForm fields cover both pages).
+
     FINAL OUTPUT CONTRACT (USED BY NORMALIZER + VALIDATOR):
     {
       "page_1": {
@@ -27,100 +60,44 @@ async def ingest_document(file, file_path: str) -> dict:
             transaction_type
           }
         ]
+      },
+      "provenance": {                 # PDFs only (see planner.py)
+        field: {source, confidence}
       }
     }
     """
 
-    ext = os.path.splitext(file.filename)[1].lower()
+    ext = os.path.splitext(filename)[1].lower()
 
     # ============================================================
     # PDF INGESTION
     # ============================================================
     if ext == ".pdf":
+        # AcroForm → text layer → OCR, each tier only for what is still
+        # missing (see planner.py).
+        from .planner import extract_pdf
 
-        # ---------- 1️⃣ ACROFORM (Tier-1) ----------
-        acro = extract_acroform_data(file_path)
-
-        print("\n================ ACROFORM DEBUG ================")
-        print("PAGE 1:", acro.get("page_1"))
-        print("PAGE 2 ROWS:", acro.get("page_2", {}).get("rows"))
-        print("================================================\n")
-
-        # -------- Page 1 (FLATTENED) --------
-        page_1_fields = {
-            k: v
-            for k, v in acro.get("page_1", {}).items()
-            if v
-        }
-
-        # -------- Page 2 (FLATTENED) --------
-        page_2_rows = []
-        for row in acro.get("page_2", {}).get("rows", []):
-            flat_row = {
-                k: v
-                for k, v in row.items()
-                if v
-            }
-            if flat_row:
-                page_2_rows.append(flat_row)
-
-        # ✅ If AcroForm produced anything, RETURN HERE
-        if page_1_fields or page_2_rows:
-            return {
-                "page_1": page_1_fields,
-                "page_2": {
-                    "rows": page_2_rows
-                }
-            }
-
-        # ---------- 2️⃣ TEXT FALLBACK (Tier-2) ----------
-        pages_text, pages_tables = extract_pdf_data(file_path)
-
-        # Page 1 fallback (text only)
-        page_1_fields = {}
-        page_1_text = pages_text.get(1, "")
-        if page_1_text:
-            page_1_fields["raw_text"] = page_1_text
-
-        # Page 2 fallback (tables)
-        raw_table = pages_tables.get(2, [])
-        rows_dicts = extract_page_2_rows(raw_table)
-
-        page_2_rows = []
-        for r in rows_dicts:
-            flat_row = {}
-            if r.get("business_person_name"):
-                flat_row["business_name"] = r["business_person_name"]
-            if r.get("criteria_code"):
-                flat_row["criteria_code"] = r["criteria_code"]
-            if r.get("transaction_type"):
-                flat_row["transaction_type"] = r["transaction_type"]
-
-            if flat_row:
-                page_2_rows.append(flat_row)
-
-        return {
-            "page_1": page_1_fields,
-            "page_2": {
-                "rows": page_2_rows
-            }
-        }
+        return extract_pdf(file_path, pages=pages)
 
     # ============================================================
     # DOCX
     # ============================================================
     elif ext == ".docx":
+        from .docx_loader import ingest_docx
+
         with open(file_path, "rb") as f:
             content = f.read()
-        return ingest_docx(content)
+        return ingest_docx(content, pages=pages)
 
     # ============================================================
     # SPREADSHEET
     # ============================================================
     elif ext in [".xlsx", ".csv"]:
+        from .spreadsheet_loader import ingest_spreadsheet
+
         with open(file_path, "rb") as f:
             content = f.read()
-        return ingest_spreadsheet(content, file.filename)
+        return ingest_spreadsheet(content, filename, pages=pages)
 
     # ============================================================
     # UNSUPPORTED
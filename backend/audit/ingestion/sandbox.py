@@ -0,0 +1,270 @@
+import multiprocessing
+import os
+import signal
+import threading
+
+try:
+    import resource
+except ImportError:  # Windows: only the wall-clock timeout applies
+    resource = None
+
+
+# ============================================================
+# CONFIGURATION
+# ============================================================
+
+# Ingestion runs in sandbox worker processes unless disabled. A runaway
+# pdfplumber table search or pypdf field walk then only costs its own
+# process, never the server worker.
+SANDBOX_ENABLED = os.environ.get("AUDIT_SANDBOX", "1") == "1"
+SANDBOX_WORKERS = int(os.environ.get("AUDIT_SANDBOX_WORKERS", 2))
+SANDBOX_TIMEOUT = float(os.environ.get("AUDIT_SANDBOX_TIMEOUT", 60))
+SANDBOX_CPU_SECONDS = int(os.environ.get("AUDIT_SANDBOX_CPU_SECONDS", 30))
+SANDBOX_MEMORY_MB = int(os.environ.get("AUDIT_SANDBOX_MEMORY_MB", 2048))
+# Sandbox workers are replaced after this many documents regardless.
+SANDBOX_MAX_TASKS = int(os.environ.get("AUDIT_SANDBOX_MAX_TASKS", 200))
+
+ABORT_TIMEOUT = "timeout"
+ABORT_CPU = "cpu_limit"
+ABORT_MEMORY = "memory_limit"
+ABORT_CRASHED = "crashed"
+
+
+class SandboxAbort(Exception):
+    """The document was killed (or killed its worker) before ingestion finished."""
+
+    def __init__(self, reason: str, message: str):
+        super().__init__(message)
+        self.reason = reason
+
+
+# ============================================================
+# WORKER PROCESS
+# ============================================================
+
+def _set_memory_limit(memory_mb: int):
+    if resource is None or memory_mb <= 0:
+        return
+    limit = memory_mb * 1024 * 1024
+    _, hard = resource.getrlimit(resource.RLIMIT_AS)
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+
+
+def _set_cpu_limit(cpu_seconds: int):
+    """
+    RLIMIT_CPU counts the whole process lifetime, so the soft limit is moved
+    to "CPU used so far + budget" before every document. Exceeding it sends
+    SIGXCPU, which terminates the worker.
+    """
+    if resource is None or cpu_seconds <= 0:
+        return
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    used = int(usage.ru_utime + usage.ru_stime)
+    _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+    soft = used + cpu_seconds
+    if hard != resource.RLIM_INFINITY:
+        soft = min(soft, hard)
+    resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+
+
+def _worker_main(conn, memory_mb: int, cpu_seconds: int, func=None):
+    if func is None:
+        from .router import ingest_file as func
+    from .ocr_extractor import defer_to_parent
+
+    defer_to_parent()  # daemonic: the parent runs the OCR pool
+    _set_memory_limit(memory_mb)
+
+    while True:
+        try:
+            task = conn.recv()
+        except EOFError:
+            break
+        if task is None:
+            break
+
+        _set_cpu_limit(cpu_seconds)
+        try:
+            conn.send(("ok", func(*task)))
+        except MemoryError:
+            # Heap may be fragmented/half-built; the parent replaces us.
+            conn.send(("memory", "Memory limit exceeded during ingestion."))
+            break
+        except Exception as e:
+            conn.send(("error", f"{type(e).__name__}: {e}"))
+
+
+# ============================================================
+# POOL
+# ============================================================
+
+_context = None
+
+
+def _get_context():
+    """
+    forkserver where available: workers fork from a clean, single-threaded
+    server that already imported the format backends.
+    """
+    global _context
+    if _context is None:
+        if "forkserver" in multiprocessing.get_all_start_methods():
+            from .router import HEAVY_MODULES
+
+            _context = multiprocessing.get_context("forkserver")
+            _context.set_forkserver_preload(
+                ["backend.audit.ingestion.router", *HEAVY_MODULES]
+            )
+        else:
+            _context = multiprocessing.get_context("spawn")
+    return _context
+
+
+class SandboxWorker:
+    """One sandbox process plus the pipe it takes tasks from."""
+
+    def __init__(self, memory_mb: int, cpu_seconds: int, func=None):
+        ctx = _get_context()
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(
+            target=_worker_main,
+            args=(child_conn, memory_mb, cpu_seconds, func),
+            name="audit-sandbox",
+            daemon=True,
+        )
+        self.process.start()
+        child_conn.close()
+        self.tasks = 0
+
+    def run(self, task, timeout: float):
+        """Returns (status, payload); kills the process on timeout or death."""
+        self.tasks += 1
+        try:
+            self.conn.send(task)
+            if self.conn.poll(timeout):
+                return self.conn.recv()
+        except (EOFError, OSError):
+            self.process.join(timeout=1)
+            return self._death_status()
+
+        self.kill()
+        return ABORT_TIMEOUT, f"Document processing exceeded {timeout:g}s and was stopped."
+
+    def _death_status(self):
+        exitcode = self.process.exitcode
+        if exitcode == -getattr(signal, "SIGXCPU", -1):
+            return ABORT_CPU, "Document processing exceeded its CPU time limit."
+        if exitcode == -signal.SIGKILL:
+            # OOM killer, or the address-space limit hit outside Python
+            return ABORT_MEMORY, "Document processing was killed (memory)."
+        return ABORT_CRASHED, f"Document processing crashed (exit code {exitcode})."
+
+    def alive(self) -> bool:
+        return self.process.is_alive()
+
+    def kill(self):
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join(timeout=5)
+        self.conn.close()
+
+    def close(self):
+        try:
+            self.conn.send(None)
+        except (OSError, ValueError):
+            pass
+        self.process.join(timeout=1)
+        self.kill()
+
+
+class SandboxPool:
+    """
+    At most `size` sandbox processes, started lazily and reused. A worker
+    that timed out, hit a limit, crashed or served max_tasks documents is
+    discarded; the next request starts a fresh one.
+
+    func: top-level function run in the sandbox (default: ingest_file).
+    """
+
+    def __init__(self, size=SANDBOX_WORKERS, timeout=SANDBOX_TIMEOUT,
+                 cpu_seconds=SANDBOX_CPU_SECONDS, memory_mb=SANDBOX_MEMORY_MB,
+                 max_tasks=SANDBOX_MAX_TASKS, func=None):
+        self.func = func
+        self.timeout = timeout
+        self.cpu_seconds = cpu_seconds
+        self.memory_mb = memory_mb
+        self.max_tasks = max_tasks
+        self._slots = threading.BoundedSemaphore(size)
+        self._idle = []
+        self._lock = threading.Lock()
+
+    def _acquire(self) -> SandboxWorker:
+        with self._lock:
+            while self._idle:
+                worker = self._idle.pop()
+                if worker.alive():
+                    return worker
+                worker.kill()
+        return SandboxWorker(self.memory_mb, self.cpu_seconds, self.func)
+
+    def _release(self, worker: SandboxWorker, healthy: bool):
+        if healthy and worker.alive() and worker.tasks < self.max_tasks:
+            with self._lock:
+                self._idle.append(worker)
+        elif worker.alive() and healthy:
+            worker.close()
+        else:
+            worker.kill()
+
+    def ingest(self, file_path: str, filename: str, pages=None) -> dict:
+        """ingest_file() in a sandbox process. Raises SandboxAbort if it was killed."""
+        with self._slots:
+            worker = self._acquire()
+            status, payload = worker.run((file_path, filename, pages), self.timeout)
+            self._release(worker, status in ("ok", "error"))
+
+        if status == "ok":
+            return payload
+        if status == "error":
+            raise RuntimeError(payload)
+        if status == "memory":
+            status = ABORT_MEMORY
+
+        print(f"Sandbox aborted {filename}: {payload}")
+        raise SandboxAbort(status, payload)
+
+    def shutdown(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for worker in idle:
+            worker.close()
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> SandboxPool:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = SandboxPool()
+        return _pool
+
+
+def sandboxed_ingest(file_path: str, filename: str, pages=None) -> dict:
+    from .planner import finish_ocr
+
+    # Scanned pages come back rendered; they are OCR'd here, through the
+    # capped OCR pool (AUDIT_OCR_WORKERS, per-page timeout).
+    return finish_ocr(get_pool().ingest(file_path, filename, pages))
+
+
+def shutdown_sandbox():
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown()
@@ -1,79 +1,269 @@
-import pandas as pd
+import csv
+import datetime as _dt
 import io
+import math
+import re
+
+import pandas as pd
+
+from .field_extractor import extract_headers_from_lines
+
+
+# ============================================================
+# TYPED CELLS
+# Excel stores dates as datetimes and codes/years as numbers;
+# str() turns them into "2023-12-31 00:00:00" / "2023.0", which
+# the rules reject. Cells are converted per column (by dtype and
+# the column's number format) to the strings the validator expects.
+# ============================================================
+
+CANONICAL_DATE = "%m/%d/%Y"
+CANONICAL_YEAR = "%Y"
+
+# Quoted literals, [colour]/[locale] sections, escapes
+_FORMAT_NOISE = re.compile(r'"[^"]*"|\[[^\]]*\]|\\.')
+
+
+def _date_pattern(number_format) -> str:
+    """strftime pattern for a date-formatted column ("yyyy" → year only)."""
+    if not number_format:
+        return CANONICAL_DATE
+    tokens = _FORMAT_NOISE.sub("", number_format.split(";")[0]).lower()
+    if "y" in tokens and "d" not in tokens and "m" not in tokens:
+        return CANONICAL_YEAR
+    return CANONICAL_DATE
+
+
+def _numbers_to_str(col: pd.Series) -> pd.Series:
+    """Integral floats lose their ".0" (2023.0 → "2023"); others keep repr."""
+    out = col.astype(str)
+    integral = col.notna() & (col % 1 == 0)
+    if integral.any():
+        out[integral] = col[integral].astype("int64").astype(str)
+    return out
+
+
+def _dates_to_str(col: pd.Series, number_formats) -> pd.Series:
+    """Formats datetimes once per distinct number format, not per cell."""
+    col = pd.to_datetime(col)
+    if number_formats is None:
+        return col.dt.strftime(CANONICAL_DATE)
 
-def ingest_spreadsheet(file_bytes: bytes, filename: str) -> dict:
+    formats = number_formats.reindex(col.index)
+    patterns = formats.map({f: _date_pattern(f) for f in formats.dropna().unique()})
+    patterns = patterns.fillna(CANONICAL_DATE)
+
+    out = pd.Series("", index=col.index, dtype=object)
+    for pattern in patterns.unique():
+        mask = patterns == pattern
+        out[mask] = col[mask].dt.strftime(pattern)
+    return out
+
+
+def canonical_column(col: pd.Series, number_formats: pd.Series = None) -> pd.Series:
+    """
+    One column → canonical strings ("" for empty cells). Works on the whole
+    column per dtype; mixed (object) columns are split by cell type first.
+    number_formats: the cells' Excel number formats (same index), if known.
+    """
+    empty = col.isna()
+
+    if pd.api.types.is_bool_dtype(col):
+        out = col.astype(str)
+    elif pd.api.types.is_datetime64_any_dtype(col):
+        out = _dates_to_str(col, number_formats)
+    elif pd.api.types.is_numeric_dtype(col):
+        out = _numbers_to_str(col)
+    else:
+        out = pd.Series("", index=col.index, dtype=object)
+        kinds = col.map(type)
+        types = kinds.unique()
+
+        dates = kinds.map({t: issubclass(t, _dt.date) for t in types}) & ~empty
+        numbers = kinds.map({
+            t: issubclass(t, (int, float)) and not issubclass(t, bool) for t in types
+        }) & ~empty
+        rest = ~(dates | numbers | empty)
+
+        if dates.any():
+            out[dates] = _dates_to_str(col[dates], number_formats)
+        if numbers.any():
+            out[numbers] = _numbers_to_str(col[numbers].astype(float))
+        if rest.any():
+            out[rest] = col[rest].astype(str)
+
+    out = out.where(~empty, "")
+    return out.str.strip()
+
+
+def canonical_frame(df: pd.DataFrame, number_formats: pd.DataFrame = None) -> pd.DataFrame:
+    """number_formats: optional frame of Excel number formats shaped like df."""
+    out = pd.DataFrame(
+        {
+            i: canonical_column(
+                df.iloc[:, i],
+                number_formats.iloc[:, i] if number_formats is not None else None,
+            )
+            for i in range(df.shape[1])
+        },
+        index=df.index,
+    )
+    out.columns = df.columns
+    return out
+
+
+def canonical_cell(value, number_format=None) -> str:
+    """Single-cell canonical_column(), for rows streamed one at a time."""
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return ""
+    if isinstance(value, bool):
+        return str(value)
+    if isinstance(value, _dt.date):
+        if number_format == "General":
+            number_format = None
+        return value.strftime(_date_pattern(number_format))
+    if isinstance(value, (int, float)):
+        return str(int(value)) if value % 1 == 0 else str(float(value))
+    return str(value).strip()
+
+
+def _line(cells) -> str:
+    """One line per row: non-empty cells, space separated."""
+    return " ".join([x for x in cells if x])
+
+
+def _region_lines(rows):
+    """(values, number formats) rows → header lines, lazily."""
+    for values, formats in rows:
+        yield _line([canonical_cell(v, f) for v, f in zip(values, formats)])
+
+
+def _csv_lines(file_bytes: bytes):
+    """CSV rows (column names first) → header lines, lazily; blank rows skipped."""
+    text = io.TextIOWrapper(io.BytesIO(file_bytes), encoding="utf-8-sig",
+                            errors="replace", newline="")
+    for row in csv.reader(text):
+        line = _line([cell.strip() for cell in row])
+        if line:
+            yield line
+
+
+def _materialize(region: dict):
+    """
+    Scanned region (raw rows + number formats) → canonical string frame.
+    Ragged rows are padded; trailing empty rows are dropped.
+    """
+    rows = list(region["rows"])
+    formats = list(region["formats"])
+
+    while rows and all(v is None for v in rows[-1]):
+        rows.pop()
+        formats.pop()
+
+    width = max([0] + [len(r) for r in rows])
+    rows = [r + [None] * (width - len(r)) for r in rows]
+    formats = [
+        [f if f != "General" else None for f in fmts] + [None] * (width - len(fmts))
+        for fmts in formats
+    ]
+
+    return canonical_frame(
+        pd.DataFrame(rows, columns=range(width)).infer_objects(),
+        pd.DataFrame(formats, columns=range(width), dtype=object),
+    )
+
+
+def ingest_spreadsheet(file_bytes: bytes, filename: str, pages=None) -> dict:
     """
     Ingests XLSX or CSV.
-    Page 1: "Key: Value" dump of the first sheet/dataframe.
-    Page 2: Rows from 2nd sheet (XLSX) or heuristic separation (CSV).
+    Page 1: Header fields, streamed row by row through the header extractor
+            (XLSX: rows with header labels on any sheet, else sheet 1; CSV:
+            column names, then rows) until all are found. Rows after that
+            are never read or converted.
+    Page 2: Rows of the related-party table (XLSX: found by its column
+            headers on any sheet, else sheet 2) or the CSV's first 3 columns.
+    pages: optional {1} / {2} to skip the other page's work (key omitted).
+    Cell values are canonical strings (see canonical_column).
     """
-    text_content = ""
+    want_page_1 = pages is None or 1 in pages
+    want_page_2 = pages is None or 2 in pages
+
+    header_fields = extract_headers_from_lines([])
     rows_data = []
 
     try:
         if filename.endswith('.xlsx'):
-            xls = pd.ExcelFile(io.BytesIO(file_bytes))
-            sheet_names = xls.sheet_names
-            
-            # Page 1: Sheet 1 contents
-            if len(sheet_names) > 0:
-                df1 = pd.read_excel(xls, sheet_names[0])
-                # Convert to string representation for header extraction
-                # We iterate rows and join them "col: val" or just space separated
-                for _, row in df1.iterrows():
-                    row_str = " ".join([str(x) for x in row if pd.notna(x)])
-                    text_content += row_str + "\n"
-
-            # Page 2: Sheet 2 contents (Preferred) OR look for table in Sheet 1
-            if len(sheet_names) > 1:
-                df2 = pd.read_excel(xls, sheet_names[1])
-                rows_data = _df_to_rows(df2)
-            else:
-                # Fallback: if only 1 sheet, maybe the table is at the bottom?
-                # For now, if 1 sheet, we assume it contains everything. 
-                # But strict separation is safer. If 1 sheet, maybe no table data?
-                pass
-                
+            from openpyxl import load_workbook
+
+            from .workbook_scanner import region_rows, scan_workbook
+
+            wb = load_workbook(io.BytesIO(file_bytes), read_only=True, data_only=True)
+            try:
+                # Header block and related-party table are found by anchor
+                # text on any sheet, in one pass (see workbook_scanner).
+                regions = scan_workbook(wb, want_header=want_page_1, want_table=want_page_2)
+
+                header = regions["header"]
+                if header is not None:
+                    print(f"Workbook header block: sheet '{header['sheet']}'")
+                    header_fields = extract_headers_from_lines(_region_lines(region_rows(header)))
+            finally:
+                wb.close()
+
+            table = regions["table"]
+            if table is not None:
+                print(f"Workbook related-party table: sheet '{table['sheet']}'")
+                rows_data = _df_to_rows(_materialize(table), table["columns"])
+
         else: # CSV
-            df = pd.read_csv(io.BytesIO(file_bytes))
-            # Treat whole CSV as text for headers AND check for table structure?
-            # Audit CSVs usually either Header OR Table. 
-            # Strategy: Dump all as text for Page 1.
-            # Look for "Business Name" column to start Page 2 rows.
-            
-            # Text dump
-            text_content = df.to_string(index=False)
-            
+            # Audit CSVs usually either Header OR Table, so both are tried.
+
+            # Header fields: column names first, then row by row
+            if want_page_1:
+                header_fields = extract_headers_from_lines(_csv_lines(file_bytes))
+
             # Table extraction attempt
-            rows_data = _df_to_rows(df)
+            if want_page_2:
+                rows_data = _df_to_rows(canonical_frame(pd.read_csv(io.BytesIO(file_bytes))))
 
     except Exception as e:
         print(f"Spreadsheet error: {e}")
         # Return empty on failure so validator fails gracefully
         pass
 
-    return {
-        "page_1": {"text": text_content},
-        "page_2": {"rows": rows_data}
-    }
+    result = {}
+    if want_page_1:
+        result["page_1"] = header_fields
+    if want_page_2:
+        result["page_2"] = {"rows": rows_data}
+    return result
+
+TABLE_FIELDS = ("business_name", "criteria_code", "transaction_type")
 
-def _df_to_rows(df):
+
+def _df_to_rows(df, columns=None):
     """
     Converts DataFrame to standardized list of dicts.
-    Expects columns 1, 2, 3 to correspond to our required fields.
+    columns: {field: column index} from the table anchor; without it
+    columns 1, 2, 3 are expected to correspond to our required fields.
     """
     result = []
-    # Clean NaN
-    df = df.fillna("")
-    
-    # If columns contain "Name", "Criteria" etc, map them?
+
+    if columns:
+        for row in df.itertuples(index=False):
+            result.append({
+                field: row[columns[field]] if field in columns else ""
+                for field in TABLE_FIELDS
+            })
+        return result
+
     # Simple strategy: Take first 3 columns
     if df.shape[1] < 3:
         return []
         
-    for _, row in df.iterrows():
-        # Convert to list
-        vals = [str(x).strip() for x in row]
+    for row in df.itertuples(index=False):
+        # Already canonical strings
+        vals = list(row)
         result.append({
             "business_name": vals[0],
             "criteria_code": vals[1],
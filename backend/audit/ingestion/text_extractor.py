@@ -1,31 +1,45 @@
 import pdfplumber
 
-def extract_pdf_data(pdf_file_path: str):
+def extract_pdf_data(pdf_file_path: str, pages=None, table_page: int = 2):
     """
     Extracts data from PDF.
+    Args:
+        pages: optional set of 1-based page numbers to extract text from
+               (e.g. the pages flagged by page_index). None = all pages.
+        table_page: page to run table extraction on (None = no table).
+               Skipped when `pages` is given and does not include it.
     Returns:
-        pages_text (dict): {page_num (int): "text"} for ALL pages.
-        pages_tables (dict): {2: [table_data]} (Legacy support for Page 2 table)
+        pages_text (dict): {page_num (int): "text"} for ALL (or requested) pages.
+        pages_tables (dict): {table_page: [table_data]} (Legacy: Page 2 table)
     """
     pages_text = {}
     pages_tables = {}
     
     try:
         with pdfplumber.open(pdf_file_path) as pdf:
-            # Extract text from ALL pages
-            for i, page in enumerate(pdf.pages):
-                page_num = i + 1
-                text = page.extract_text() or ""
+            page_count = len(pdf.pages)
+
+            if pages is None:
+                page_nums = range(1, page_count + 1)
+            else:
+                page_nums = sorted(p for p in pages if 1 <= p <= page_count)
+
+            # Extract text from ALL (or the requested) pages
+            for page_num in page_nums:
+                text = pdf.pages[page_num - 1].extract_text() or ""
                 pages_text[page_num] = text
             
             # Legacy: Page 2 Table Extraction (keep existing logic)
-            if len(pdf.pages) >= 2:
-                p2 = pdf.pages[1]
-                extracted_table = p2.extract_table()
+            if (
+                table_page is not None
+                and page_count >= table_page
+                and (pages is None or table_page in pages)
+            ):
+                extracted_table = pdf.pages[table_page - 1].extract_table()
                 if extracted_table:
-                    pages_tables[2] = extracted_table
+                    pages_tables[table_page] = extracted_table
                 else:
-                    pages_tables[2] = []
+                    pages_tables[table_page] = []
                     
     except Exception as e:
         print(f"Error reading PDF: {e}")
@@ -0,0 +1,204 @@
+import re
+
+
+# ============================================================
+# WORKBOOK SCANNER
+# One read-only pass over every sheet that locates the header
+# key/value block and the related-party table by anchor text,
+# wherever they live (any sheet, any row, a table further down
+# the header sheet, mislabeled or reordered sheets). Only those
+# regions are kept; the loader materializes them afterwards.
+#
+# Without anchors the old layout is assumed: sheet 1 is the
+# header, sheet 2 (first row = column names) is the table; that
+# sheet is read a second time only in that case.
+# ============================================================
+
+# Anchor cells are labels, not prose.
+MAX_ANCHOR_LENGTH = 60
+
+HEADER_LABELS = {
+    "company_name": re.compile(r"company\s*name\b", re.IGNORECASE),
+    "year_period_end": re.compile(
+        r"(?:fiscal\s*)?(?:year|period)(?:\s*/\s*period)?\s*end", re.IGNORECASE
+    ),
+    "completed_by": re.compile(r"(?:completed|prepared)\s*by\b", re.IGNORECASE),
+    "date": re.compile(r"date\b", re.IGNORECASE),
+}
+
+# Checked in this order; a cell names at most one column.
+TABLE_COLUMNS = {
+    "criteria_code": re.compile(r".*criteria", re.IGNORECASE),
+    "transaction_type": re.compile(r"(?:.*transaction|type|nature)", re.IGNORECASE),
+    "business_name": re.compile(r"(?:business|person|related\s*part|.*name)", re.IGNORECASE),
+}
+
+# Header row must name at least this many of TABLE_COLUMNS.
+MIN_TABLE_COLUMNS = 2
+
+
+def _anchor_text(value):
+    if isinstance(value, str):
+        text = value.strip()
+        if text and len(text) <= MAX_ANCHOR_LENGTH:
+            return text
+    return None
+
+
+def header_labels(values) -> set:
+    """Header fields whose label starts one of the row's cells."""
+    found = set()
+    for value in values:
+        text = _anchor_text(value)
+        if text is None:
+            continue
+        for field, regex in HEADER_LABELS.items():
+            if regex.match(text):
+                found.add(field)
+                break
+    return found
+
+
+def table_columns(values) -> dict:
+    """{field: column index} if the row looks like the related-party table header."""
+    columns = {}
+    for i, value in enumerate(values):
+        text = _anchor_text(value)
+        if text is None:
+            continue
+        for field, regex in TABLE_COLUMNS.items():
+            if field not in columns and regex.match(text):
+                columns[field] = i
+                break
+    return columns if len(columns) >= MIN_TABLE_COLUMNS else {}
+
+
+def _is_blank_cell(value) -> bool:
+    return value is None or (isinstance(value, str) and not value.strip())
+
+
+def _is_blank(values) -> bool:
+    return all(_is_blank_cell(v) for v in values)
+
+
+def _label_only(values, labels) -> bool:
+    """Row holds labels but no values: they are on the row below."""
+    return sum(1 for v in values if not _is_blank_cell(v)) <= len(labels)
+
+
+def _region(sheet: str):
+    return {"sheet": sheet, "rows": [], "formats": []}
+
+
+def _append(region: dict, cells, values):
+    region["rows"].append(values)
+    region["formats"].append([getattr(c, "number_format", None) for c in cells])
+
+
+# ============================================================
+# SCAN
+# ============================================================
+
+def scan_workbook(wb, want_header: bool = True, want_table: bool = True) -> dict:
+    """
+    Returns:
+      {
+        "header": {"sheet", "rows", "formats", "labels"} | None,
+        "table":  {"sheet", "rows", "formats", "columns": {field: col}} | None,
+      }
+    "rows" hold raw cell values and "formats" the matching Excel number
+    formats; read them with region_rows(). Header rows are the labelled
+    rows, plus the row below a row of labels without values. Table rows run
+    from below the anchor row to the first blank row.
+    """
+    sheets = wb.worksheets
+
+    header_candidates = []   # one per sheet with labels
+    table_candidates = []
+    row_counts = []          # per sheet; bounds the fallback re-read
+
+    for ws in sheets:
+        header = _region(ws.title)
+        header["labels"] = set()
+        table = None
+        row_count = 0
+        value_below = False
+
+        for cells in ws.iter_rows():
+            row_count += 1
+            values = [c.value for c in cells]
+
+            # Inside a table: rows belong to it until the first blank row
+            if table is not None:
+                if _is_blank(values):
+                    table = None
+                else:
+                    _append(table, cells, values)
+                continue
+
+            if want_table:
+                columns = table_columns(values)
+                if columns:
+                    table = _region(ws.title)
+                    table["columns"] = columns
+                    table_candidates.append(table)
+                    value_below = False
+                    continue
+
+            if want_header:
+                labels = header_labels(values)
+                if labels:
+                    header["labels"] |= labels
+                    _append(header, cells, values)
+                    value_below = _label_only(values, labels)
+                    continue
+                if value_below and not _is_blank(values):
+                    _append(header, cells, values)
+            value_below = False
+
+        row_counts.append(row_count)
+        if header["labels"]:
+            header_candidates.append(header)
+
+    result = {"header": None, "table": None}
+
+    if want_header:
+        if header_candidates:
+            # Most distinct labels wins (a summary sheet mentioning one label
+            # loses to the real header block); earliest sheet on ties.
+            result["header"] = max(header_candidates, key=lambda h: len(h["labels"]))
+        elif sheets and row_counts[0]:
+            # Old layout: all of sheet 1 is the header, read lazily by
+            # region_rows() so the extractor can stop early
+            result["header"] = _region(sheets[0].title)
+            result["header"].update(rows=None, labels=set(),
+                                    worksheet=sheets[0], last=row_counts[0])
+
+    if want_table:
+        tables = [t for t in table_candidates if t["rows"]]
+        if tables:
+            # Most recognized columns wins; earliest on ties.
+            result["table"] = max(tables, key=lambda t: len(t["columns"]))
+        elif len(sheets) > 1 and row_counts[1] > 1:
+            # Old layout: first row of sheet 2 is the column header
+            result["table"] = _read_rows(sheets[1], 2, row_counts[1])
+            result["table"]["columns"] = None
+
+    return result
+
+
+def region_rows(region: dict):
+    """(values, number formats) per row of a region, lazily."""
+    if region.get("worksheet") is not None:
+        for cells in region["worksheet"].iter_rows(min_row=1, max_row=region["last"]):
+            yield [c.value for c in cells], [getattr(c, "number_format", None) for c in cells]
+    else:
+        yield from zip(region["rows"], region["formats"])
+
+
+def _read_rows(ws, first: int, last: int) -> dict:
+    """Second pass over one sheet, only when no anchor matched."""
+    region = _region(ws.title)
+    for cells in ws.iter_rows(min_row=first, max_row=last):
+        _append(region, cells, [c.value for c in cells])
+    return region
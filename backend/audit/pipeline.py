@@ -0,0 +1,89 @@
+from backend.audit.ingestion.router import ingest_file
+from backend.audit.ingestion.sandbox import SandboxAbort, sandboxed_ingest
+from backend.audit.normalization.normalizer import normalize_for_validation
+from backend.audit.validation.validator import (
+    validate_document,
+    page_1_fails,
+    MODE_FULL,
+    MODE_FAIL_FAST,
+    PAGE_1_FIELDS,
+    STATUS_INSUFFICIENT_DATA,
+)
+
+
+def run_pipeline(file_path: str, filename: str, mode: str = MODE_FULL, profile=None,
+                 sandbox: bool = False, keep_normalized: bool = False):
+    """
+    ingest → normalize → validate for one file on disk.
+
+    Returns the validate_document() result, or None when nothing could be
+    extracted from the document.
+
+    In fail_fast mode Page 1 is ingested first; Page 2 is only extracted
+    (table finding, sheet 2, DOCX tables) when the header does not already
+    decide a FAIL.
+
+    profile: tenant RuleProfile (validation.profiles); None = built-in rules.
+
+    sandbox: run ingestion in a resource-limited worker process (the API
+    does, see AUDIT_SANDBOX). A document killed for time/CPU/memory yields
+    an INSUFFICIENT_DATA result with "aborted": <reason>.
+
+    keep_normalized: also return the normalized payload under "normalized",
+    so the result can later be corrected without re-ingesting (API). Left
+    out when fail_fast stopped before Page 2 was read.
+    """
+    ingest = sandboxed_ingest if sandbox else ingest_file
+
+    try:
+        return _run(ingest, file_path, filename, mode, profile, keep_normalized)
+    except SandboxAbort as e:
+        return {
+            "overall_status": STATUS_INSUFFICIENT_DATA,
+            "page_1": {},
+            "page_2": {},
+            "errors": [str(e)],
+            "aborted": e.reason,
+        }
+
+
+def _run(ingest, file_path: str, filename: str, mode: str, profile, keep_normalized: bool = False):
+    if mode == MODE_FAIL_FAST:
+        extracted = ingest(file_path, filename, pages={1})
+        if not extracted:
+            return None
+
+        # Loaders may hand back Page 2 for free (AcroForm is one pass).
+        if "page_2" not in extracted:
+            normalized = normalize_for_validation(extracted)
+            page_1_fields = profile.page_1_fields if profile is not None else PAGE_1_FIELDS
+            if page_1_fails(normalized["page_1"], page_1_fields):
+                return _with_provenance(
+                    validate_document(normalized, mode=mode, profile=profile), extracted
+                )
+
+            page_2_pass = ingest(file_path, filename, pages={2})
+            extracted["page_2"] = page_2_pass.get("page_2", {"rows": []})
+            if "provenance" in page_2_pass:
+                extracted.setdefault("provenance", {}).update(
+                    {k: v for k, v in page_2_pass["provenance"].items() if k == "page_2_rows"}
+                )
+    else:
+        extracted = ingest(file_path, filename)
+        if not extracted:
+            return None
+
+    normalized = normalize_for_validation(extracted)
+    result = _with_provenance(
+        validate_document(normalized, mode=mode, profile=profile), extracted
+    )
+    if keep_normalized:
+        result["normalized"] = normalized
+    return result
+
+
+def _with_provenance(result: dict, extracted: dict) -> dict:
+    """Carries per-field extraction source/confidence into the result."""
+    if extracted.get("provenance"):
+        result["provenance"] = extracted["provenance"]
+    return result
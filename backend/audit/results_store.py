@@ -0,0 +1,448 @@
+import json
+import os
+import queue
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+
+from backend.audit.validation.models import json_default, result_to_dict
+
+
+# ============================================================
+# CONFIGURATION
+# ============================================================
+
+# SQLite file for validation results (API and batch). Unset: nothing is kept.
+RESULTS_DB = os.environ.get("AUDIT_RESULTS_DB")
+# Results are written by one background thread, this many per transaction
+# or after RESULTS_FLUSH_SECONDS, whichever comes first.
+RESULTS_BATCH_SIZE = int(os.environ.get("AUDIT_RESULTS_BATCH_SIZE", 200))
+RESULTS_FLUSH_SECONDS = float(os.environ.get("AUDIT_RESULTS_FLUSH_SECONDS", 1.0))
+
+MAX_PAGE_SIZE = 500
+GROUP_BY = {
+    "status": "d.overall_status",
+    "company": "d.company_key",
+    "rules_version": "d.rules_version",
+    "tenant": "d.tenant",
+    "day": "date(d.validated_at, 'unixepoch')",
+}
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    id             INTEGER PRIMARY KEY,
+    result_id      TEXT NOT NULL UNIQUE,
+    source         TEXT,
+    tenant         TEXT,
+    rules_version  TEXT,
+    company_name   TEXT,
+    company_key    TEXT,
+    period_end     TEXT,
+    document_date  TEXT,
+    overall_status TEXT,
+    issues         INTEGER NOT NULL,
+    validated_at   REAL NOT NULL,
+    result_json    TEXT
+);
+CREATE INDEX IF NOT EXISTS documents_company ON documents (company_key, validated_at);
+CREATE INDEX IF NOT EXISTS documents_status ON documents (overall_status, validated_at);
+CREATE INDEX IF NOT EXISTS documents_rules ON documents (rules_version, validated_at);
+CREATE INDEX IF NOT EXISTS documents_time ON documents (validated_at);
+
+CREATE TABLE IF NOT EXISTS fields (
+    document_id INTEGER NOT NULL REFERENCES documents (id) ON DELETE CASCADE,
+    page        INTEGER NOT NULL,
+    row_number  INTEGER NOT NULL,
+    field       TEXT NOT NULL,
+    status      TEXT NOT NULL,
+    value       TEXT,
+    error       TEXT
+);
+CREATE INDEX IF NOT EXISTS fields_document ON fields (document_id);
+CREATE INDEX IF NOT EXISTS fields_status ON fields (field, status);
+"""
+
+DOCUMENT_COLUMNS = (
+    "result_id", "source", "tenant", "rules_version", "company_name", "company_key",
+    "period_end", "document_date", "overall_status", "issues", "validated_at", "result_json",
+)
+
+LIST_COLUMNS = (
+    "result_id", "source", "tenant", "rules_version", "company_name",
+    "period_end", "document_date", "overall_status", "issues", "validated_at",
+)
+
+
+# ============================================================
+# ROWS
+# ============================================================
+
+def _field_dict(res) -> dict:
+    # FieldResult from a live run, plain dict from a stored / cached record
+    return res.to_dict() if hasattr(res, "to_dict") else res
+
+
+def _company_key(name):
+    return " ".join(name.split()).casefold() if name else None
+
+
+def field_rows(result) -> list:
+    """
+    (page, row_number, field, status, value, error) per validated field of a
+    validate_document() result; page-1 header fields have row_number 0.
+    """
+    page_1 = ((result or {}).get("page_1") or {}).get("fields", {})
+    page_2 = (result or {}).get("page_2") or {}
+
+    fields = []
+    for key, res in page_1.items():
+        res = _field_dict(res)
+        fields.append((1, 0, key, res["status"], res.get("value"), res.get("error")))
+    for row in page_2.get("rows", []):
+        for key, res in row["fields"].items():
+            res = _field_dict(res)
+            fields.append((2, row["row_number"], key, res["status"], res.get("value"), res.get("error")))
+    return fields
+
+
+def document_rows(result_id: str, result, source: str = None, tenant: str = None,
+                  rules_version: str = None, overall_status: str = None,
+                  validated_at: float = None):
+    """
+    (documents row, [fields rows]) for one validate_document() result.
+    result may be None (nothing extracted); overall_status overrides the
+    result's own (e.g. "ERROR" for a crashed batch document).
+    """
+    result = {k: v for k, v in (result or {}).items() if k != "normalized"}
+    page_1 = (result.get("page_1") or {}).get("fields", {})
+    page_2 = result.get("page_2") or {}
+    fields = field_rows(result)
+
+    def value(key):
+        res = page_1.get(key)
+        return _field_dict(res).get("value") if res is not None else None
+
+    company_name = value("company_name")
+    issues = sum(1 for f in fields if f[3] != "FOUND_AND_VALID")
+    if page_2.get("status") == "FAIL":
+        issues += 1
+
+    document = (
+        result_id,
+        source,
+        tenant,
+        rules_version,
+        company_name,
+        _company_key(company_name),
+        value("year"),
+        value("date"),
+        overall_status or result.get("overall_status"),
+        issues,
+        validated_at or time.time(),
+        json.dumps(result_to_dict(result), default=json_default) if result else None,
+    )
+    return document, fields
+
+
+def _timestamp(value):
+    """ISO date/datetime (naive = UTC) or unix seconds → unix seconds."""
+    if value is None or value == "":
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        pass
+    try:
+        parsed = datetime.fromisoformat(str(value))
+    except ValueError:
+        raise ValueError(f"Invalid date: {value}. Use YYYY-MM-DD or an ISO datetime.")
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def _iso(ts: float) -> str:
+    return datetime.fromtimestamp(ts, timezone.utc).isoformat()
+
+
+# ============================================================
+# STORE
+# ============================================================
+
+_STOP = object()
+
+
+class ResultsStore:
+    """
+    Per-document and per-field outcomes in SQLite (WAL).
+
+    add() only queues the rows; a writer thread inserts them in batches, one
+    transaction per batch. Queries run on per-thread read connections and
+    never wait for the writer. Adding an existing result_id replaces it
+    (corrections, batch re-runs).
+
+    background=False writes the batches in the calling thread instead (batch
+    CLI: no extra thread alive when the process pool forks its workers).
+    """
+
+    def __init__(self, path: str, batch_size: int = RESULTS_BATCH_SIZE,
+                 flush_seconds: float = RESULTS_FLUSH_SECONDS, background: bool = True):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_seconds = flush_seconds
+        self._local = threading.local()
+        self._queue = queue.Queue()
+        self._pending = []  # background=False only
+        self._writer = None
+
+        conn = self._connect()
+        conn.executescript(SCHEMA)
+        conn.close()
+
+        if background:
+            self._writer = threading.Thread(
+                target=self._write_loop, name="audit-results-writer", daemon=True
+            )
+            self._writer.start()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA foreign_keys=ON")
+        conn.execute("PRAGMA busy_timeout=5000")
+        return conn
+
+    def _reader(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = self._connect()
+            conn.row_factory = sqlite3.Row
+        return conn
+
+    # -------- writes --------
+
+    def add(self, result_id: str, result, **kwargs):
+        """Queues one document (see document_rows() for kwargs)."""
+        rows = document_rows(result_id, result, **kwargs)
+        if self._writer is not None:
+            self._queue.put(rows)
+            return
+        self._pending.append(rows)
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self, timeout: float = 10):
+        """Blocks until everything queued so far is committed."""
+        if self._writer is None:
+            self._write(self._reader(), self._pending)
+            self._pending = []
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait(timeout)
+
+    def close(self):
+        if self._writer is not None:
+            self._queue.put(_STOP)
+            self._writer.join(timeout=10)
+        else:
+            self.flush()
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def _write_loop(self):
+        conn = self._connect()
+        batch = []
+        deadline = None
+
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            if item is _STOP or isinstance(item, threading.Event) or item is None:
+                self._write(conn, batch)
+                batch, deadline = [], None
+                if item is _STOP:
+                    break
+                if item is not None:
+                    item.set()
+                continue
+
+            batch.append(item)
+            if deadline is None:
+                deadline = time.monotonic() + self.flush_seconds
+            if len(batch) >= self.batch_size:
+                self._write(conn, batch)
+                batch, deadline = [], None
+
+        conn.close()
+
+    def _write(self, conn, batch):
+        if not batch:
+            return
+        placeholders = ", ".join("?" for _ in DOCUMENT_COLUMNS)
+        try:
+            with conn:
+                for document, fields in batch:
+                    # REPLACE on result_id; the CASCADE drops the old field rows
+                    cur = conn.execute(
+                        f"INSERT OR REPLACE INTO documents ({', '.join(DOCUMENT_COLUMNS)}) "
+                        f"VALUES ({placeholders})",
+                        document,
+                    )
+                    conn.executemany(
+                        "INSERT INTO fields (document_id, page, row_number, field, status, value, error) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        [(cur.lastrowid, *f) for f in fields],
+                    )
+        except sqlite3.Error as e:
+            print(f"Results store: dropped {len(batch)} result(s): {e}")
+
+    # -------- queries --------
+
+    @staticmethod
+    def _where(company=None, status=None, rules_version=None, tenant=None,
+               since=None, until=None, prefix="d."):
+        clauses, params = [], []
+        if company:
+            clauses.append(f"{prefix}company_key = ?")
+            params.append(_company_key(company))
+        if status:
+            clauses.append(f"{prefix}overall_status = ?")
+            params.append(status)
+        if rules_version:
+            clauses.append(f"{prefix}rules_version = ?")
+            params.append(rules_version)
+        if tenant:
+            clauses.append(f"{prefix}tenant = ?")
+            params.append(tenant)
+        since, until = _timestamp(since), _timestamp(until)
+        if since is not None:
+            clauses.append(f"{prefix}validated_at >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append(f"{prefix}validated_at < ?")
+            params.append(until)
+        return clauses, params
+
+    def list_documents(self, limit: int = 50, cursor: str = None, **filters) -> dict:
+        """
+        Newest first. Keyset pagination: pass back "next_cursor" to get the
+        following page (stable while new results keep arriving).
+        """
+        limit = max(1, min(int(limit), MAX_PAGE_SIZE))
+        clauses, params = self._where(prefix="", **filters)
+
+        if cursor:
+            try:
+                ts, doc_id = cursor.split(":")
+                ts, doc_id = float(ts), int(doc_id)
+            except ValueError:
+                raise ValueError(f"Invalid cursor: {cursor}")
+            clauses.append("(validated_at, id) < (?, ?)")
+            params += [ts, doc_id]
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self._reader().execute(
+            f"SELECT id, {', '.join(LIST_COLUMNS)} FROM documents {where} "
+            f"ORDER BY validated_at DESC, id DESC LIMIT ?",
+            (*params, limit + 1),
+        ).fetchall()
+
+        more = len(rows) > limit
+        rows = rows[:limit]
+        items = [self._item(row) for row in rows]
+        next_cursor = f"{rows[-1]['validated_at']!r}:{rows[-1]['id']}" if more else None
+        return {"items": items, "next_cursor": next_cursor}
+
+    def get_document(self, result_id: str):
+        row = self._reader().execute(
+            f"SELECT {', '.join(LIST_COLUMNS)}, result_json FROM documents WHERE result_id = ?",
+            (result_id,),
+        ).fetchone()
+        if row is None:
+            return None
+        item = self._item(row)
+        item["result"] = json.loads(row["result_json"]) if row["result_json"] else None
+        return item
+
+    def summary(self, group_by: str = "status", **filters) -> dict:
+        """Document counts per overall status (and per group), field outcome counts."""
+        if group_by not in GROUP_BY:
+            raise ValueError(f"Unknown group_by: {group_by}. Allowed: {list(GROUP_BY)}")
+
+        conn = self._reader()
+        clauses, params = self._where(**filters)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        by_status = {
+            status: count for status, count in conn.execute(
+                f"SELECT d.overall_status, COUNT(*) FROM documents d {where} "
+                f"GROUP BY d.overall_status",
+                params,
+            )
+        }
+
+        by_field = {}
+        for field, status, count in conn.execute(
+            f"SELECT f.field, f.status, COUNT(*) FROM fields f "
+            f"JOIN documents d ON d.id = f.document_id {where} "
+            f"GROUP BY f.field, f.status",
+            params,
+        ):
+            by_field.setdefault(field, {})[status] = count
+
+        out = {"total": sum(by_status.values()), "by_status": by_status, "by_field": by_field}
+
+        if group_by != "status":
+            groups = {}
+            for key, status, count in conn.execute(
+                f"SELECT {GROUP_BY[group_by]}, "
+                f"d.overall_status, COUNT(*) FROM documents d {where} "
+                f"GROUP BY 1, 2 ORDER BY 1",
+                params,
+            ):
+                group = groups.setdefault(key, {"key": key, "total": 0, "by_status": {}})
+                group["total"] += count
+                group["by_status"][status] = count
+            out["groups"] = list(groups.values())
+
+        return out
+
+    @staticmethod
+    def _item(row) -> dict:
+        item = {col: row[col] for col in LIST_COLUMNS}
+        item["validated_at"] = _iso(item["validated_at"])
+        return item
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_results_store():
+    """Process-wide store for AUDIT_RESULTS_DB, or None when it is not set."""
+    global _store
+    if not RESULTS_DB:
+        return None
+    with _store_lock:
+        if _store is None:
+            _store = ResultsStore(RESULTS_DB)
+        return _store
+
+
+def close_results_store():
+    """Flushes and closes the process-wide store (server shutdown)."""
+    global _store
+    with _store_lock:
+        store, _store = _store, None
+    if store is not None:
+        store.close()
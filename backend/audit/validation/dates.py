@@ -0,0 +1,137 @@
+import re
+
+
+# ============================================================
+# FAST-PATH DATE RECOGNIZER
+# Covers the formats seen in audit headers without dateutil:
+#   YYYY                    2024
+#   MM/DD/YY, MM/DD/YYYY    12/31/24, 1/5/2024
+#   DD/MM/YYYY              31/12/2023 (only when the day is > 12)
+#   Month D, YYYY           September 30, 2024 / Sept. 30 2024
+#   D Month YYYY            31 December 2023 / 31-Dec-2023
+#   Month YYYY              December 2023 / Dec. 2023 (day is None)
+#   ISO                     2024-09-30 (optionally with a time part)
+#   Excel serial            45565 / 45565.0 (1900 date system)
+# Calendar validity is checked arithmetically.
+# ============================================================
+
+KIND_YEAR = "year"
+KIND_MDY = "mdy"
+KIND_DMY = "dmy"
+KIND_TEXTUAL = "textual"
+KIND_MONTH_YEAR = "month_year"
+KIND_ISO = "iso"
+KIND_SERIAL = "serial"
+
+_RE_YEAR = re.compile(r"\d{4}")
+_RE_MDY = re.compile(r"(\d{1,2})/(\d{1,2})/(\d{2}|\d{4})")
+_RE_ISO = re.compile(r"(\d{4})-(\d{2})-(\d{2})(?:[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?)?")
+_RE_TEXTUAL = re.compile(r"([A-Za-z]{3,9})\.?\s+(\d{1,2}),?\s*(\d{4})")
+_RE_TEXTUAL_DAY_FIRST = re.compile(r"(\d{1,2})(?:\s+|-)([A-Za-z]{3,9})\.?(?:,?\s+|-)(\d{4})")
+_RE_MONTH_YEAR = re.compile(r"([A-Za-z]{3,9})\.?,?\s+(\d{4})")
+_RE_SERIAL = re.compile(r"(\d{5})(?:\.0+)?")
+
+MONTHS = {
+    "jan": 1, "january": 1,
+    "feb": 2, "february": 2,
+    "mar": 3, "march": 3,
+    "apr": 4, "april": 4,
+    "may": 5,
+    "jun": 6, "june": 6,
+    "jul": 7, "july": 7,
+    "aug": 8, "august": 8,
+    "sep": 9, "sept": 9, "september": 9,
+    "oct": 10, "october": 10,
+    "nov": 11, "november": 11,
+    "dec": 12, "december": 12,
+}
+
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+# Days from 0000-03-01 (proleptic Gregorian) to 1899-12-30, the Excel
+# epoch once its fictitious 1900-02-29 is accounted for.
+_EXCEL_EPOCH_DAYS = 693899
+
+
+def is_leap_year(year: int) -> bool:
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
+
+def is_valid_ymd(year: int, month: int, day: int) -> bool:
+    if not 1 <= month <= 12 or day < 1:
+        return False
+    if month == 2 and is_leap_year(year):
+        return day <= 29
+    return day <= _DAYS_IN_MONTH[month - 1]
+
+
+def expand_two_digit_year(yy: int) -> int:
+    """Same pivot as strptime's %y: 69–99 → 19xx, 00–68 → 20xx."""
+    return 1900 + yy if yy >= 69 else 2000 + yy
+
+
+def excel_serial_to_ymd(serial: int):
+    """Excel 1900-system serial → (y, m, d) via civil-from-days arithmetic."""
+    days = serial + _EXCEL_EPOCH_DAYS
+    era = days // 146097
+    doe = days - era * 146097
+    yoe = (doe - doe // 1460 + doe // 36524 - doe // 146096) // 365
+    doy = doe - (365 * yoe + yoe // 4 - yoe // 100)
+    mp = (5 * doy + 2) // 153
+    day = doy - (153 * mp + 2) // 5 + 1
+    month = mp + 3 if mp < 10 else mp - 9
+    year = yoe + era * 400 + (1 if month <= 2 else 0)
+    return year, month, day
+
+
+def recognize_date(value: str):
+    """
+    Returns (kind, year, month, day) for a recognized, calendar-valid date,
+    or None. For KIND_YEAR month and day are None, for KIND_MONTH_YEAR day.
+
+    Slash dates are month-first; one only reads day-first (KIND_DMY) when
+    its first number cannot be a month, so 01/02/2024 stays January 2.
+    """
+    if not value:
+        return None
+
+    if _RE_YEAR.fullmatch(value):
+        return KIND_YEAR, int(value), None, None
+
+    m = _RE_MDY.fullmatch(value)
+    if m:
+        month, day, year_s = int(m.group(1)), int(m.group(2)), m.group(3)
+        year = int(year_s) if len(year_s) == 4 else expand_two_digit_year(int(year_s))
+        if month > 12 and is_valid_ymd(year, day, month):
+            return KIND_DMY, year, day, month
+        return (KIND_MDY, year, month, day) if is_valid_ymd(year, month, day) else None
+
+    m = _RE_ISO.fullmatch(value)
+    if m:
+        year, month, day = int(m.group(1)), int(m.group(2)), int(m.group(3))
+        return (KIND_ISO, year, month, day) if is_valid_ymd(year, month, day) else None
+
+    m = _RE_TEXTUAL.fullmatch(value)
+    if m:
+        month_s, day_s, year_s = m.groups()
+    else:
+        m = _RE_TEXTUAL_DAY_FIRST.fullmatch(value)
+        if m:
+            day_s, month_s, year_s = m.groups()
+    if m:
+        month = MONTHS.get(month_s.lower())
+        if month is None:
+            return None
+        day, year = int(day_s), int(year_s)
+        return (KIND_TEXTUAL, year, month, day) if is_valid_ymd(year, month, day) else None
+
+    m = _RE_MONTH_YEAR.fullmatch(value)
+    if m:
+        month = MONTHS.get(m.group(1).lower())
+        return (KIND_MONTH_YEAR, int(m.group(2)), month, None) if month else None
+
+    m = _RE_SERIAL.fullmatch(value)
+    if m:
+        return (KIND_SERIAL,) + excel_serial_to_ymd(int(m.group(1)))
+
+    return None
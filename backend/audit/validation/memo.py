@@ -0,0 +1,89 @@
+import os
+from collections import Counter
+from functools import lru_cache
+
+
+# Max entries per (rule, field) cache. 0 disables memoization.
+RULE_CACHE_SIZE = int(os.environ.get("AUDIT_RULE_CACHE_SIZE", 4096))
+
+# (rule_func, field_name) -> lru_cache-wrapped validator
+_caches = {}
+
+# (rule_func, field_name) -> {raw value: FieldResult} for tiny closed domains
+_precomputed = {}
+_precomputed_hits = Counter()
+
+
+# ============================================================
+# NOTE:
+# Entries are keyed by (rule function, field name, raw value).
+# A rules change means a new process (RULES_VERSION is fixed at
+# import) or an explicit clear_rule_caches(); results are immutable
+# FieldResult objects, so sharing them across rows and documents
+# is safe.
+# ============================================================
+
+def cached_validate(compute, value: str, rule_func, field_name: str):
+    key = (rule_func, field_name)
+
+    table = _precomputed.get(key)
+    if table is not None:
+        result = table.get(value)
+        if result is not None:
+            _precomputed_hits[key] += 1
+            return result
+
+    cache = _caches.get(key)
+    if cache is None:
+        cache = _caches[key] = lru_cache(maxsize=RULE_CACHE_SIZE)(
+            lambda v: compute(v, rule_func, field_name)
+        )
+    return cache(value)
+
+
+def precompute(compute, rule_func, field_name: str, values):
+    """Seeds a lookup table for a rule whose accepted inputs are a small fixed set."""
+    _precomputed[(rule_func, field_name)] = {
+        v: compute(v, rule_func, field_name) for v in values
+    }
+
+
+def clear_rule_caches():
+    for cache in _caches.values():
+        cache.cache_clear()
+    _caches.clear()
+    _precomputed_hits.clear()
+
+
+def drop_rule_caches(rule_funcs):
+    """Evicts every cache/lookup table of `rule_funcs` (replaced tenant profiles)."""
+    rule_funcs = set(rule_funcs)
+    for table in (_caches, _precomputed, _precomputed_hits):
+        for key in [k for k in table if k[0] in rule_funcs]:
+            del table[key]
+
+
+def rule_cache_stats() -> dict:
+    """Per-rule hit/miss counters (this process only)."""
+    stats = {}
+    for key in set(_caches) | set(_precomputed):
+        rule_func, field_name = key
+        info = _caches[key].cache_info() if key in _caches else None
+
+        hits = _precomputed_hits[key] + (info.hits if info else 0)
+        misses = info.misses if info else 0
+        total = hits + misses
+
+        # Tenant profile rules are reported per profile: "Transaction Type@acme"
+        profile = getattr(rule_func, "profile", None)
+        label = f"{field_name}@{profile}" if profile else field_name
+
+        stats[label] = {
+            "rule": rule_func.__name__,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / total, 4) if total else 0.0,
+            "size": info.currsize if info else 0,
+            "precomputed": len(_precomputed.get(key, ())),
+        }
+    return stats
@@ -0,0 +1,159 @@
+from dataclasses import dataclass
+from enum import Enum
+from functools import lru_cache
+
+
+# ============================================================
+# FIELD STATUS
+# ============================================================
+
+class FieldStatus(str, Enum):
+    """
+    Interned field statuses. Members compare equal to (and serialize as)
+    their plain string values, so existing `== "FOUND_AND_VALID"` checks and
+    JSON output are unchanged.
+    """
+    VALID = "FOUND_AND_VALID"
+    INVALID = "FOUND_BUT_INVALID"
+    NOT_FOUND = "NOT_FOUND"
+
+    __str__ = str.__str__
+
+
+# ============================================================
+# FIELD RESULT
+# ============================================================
+
+@dataclass(frozen=True, slots=True)
+class FieldResult:
+    """
+    Result of validating one field. Immutable, so identical results can be
+    shared between rows and documents.
+
+    Supports read-only mapping access (result["status"], result.get("error"))
+    for code written against the previous dict representation.
+    """
+    status: FieldStatus
+    value: object
+    error: object
+
+    def __getitem__(self, key):
+        # Fields only: methods such as to_dict are not mapping keys
+        if isinstance(key, str) and key in self.__dataclass_fields__:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self):
+        return self.__slots__
+
+    def to_dict(self) -> dict:
+        return {"status": self.status.value, "value": self.value, "error": self.error}
+
+
+NOT_FOUND_RESULT = FieldResult(
+    FieldStatus.NOT_FOUND, None, "Field not extracted or empty."
+)
+
+
+# ============================================================
+# DISPLAY LABELS
+# ============================================================
+
+FIELD_LABELS = {
+    "company_name": "Company Name",
+    "year": "Year",
+    "completed_by": "Completed By",
+    "date": "Date",
+    "business_person_name": "Business Person Name",
+    "criteria_code": "Criteria Code",
+    "transaction_type": "Transaction Type",
+}
+
+
+@lru_cache(maxsize=256)
+def field_label(field: str) -> str:
+    label = FIELD_LABELS.get(field)
+    if label is None:
+        label = field.replace("_", " ").title()
+    return label
+
+
+# ============================================================
+# SERIALIZATION
+# ============================================================
+
+def json_default(obj):
+    """`default=` hook for json.dumps on validation results."""
+    to_dict = getattr(obj, "to_dict", None)
+    if to_dict is not None:
+        return to_dict()
+    return str(obj)
+
+
+def result_to_dict(result: dict) -> dict:
+    """
+    Converts a validate_document() result into plain JSON-ready dicts.
+    Walks the known shape directly instead of generic recursion.
+    """
+    page_1 = result.get("page_1") or {}
+    page_2 = result.get("page_2") or {}
+
+    out = dict(result)
+
+    if "fields" in page_1:
+        out["page_1"] = {
+            **page_1,
+            "fields": {k: r.to_dict() for k, r in page_1["fields"].items()},
+        }
+
+    if "rows" in page_2:
+        out["page_2"] = {
+            **page_2,
+            "rows": [
+                {
+                    "row_number": row["row_number"],
+                    "fields": {k: r.to_dict() for k, r in row["fields"].items()},
+                }
+                for row in page_2["rows"]
+            ],
+        }
+
+    return out
+
+
+def field_result_from_dict(data: dict) -> FieldResult:
+    return FieldResult(FieldStatus(data["status"]), data.get("value"), data.get("error"))
+
+
+def result_from_dict(data: dict) -> dict:
+    """Inverse of result_to_dict(): FieldResult objects back in place."""
+    page_1 = data.get("page_1") or {}
+    page_2 = data.get("page_2") or {}
+
+    out = dict(data)
+
+    if "fields" in page_1:
+        out["page_1"] = {
+            **page_1,
+            "fields": {k: field_result_from_dict(r) for k, r in page_1["fields"].items()},
+        }
+
+    if "rows" in page_2:
+        out["page_2"] = {
+            **page_2,
+            "rows": [
+                {
+                    "row_number": row["row_number"],
+                    "fields": {k: field_result_from_dict(r) for k, r in row["fields"].items()},
+                }
+                for row in page_2["rows"]
+            ],
+        }
+
+    return out
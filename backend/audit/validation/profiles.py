@@ -0,0 +1,289 @@
+import hashlib
+import json
+import os
+import threading
+
+from .memo import precompute, drop_rule_caches
+from .rules import (
+    make_date_rule,
+    make_year_period_rule,
+    make_criteria_code_rule,
+    make_transaction_type_rule,
+)
+from .validator import PAGE_1_FIELDS, PAGE_2_FIELDS, _validate_field_uncached
+from .version import RULES_VERSION
+
+
+# ============================================================
+# TENANT RULE PROFILES
+# One JSON file per tenant in AUDIT_PROFILES_DIR, e.g. acme.json:
+#
+#   {
+#     "transaction_types": ["shareholder", "officer", "trustee"],
+#     "criteria_codes": ["1.a", "1.b", "2.a"],
+#     "date_formats": ["dmy", "iso"]
+#   }
+#
+# Every key is optional; missing keys keep the built-in rule.
+# Profiles are compiled once into field tables and swapped in
+# atomically when their file changes. Request-time lookup is a
+# single dict access, never a filesystem check.
+# ============================================================
+
+PROFILES_DIR = os.environ.get("AUDIT_PROFILES_DIR")
+PROFILES_POLL_SECONDS = float(os.environ.get("AUDIT_PROFILES_POLL_SECONDS", 2))
+
+DEFAULT_PROFILE_NAME = "default"
+
+PROFILE_KEYS = ("transaction_types", "criteria_codes", "date_formats")
+
+
+class RuleProfile:
+    """Compiled rule set: the validator's field tables with tenant rules swapped in."""
+
+    def __init__(self, name: str, page_1_fields, page_2_fields, version: str):
+        self.name = name
+        self.page_1_fields = page_1_fields
+        self.page_2_fields = page_2_fields
+        self.version = version
+
+    @property
+    def rules_version(self) -> str:
+        """Cache key for stored results (batch manifest)."""
+        if self.name == DEFAULT_PROFILE_NAME:
+            return RULES_VERSION
+        return f"{RULES_VERSION}+{self.name}:{self.version}"
+
+    def rule_funcs(self):
+        return [f[2] for f in self.page_1_fields + self.page_2_fields]
+
+
+DEFAULT_PROFILE = RuleProfile(DEFAULT_PROFILE_NAME, PAGE_1_FIELDS, PAGE_2_FIELDS, RULES_VERSION)
+
+# tenant -> RuleProfile; replaced as a whole on reload, never mutated
+_profiles = {}
+_signatures = {}  # file name -> (mtime_ns, size)
+_loaded = False
+_reload_lock = threading.Lock()
+_watcher = None
+
+
+# ============================================================
+# COMPILE
+# ============================================================
+
+def _replace_rule(fields, field_name: str, rule_func):
+    return tuple(
+        (key, source, rule_func, name) if name == field_name else (key, source, rule, name)
+        for key, source, rule, name in fields
+    )
+
+
+def compile_profile(name: str, config: dict, version: str) -> RuleProfile:
+    """Builds a RuleProfile from a parsed profile file. Raises ValueError on bad config."""
+    if not isinstance(config, dict):
+        raise ValueError("Profile must be a JSON object.")
+
+    unknown = sorted(set(config) - set(PROFILE_KEYS))
+    if unknown:
+        raise ValueError(f"Unknown profile keys: {unknown}. Allowed: {list(PROFILE_KEYS)}")
+
+    for key in PROFILE_KEYS:
+        if key in config:
+            values = config[key]
+            if not isinstance(values, list) or not values or not all(isinstance(v, str) for v in values):
+                raise ValueError(f"'{key}' must be a non-empty list of strings.")
+
+    page_1_fields = PAGE_1_FIELDS
+    page_2_fields = PAGE_2_FIELDS
+    new_rules = []
+
+    if "date_formats" in config:
+        rule = make_date_rule(config["date_formats"])
+        page_1_fields = _replace_rule(page_1_fields, "Date", rule)
+        new_rules.append(("Date", rule, None))
+
+        # Year / Period End reads DD/MM vs MM/DD the same way
+        rule = make_year_period_rule(config["date_formats"])
+        page_1_fields = _replace_rule(page_1_fields, "Year Period", rule)
+        new_rules.append(("Year Period", rule, None))
+
+    if "criteria_codes" in config:
+        rule = make_criteria_code_rule(config["criteria_codes"])
+        page_2_fields = _replace_rule(page_2_fields, "Criteria Code", rule)
+        new_rules.append((
+            "Criteria Code", rule,
+            [v for code in rule.codes for v in (code, code.upper())],
+        ))
+
+    if "transaction_types" in config:
+        rule = make_transaction_type_rule(config["transaction_types"])
+        page_2_fields = _replace_rule(page_2_fields, "Transaction Type", rule)
+        new_rules.append((
+            "Transaction Type", rule,
+            [v for t in rule.allowed for v in (t, t.title(), t.upper())],
+        ))
+
+    for field_name, rule, closed_domain in new_rules:
+        rule.__name__ = f"{field_name.lower().replace(' ', '_')}_rule"
+        rule.profile = name
+        if closed_domain:
+            precompute(_validate_field_uncached, rule, field_name, closed_domain)
+
+    return RuleProfile(name, page_1_fields, page_2_fields, version)
+
+
+def _load_file(path: str, name: str) -> RuleProfile:
+    with open(path, "rb") as f:
+        raw = f.read()
+    return compile_profile(name, json.loads(raw), hashlib.sha256(raw).hexdigest()[:16])
+
+
+# ============================================================
+# LOAD / RELOAD
+# ============================================================
+
+def _scan(directory: str) -> dict:
+    signatures = {}
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.endswith(".json") and entry.is_file():
+                    st = entry.stat()
+                    signatures[entry.name] = (st.st_mtime_ns, st.st_size)
+    except FileNotFoundError:
+        print(f"Profiles directory not found: {directory}")
+    return signatures
+
+
+def reload_profiles(directory: str = None) -> dict:
+    """
+    Recompiles changed/new profile files and drops deleted ones. A file that
+    fails to parse keeps its previously compiled version. Returns
+    {"loaded": [...], "removed": [...], "errors": {name: message}}.
+    """
+    global _profiles, _signatures, _loaded
+
+    directory = directory or PROFILES_DIR
+    report = {"loaded": [], "removed": [], "errors": {}}
+
+    with _reload_lock:
+        _loaded = True
+        if not directory:
+            return report
+
+        signatures = _scan(directory)
+        profiles = dict(_profiles)
+        retired = []
+
+        for file_name, signature in signatures.items():
+            if _signatures.get(file_name) == signature:
+                continue
+
+            name = file_name[:-len(".json")]
+            if name == DEFAULT_PROFILE_NAME:
+                report["errors"][name] = "Profile name 'default' is reserved."
+                continue
+
+            try:
+                profile = _load_file(os.path.join(directory, file_name), name)
+            except (OSError, ValueError) as e:
+                print(f"Rule profile '{name}' not loaded: {e}")
+                report["errors"][name] = str(e)
+                continue
+
+            if name in profiles:
+                retired.append(profiles[name])
+            profiles[name] = profile
+            report["loaded"].append(name)
+
+        for file_name in set(_signatures) - set(signatures):
+            name = file_name[:-len(".json")]
+            if name in profiles:
+                retired.append(profiles.pop(name))
+                report["removed"].append(name)
+
+        # Single reference swap: readers see the old or the new mapping.
+        _profiles = profiles
+        _signatures = signatures
+
+        for profile in retired:
+            drop_rule_caches(
+                f for f in profile.rule_funcs() if getattr(f, "profile", None)
+            )
+
+    if report["loaded"] or report["removed"]:
+        print(f"Rule profiles reloaded: {report}")
+    return report
+
+
+def get_profile(tenant: str = None):
+    """
+    O(1) hot-path lookup. None/"" → the built-in profile; an unknown tenant
+    → None (the caller decides how to reject it).
+    """
+    if not tenant or tenant == DEFAULT_PROFILE_NAME:
+        return DEFAULT_PROFILE
+    if not _loaded:
+        reload_profiles()
+    return _profiles.get(tenant)
+
+
+def resolve_profile(tenant: str = None) -> RuleProfile:
+    profile = get_profile(tenant)
+    if profile is None:
+        raise ValueError(f"Unknown rule profile: {tenant}. Available: {list_profiles()}")
+    return profile
+
+
+def list_profiles() -> dict:
+    if not _loaded:
+        reload_profiles()
+    profiles = {DEFAULT_PROFILE_NAME: DEFAULT_PROFILE}
+    profiles.update(_profiles)
+    return {name: p.version for name, p in sorted(profiles.items())}
+
+
+# ============================================================
+# HOT RELOAD
+# ============================================================
+
+def _watch(directory: str, interval: float, stop: threading.Event):
+    while not stop.wait(interval):
+        try:
+            reload_profiles(directory)
+        except Exception as e:
+            print(f"Rule profile reload failed: {e}")
+
+
+def start_profile_watcher(directory: str = None, interval: float = PROFILES_POLL_SECONDS):
+    """
+    Loads the profiles and starts a daemon thread that polls the directory
+    (one stat per file per interval) and hot-swaps changed profiles.
+    Returns the stop Event, or None when no directory is configured.
+    """
+    global _watcher
+
+    directory = directory or PROFILES_DIR
+    reload_profiles(directory)
+    if not directory or interval <= 0:
+        return None
+
+    if _watcher is not None:
+        return _watcher
+
+    stop = threading.Event()
+    thread = threading.Thread(
+        target=_watch, args=(directory, interval, stop),
+        name="rule-profile-watcher", daemon=True,
+    )
+    thread.start()
+    _watcher = stop
+    return stop
+
+
+def stop_profile_watcher():
+    global _watcher
+    if _watcher is not None:
+        _watcher.set()
+        _watcher = None
@@ -1,10 +1,18 @@
+import os
 import re
-from datetime import datetime
 
-try:
-    from dateutil import parser as date_parser
-except ImportError:
-    date_parser = None
+from .dates import recognize_date, is_valid_ymd, expand_two_digit_year, KIND_YEAR, KIND_MDY
+
+# dateutil is slow and very permissive; it is only consulted as a last
+# resort when explicitly enabled.
+DATEUTIL_FALLBACK = os.environ.get("AUDIT_DATEUTIL_FALLBACK") == "1"
+
+date_parser = None
+if DATEUTIL_FALLBACK:
+    try:
+        from dateutil import parser as date_parser
+    except ImportError:
+        date_parser = None
 
 
 # ============================================================
@@ -50,15 +58,21 @@ def validate_year_period_rule(value):
     if not val_str:
         return False, "Empty value."
 
-    # YYYY
-    if re.match(r"^\d{4}$", val_str):
-        return True, None
+    recognized = recognize_date(val_str)
+    if recognized is not None:
+        kind, year, _, _ = recognized
 
-    # MM/DD/YY or MM/DD/YYYY
-    if re.match(REGEX_DATE_MMDDYYYY, val_str):
-        return True, None
+        # YYYY / MM/DD/YY(YY): format alone is enough
+        if kind in (KIND_YEAR, KIND_MDY):
+            return True, None
 
-    # Full textual date
+        # Textual, ISO, Excel serial
+        if 1900 < year < 2100:
+            return True, None
+
+        return False, "Invalid Year / Period End format."
+
+    # Opt-in last resort
     if date_parser:
         try:
             dt = date_parser.parse(val_str)
@@ -95,11 +109,9 @@ def validate_date_rule(value: str):
     if not re.match(REGEX_DATE_MMDDYYYY, val_clean):
         return False, "Date must be in MM/DD/YY or MM/DD/YYYY format."
 
-    try:
-        year_part = val_clean.split("/")[-1]
-        fmt = "%m/%d/%Y" if len(year_part) == 4 else "%m/%d/%y"
-        datetime.strptime(val_clean, fmt)
-    except ValueError:
+    month, day, year = val_clean.split("/")
+    year = int(year) if len(year) == 4 else expand_two_digit_year(int(year))
+    if not is_valid_ymd(year, int(month), int(day)):
         return False, "Invalid calendar date."
 
     return True, None
@@ -123,9 +135,13 @@ def validate_business_name(value: str):
     return True, None
 
 
+# Full domain of REGEX_CRITERIA_CODE (12 values) as a lookup table
+CRITERIA_CODES = frozenset(f"{n}.{c}" for n in "12" for c in "abcdef")
+
+
 def validate_criteria_code(value: str):
     val_clean = str(value).strip().lower()
-    if not re.match(REGEX_CRITERIA_CODE, val_clean):
+    if val_clean not in CRITERIA_CODES:
         return False, "Criteria Code must be in format 1.a – 2.f."
 
     return True, None
@@ -150,3 +166,118 @@ def validate_transaction_type(value: str):
         return False, f"Transaction Type must be one of {sorted(ALLOWED_TRANSACTION_TYPES)}"
 
     return True, None
+
+
+# ============================================================
+# RULE FACTORIES (TENANT PROFILES)
+# Same checks as above with tenant-specific domains. The default
+# profile keeps using the module-level rules unchanged.
+# ============================================================
+
+# Date: DD/MM/YY or DD/MM/YYYY
+REGEX_DATE_DDMMYYYY = r"^(0[1-9]|[12]\d|3[01])/(0[1-9]|1[0-2])/(\d{2}|\d{4})$"
+
+DATE_FORMAT_LABELS = {
+    "mdy": "MM/DD/YY or MM/DD/YYYY",
+    "dmy": "DD/MM/YY or DD/MM/YYYY",
+    "iso": "YYYY-MM-DD",
+    "textual": "Month D, YYYY",
+}
+
+
+def _slash_date_ymd(val_clean: str, pattern: str, day_first: bool):
+    if not re.match(pattern, val_clean):
+        return None
+    a, b, year = val_clean.split("/")
+    month, day = (b, a) if day_first else (a, b)
+    year = int(year) if len(year) == 4 else expand_two_digit_year(int(year))
+    return year, int(month), int(day)
+
+
+def make_date_rule(formats):
+    """Date rule accepting any of `formats` (keys of DATE_FORMAT_LABELS)."""
+    formats = tuple(formats)
+    unknown = [f for f in formats if f not in DATE_FORMAT_LABELS]
+    if unknown or not formats:
+        raise ValueError(f"Unknown date formats: {unknown}. Allowed: {list(DATE_FORMAT_LABELS)}")
+
+    message = "Date must be in " + " or ".join(DATE_FORMAT_LABELS[f] for f in formats) + " format."
+
+    def rule(value: str):
+        if not isinstance(value, str):
+            return False, "Invalid type."
+
+        val_clean = value.strip()
+        for fmt in formats:
+            if fmt == "mdy":
+                ymd = _slash_date_ymd(val_clean, REGEX_DATE_MMDDYYYY, day_first=False)
+            elif fmt == "dmy":
+                ymd = _slash_date_ymd(val_clean, REGEX_DATE_DDMMYYYY, day_first=True)
+            else:
+                recognized = recognize_date(val_clean)
+                ymd = recognized[1:] if recognized and recognized[0] == fmt else None
+
+            if ymd is not None:
+                if not is_valid_ymd(*ymd):
+                    return False, "Invalid calendar date."
+                return True, None
+
+        return False, message
+
+    return rule
+
+
+_RE_SLASH_DATE = re.compile(r"(\d{1,2})/(\d{1,2})/(\d{2}|\d{4})")
+
+
+def make_year_period_rule(formats):
+    """
+    Year / Period End rule reading slash dates in the day/month orders of
+    `formats` (mdy, dmy); everything else as validate_year_period_rule,
+    which also handles slash dates when `formats` has no slash order.
+    """
+    orders = [f for f in formats if f in ("mdy", "dmy")]
+
+    def rule(value):
+        val_str = str(value).strip() if value else ""
+        m = _RE_SLASH_DATE.fullmatch(val_str)
+        if m is None or not orders:
+            return validate_year_period_rule(value)
+
+        a, b, year_s = int(m.group(1)), int(m.group(2)), m.group(3)
+        year = int(year_s) if len(year_s) == 4 else expand_two_digit_year(int(year_s))
+        for fmt in orders:
+            month, day = (b, a) if fmt == "dmy" else (a, b)
+            if is_valid_ymd(year, month, day):
+                return True, None
+        return False, "Invalid Year / Period End format."
+
+    return rule
+
+
+def make_criteria_code_rule(codes):
+    codes = frozenset(c.strip().lower() for c in codes)
+    message = f"Criteria Code must be one of {sorted(codes)}."
+
+    def rule(value: str):
+        if str(value).strip().lower() not in codes:
+            return False, message
+        return True, None
+
+    rule.codes = codes
+    return rule
+
+
+def make_transaction_type_rule(allowed):
+    allowed = frozenset(t.strip().lower() for t in allowed)
+    message = f"Transaction Type must be one of {sorted(allowed)}"
+
+    def rule(value: str):
+        if not isinstance(value, str):
+            return False, "Invalid type."
+        if value.strip().lower() not in allowed:
+            return False, message
+        return True, None
+
+    rule.allowed = allowed
+    return rule
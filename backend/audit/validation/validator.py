@@ -7,6 +7,9 @@ from .rules import (
     validate_criteria_code,
     validate_transaction_type
 )
+from .models import FieldStatus, FieldResult, NOT_FOUND_RESULT
+from .memo import cached_validate, precompute
+from .rules import CRITERIA_CODES, ALLOWED_TRANSACTION_TYPES
 
 # ============================================================
 # STATUS CONSTANTS
@@ -17,9 +20,9 @@ STATUS_FAIL = "FAIL"
 STATUS_PARTIAL_PASS = "PARTIAL_PASS"
 STATUS_INSUFFICIENT_DATA = "INSUFFICIENT_DATA"
 
-FIELD_STATUS_VALID = "FOUND_AND_VALID"
-FIELD_STATUS_INVALID = "FOUND_BUT_INVALID"
-FIELD_STATUS_NOT_FOUND = "NOT_FOUND"
+FIELD_STATUS_VALID = FieldStatus.VALID
+FIELD_STATUS_INVALID = FieldStatus.INVALID
+FIELD_STATUS_NOT_FOUND = FieldStatus.NOT_FOUND
 
 # ============================================================
 # NORMALIZATION UTILS
@@ -40,15 +43,22 @@ def clean_value(value):
 # FIELD VALIDATION (CORE ENGINE)
 # ============================================================
 
-def validate_field(value, rule_func, field_name):
+def validate_field(value, rule_func, field_name) -> FieldResult:
+    """
+    Memoized per (rule, field): repeated raw values (business names,
+    criteria codes, transaction types) are validated once per process.
+    """
+    if not isinstance(value, str):
+        return NOT_FOUND_RESULT
+
+    return cached_validate(_validate_field_uncached, value, rule_func, field_name)
+
+
+def _validate_field_uncached(value, rule_func, field_name) -> FieldResult:
     cleaned_val = clean_value(value)
 
     if cleaned_val is None:
-        return {
-            "status": FIELD_STATUS_NOT_FOUND,
-            "value": None,
-            "error": "Field not extracted or empty."
-        }
+        return NOT_FOUND_RESULT
 
     is_valid, err = rule_func(cleaned_val)
 
@@ -56,51 +66,75 @@ def validate_field(value, rule_func, field_name):
         if field_name == "Criteria Code":
             cleaned_val = cleaned_val.lower()
 
-        return {
-            "status": FIELD_STATUS_VALID,
-            "value": cleaned_val,
-            "error": None
-        }
+        return FieldResult(FIELD_STATUS_VALID, cleaned_val, None)
 
-    return {
-        "status": FIELD_STATUS_INVALID,
-        "value": cleaned_val,
-        "error": err
-    }
+    return FieldResult(FIELD_STATUS_INVALID, cleaned_val, err)
+
+# ============================================================
+# VALIDATION MODES
+# ============================================================
+
+# full      : every field of every page/row is validated
+# fail_fast : stop at the first FOUND_BUT_INVALID (outcome is already FAIL)
+MODE_FULL = "full"
+MODE_FAIL_FAST = "fail_fast"
+VALIDATION_MODES = (MODE_FULL, MODE_FAIL_FAST)
+
+# ============================================================
+# FIELD TABLES
+# (result key, normalized payload key, rule, field name)
+# ============================================================
+
+PAGE_1_FIELDS = (
+    ("company_name", "company_name", validate_company_name_rule, "Company Name"),
+    ("year", "year_period_end", validate_year_period_rule, "Year Period"),
+    ("completed_by", "completed_by", validate_completed_by_rule, "Completed By"),
+    ("date", "date", validate_date_rule, "Date"),
+)
+
+PAGE_2_FIELDS = (
+    ("business_person_name", "business_name", validate_business_name, "Business Name"),
+    ("criteria_code", "criteria_code", validate_criteria_code, "Criteria Code"),
+    ("transaction_type", "transaction_type", validate_transaction_type, "Transaction Type"),
+)
+
+# Closed domains are answered from lookup tables (common spellings only;
+# anything else falls through to the LRU cache).
+precompute(
+    _validate_field_uncached, validate_criteria_code, "Criteria Code",
+    [v for code in CRITERIA_CODES for v in (code, code.upper())],
+)
+precompute(
+    _validate_field_uncached, validate_transaction_type, "Transaction Type",
+    [v for t in ALLOWED_TRANSACTION_TYPES for v in (t, t.title(), t.upper())],
+)
 
 # ============================================================
 # PAGE 1 VALIDATION (DIRECT – ACROFORM)
 # ============================================================
 
-def validate_page_1(data: dict):
-    return {
-        "company_name": validate_field(
-            data.get("company_name"),
-            validate_company_name_rule,
-            "Company Name"
-        ),
-        "year": validate_field(
-            data.get("year_period_end"),
-            validate_year_period_rule,
-            "Year Period"
-        ),
-        "completed_by": validate_field(
-            data.get("completed_by"),
-            validate_completed_by_rule,
-            "Completed By"
-        ),
-        "date": validate_field(
-            data.get("date"),
-            validate_date_rule,
-            "Date"
-        )
-    }
+def validate_page_1(data: dict, fail_fast: bool = False, fields=PAGE_1_FIELDS):
+    results = {}
+    for key, source, rule_func, field_name in fields:
+        result = validate_field(data.get(source), rule_func, field_name)
+        results[key] = result
+        if fail_fast and result.status is FIELD_STATUS_INVALID:
+            break
+    return results
+
+
+def page_1_fails(data: dict, fields=PAGE_1_FIELDS) -> bool:
+    """True if the Page-1 header alone already decides a FAIL."""
+    return any(
+        r.status is FIELD_STATUS_INVALID
+        for r in validate_page_1(data or {}, fail_fast=True, fields=fields).values()
+    )
 
 # ============================================================
 # PAGE 2 VALIDATION (NORMALIZED TABLE DATA)
 # ============================================================
 
-def validate_page_2(data: dict):
+def validate_page_2(data: dict, fail_fast: bool = False, fields=PAGE_2_FIELDS):
     rows = data.get("rows", [])
 
     # Case 1: Page-2 present but empty → FAIL
@@ -122,37 +156,82 @@ def validate_page_2(data: dict):
     validated_rows = []
 
     for idx, row in enumerate(rows):
+        row_fields = {}
+        failed = False
+        for key, source, rule_func, field_name in fields:
+            result = validate_field(row.get(source), rule_func, field_name)
+            row_fields[key] = result
+            if fail_fast and result.status is FIELD_STATUS_INVALID:
+                failed = True
+                break
+
         validated_rows.append({
             "row_number": idx + 1,
-            "fields": {
-                "business_person_name": validate_field(
-                    row.get("business_name"),
-                    validate_business_name,
-                    "Business Name"
-                ),
-                "criteria_code": validate_field(
-                    row.get("criteria_code"),
-                    validate_criteria_code,
-                    "Criteria Code"
-                ),
-                "transaction_type": validate_field(
-                    row.get("transaction_type"),
-                    validate_transaction_type,
-                    "Transaction Type"
-                )
-            }
+            "fields": row_fields
         })
 
+        if failed:
+            break
+
     return {
         "status": STATUS_PASS,
         "rows": validated_rows
     }
 
+# ============================================================
+# AGGREGATION
+# ============================================================
+
+def _collect_page_1(page_1_result: dict, all_statuses: list, all_errors: list):
+    for field, result in page_1_result.items():
+        all_statuses.append(result.status)
+        if result.error:
+            all_errors.append(f"Page 1 {field}: {result.error}")
+
+
+def _collect_page_2(page_2_result: dict, all_statuses: list, all_errors: list):
+    # Page-2 structural failure must affect overall status
+    if page_2_result.get("status") == STATUS_FAIL:
+        all_statuses.append(FIELD_STATUS_INVALID)
+        all_errors.append(page_2_result.get("detail"))
+
+    if "rows" in page_2_result:
+        for row in page_2_result["rows"]:
+            for field, result in row["fields"].items():
+                all_statuses.append(result.status)
+                if result.error:
+                    all_errors.append(
+                        f"Page 2 Row {row['row_number']} {field}: {result.error}"
+                    )
+
+
+def _overall_status(all_statuses: list) -> str:
+    if FIELD_STATUS_INVALID in all_statuses:
+        return STATUS_FAIL
+    if FIELD_STATUS_NOT_FOUND in all_statuses:
+        return STATUS_PARTIAL_PASS
+    return STATUS_PASS
+
 # ============================================================
 # DOCUMENT VALIDATION (FINAL ENTRY POINT)
 # ============================================================
 
-def validate_document(normalized_content: dict):
+def validate_document(normalized_content: dict, mode: str = MODE_FULL, profile=None):
+    """
+    mode="fail_fast" stops at the first FOUND_BUT_INVALID field: Page 2 is
+    not validated at all when Page 1 already fails. The result then carries
+    "stopped_early": True and only the checks performed so far.
+
+    profile: a tenant RuleProfile (see profiles.py); None uses the built-in
+    field tables.
+    """
+    if mode not in VALIDATION_MODES:
+        raise ValueError(f"Unknown validation mode: {mode}. Allowed: {list(VALIDATION_MODES)}")
+
+    page_1_fields = profile.page_1_fields if profile is not None else PAGE_1_FIELDS
+    page_2_fields = profile.page_2_fields if profile is not None else PAGE_2_FIELDS
+
+    fail_fast = mode == MODE_FAIL_FAST
     all_errors = []
     all_statuses = []
 
@@ -169,45 +248,37 @@ def validate_document(normalized_content: dict):
             "errors": ["Page 1 header data missing."]
         }
 
-    page_1_result = validate_page_1(page_1_data)
+    page_1_result = validate_page_1(page_1_data, fail_fast, page_1_fields)
+    _collect_page_1(page_1_result, all_statuses, all_errors)
 
-    for field, result in page_1_result.items():
-        all_statuses.append(result["status"])
-        if result["error"]:
-            all_errors.append(f"Page 1 {field}: {result['error']}")
+    if fail_fast and FIELD_STATUS_INVALID in all_statuses:
+        return {
+            "overall_status": STATUS_FAIL,
+            "page_1": {
+                "fields": page_1_result
+            },
+            "page_2": {},
+            "errors": all_errors,
+            "stopped_early": True
+        }
 
     # -------------------------------
     # Page 2
     # -------------------------------
     page_2_result = validate_page_2(
-        normalized_content.get("page_2", {})
+        normalized_content.get("page_2", {}),
+        fail_fast,
+        page_2_fields
     )
 
-    # Page-2 structural failure must affect overall status
-    if page_2_result.get("status") == STATUS_FAIL:
-        all_statuses.append(FIELD_STATUS_INVALID)
-        all_errors.append(page_2_result.get("detail"))
-
-    if "rows" in page_2_result:
-        for row in page_2_result["rows"]:
-            for field, result in row["fields"].items():
-                all_statuses.append(result["status"])
-                if result["error"]:
-                    all_errors.append(
-                        f"Page 2 Row {row['row_number']} {field}: {result['error']}"
-                    )
+    _collect_page_2(page_2_result, all_statuses, all_errors)
 
     # -------------------------------
     # Final aggregation
     # -------------------------------
-    if FIELD_STATUS_INVALID in all_statuses:
-        overall_status = STATUS_FAIL
-    elif FIELD_STATUS_NOT_FOUND in all_statuses:
-        overall_status = STATUS_PARTIAL_PASS
-    else:
-        overall_status = STATUS_PASS
+    overall_status = _overall_status(all_statuses)
 
-    return {
+    result = {
         "overall_status": overall_status,
         "page_1": {
             "fields": page_1_result
@@ -215,3 +286,115 @@ def validate_document(normalized_content: dict):
         "page_2": page_2_result,
         "errors": all_errors
     }
+
+    if fail_fast:
+        result["stopped_early"] = overall_status == STATUS_FAIL
+
+    return result
+
+# ============================================================
+# CORRECTIONS (NO RE-INGEST)
+# ============================================================
+
+def apply_corrections(normalized_content: dict, previous: dict, corrections: dict,
+                      profile=None, reuse: bool = True):
+    """
+    Re-validates a document after the user fixed some field values.
+
+    corrections: {"page_1": {result key: value},
+                  "rows": {row_number: {result key: value}}}
+    using the keys of the validation result ("date", "criteria_code", ...).
+
+    Only corrected fields (and fields a fail_fast run never reached) go
+    through validate_field(); every other FieldResult is taken from
+    `previous`. reuse=False re-validates everything (rules changed since).
+    The outcome is always a full-mode result.
+
+    Returns (corrected normalized content, new result). Raises ValueError
+    for unknown fields or rows.
+    """
+    page_1_fields = profile.page_1_fields if profile is not None else PAGE_1_FIELDS
+    page_2_fields = profile.page_2_fields if profile is not None else PAGE_2_FIELDS
+
+    page_1_data = dict(normalized_content.get("page_1") or {})
+    rows_data = [dict(row) for row in (normalized_content.get("page_2") or {}).get("rows", [])]
+
+    page_1_sources = {key: source for key, source, _, _ in page_1_fields}
+    page_2_sources = {key: source for key, source, _, _ in page_2_fields}
+
+    # -------------------------------
+    # Apply corrected values
+    # -------------------------------
+    changed_page_1 = set()
+    for key, value in (corrections.get("page_1") or {}).items():
+        if key not in page_1_sources:
+            raise ValueError(f"Unknown Page 1 field: {key}")
+        page_1_data[page_1_sources[key]] = value
+        changed_page_1.add(key)
+
+    changed_rows = {}
+    for row_number, fields in (corrections.get("rows") or {}).items():
+        row_number = int(row_number)
+        if not 1 <= row_number <= len(rows_data):
+            raise ValueError(f"Unknown Page 2 row: {row_number}")
+        for key, value in fields.items():
+            if key not in page_2_sources:
+                raise ValueError(f"Unknown Page 2 field: {key}")
+            rows_data[row_number - 1][page_2_sources[key]] = value
+            changed_rows.setdefault(row_number, set()).add(key)
+
+    corrected = {"page_1": page_1_data, "page_2": {"rows": rows_data}}
+
+    if not reuse:
+        return corrected, validate_document(corrected, MODE_FULL, profile)
+
+    # -------------------------------
+    # Page 1: corrected / missing fields only
+    # -------------------------------
+    old_page_1 = (previous.get("page_1") or {}).get("fields", {})
+    page_1_result = {}
+    for key, source, rule_func, field_name in page_1_fields:
+        old = old_page_1.get(key)
+        if old is None or key in changed_page_1:
+            old = validate_field(page_1_data.get(source), rule_func, field_name)
+        page_1_result[key] = old
+
+    # -------------------------------
+    # Page 2: structural checks are unchanged (no rows added or removed)
+    # -------------------------------
+    old_page_2 = previous.get("page_2") or {}
+    if len(rows_data) < 2:
+        page_2_result = validate_page_2(corrected["page_2"], fields=page_2_fields)
+    else:
+        old_rows = {row["row_number"]: row["fields"] for row in old_page_2.get("rows", [])}
+        validated_rows = []
+        for idx, row in enumerate(rows_data):
+            row_number = idx + 1
+            old_fields = old_rows.get(row_number, {})
+            changed = changed_rows.get(row_number, ())
+            row_fields = {}
+            for key, source, rule_func, field_name in page_2_fields:
+                old = old_fields.get(key)
+                if old is None or key in changed:
+                    old = validate_field(row.get(source), rule_func, field_name)
+                row_fields[key] = old
+            validated_rows.append({"row_number": row_number, "fields": row_fields})
+
+        page_2_result = {"status": STATUS_PASS, "rows": validated_rows}
+
+    # -------------------------------
+    # Aggregation (same as validate_document)
+    # -------------------------------
+    all_statuses = []
+    all_errors = []
+    _collect_page_1(page_1_result, all_statuses, all_errors)
+    _collect_page_2(page_2_result, all_statuses, all_errors)
+
+    return corrected, {
+        "overall_status": _overall_status(all_statuses),
+        "page_1": {
+            "fields": page_1_result
+        },
+        "page_2": page_2_result,
+        "errors": all_errors
+    }
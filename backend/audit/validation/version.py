@@ -0,0 +1,24 @@
+import hashlib
+import os
+
+# Every module of the validation package can decide outcomes (rules,
+# dates, memoization, result model, ...), so all of them are hashed. Any
+# edit invalidates results cached by fingerprint (batch manifest,
+# memoized rules, coalesced uploads).
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _rule_sources() -> list:
+    return sorted(name for name in os.listdir(_PACKAGE_DIR) if name.endswith(".py"))
+
+
+def _compute_rules_version() -> str:
+    digest = hashlib.sha256()
+    for name in _rule_sources():
+        digest.update(name.encode() + b"\0")
+        with open(os.path.join(_PACKAGE_DIR, name), "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+RULES_VERSION = _compute_rules_version()
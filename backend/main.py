@@ -1,9 +1,35 @@
+import os
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from .api import routes
+from .api.compression import CompressionMiddleware
 from .api.routes import router as validation_router
 
-app = FastAPI(title="Audit Header Validator")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Set by backend.server when workers are spawned (no pre-fork sharing),
+    # so every worker warms its own loaders before taking traffic.
+    if os.environ.get("AUDIT_WARM_START") == "1":
+        from .server import warm_up
+        warm_up()
+
+    # Tenant rule profiles: loaded per worker, hot-reloaded on file change.
+    from .audit.validation.profiles import start_profile_watcher, stop_profile_watcher
+    start_profile_watcher()
+    yield
+    stop_profile_watcher()
+
+    from .audit.ingestion.sandbox import shutdown_sandbox
+    shutdown_sandbox()
+
+    from .audit.results_store import close_results_store
+    close_results_store()
+
+
+app = FastAPI(title="Audit Header Validator", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -13,6 +39,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# gzip / zstd request bodies and JSON responses
+app.add_middleware(CompressionMiddleware)
+
 app.include_router(routes.router, prefix="/api")
 app.include_router(validation_router, prefix="/api")
 
@@ -0,0 +1,277 @@
+"""
+Production server entry point.
+
+    python -m backend.server --workers 4 --max-requests 500
+
+On POSIX with gunicorn installed the app is imported (and warmed up) once in
+the master process before forking, so pandas / pdfplumber / pypdf / docx pages
+are shared copy-on-write between workers. Otherwise (Windows, no gunicorn) it
+falls back to uvicorn's own multi-process supervisor, where each worker warms
+itself up on startup.
+
+Workers are recycled after --max-requests requests (plus random jitter) so
+memory growth from PDF parsing cannot accumulate forever.
+"""
+
+import argparse
+import importlib
+import io
+import os
+import tempfile
+
+from backend.audit.ingestion.router import HEAVY_MODULES
+
+try:
+    from gunicorn.app.base import BaseApplication
+except ImportError:
+    BaseApplication = None
+
+
+APP_PATH = "backend.main:app"
+
+
+# ============================================================
+# CONFIGURATION
+# ============================================================
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.environ.get(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Audit Header Validator server")
+    parser.add_argument(
+        "--host", default=os.environ.get("AUDIT_HOST", "127.0.0.1"),
+        help="Interface to bind; loopback unless a deployment opts in (e.g. 0.0.0.0).",
+    )
+    parser.add_argument("--port", type=int, default=_env_int("AUDIT_PORT", 8000))
+    parser.add_argument(
+        "--workers", type=int,
+        default=_env_int("AUDIT_WORKERS", os.cpu_count() or 1),
+    )
+    parser.add_argument(
+        "--max-requests", type=int,
+        default=_env_int("AUDIT_MAX_REQUESTS", 1000),
+        help="Recycle a worker after this many requests (0 disables).",
+    )
+    parser.add_argument(
+        "--max-requests-jitter", type=int,
+        default=_env_int("AUDIT_MAX_REQUESTS_JITTER", 50),
+        help="Random extra requests so workers do not all recycle at once.",
+    )
+    parser.add_argument(
+        "--timeout", type=int,
+        default=_env_int("AUDIT_WORKER_TIMEOUT", 120),
+        help="Seconds a worker may stay silent before it is killed.",
+    )
+    parser.add_argument(
+        "--graceful-timeout", type=int,
+        default=_env_int("AUDIT_GRACEFUL_TIMEOUT", 30),
+        help="Seconds a recycled worker gets to finish in-flight requests.",
+    )
+    parser.add_argument(
+        "--no-warmup", action="store_true",
+        help="Skip the loader warm-up routine.",
+    )
+    return parser.parse_args(argv)
+
+
+# ============================================================
+# PRELOAD + WARM-UP
+# ============================================================
+
+def preload_heavy_modules() -> list:
+    """
+    Import the heavy ingestion dependencies (loading them before fork is the
+    whole point of preloading). Returns the ones that loaded.
+    """
+    loaded = []
+    for name in HEAVY_MODULES:
+        try:
+            importlib.import_module(name)
+            loaded.append(name)
+        except ImportError as e:
+            print(f"[warmup] {name} not available: {e}")
+    return loaded
+
+
+def _sample_docx() -> bytes:
+    from docx import Document
+
+    doc = Document()
+    doc.add_paragraph("Company Name: Warmup Corp")
+    table = doc.add_table(rows=2, cols=3)
+    for i, text in enumerate(["Business Name", "Criteria", "Type"]):
+        table.rows[0].cells[i].text = text
+    for i, text in enumerate(["Partner A", "1.a", "director"]):
+        table.rows[1].cells[i].text = text
+
+    buf = io.BytesIO()
+    doc.save(buf)
+    return buf.getvalue()
+
+
+def _sample_xlsx() -> bytes:
+    import pandas as pd
+
+    buf = io.BytesIO()
+    with pd.ExcelWriter(buf, engine="openpyxl") as writer:
+        pd.DataFrame({"Field": ["Company Name"], "Value": ["Warmup Corp"]}).to_excel(
+            writer, sheet_name="Header", index=False
+        )
+        pd.DataFrame(
+            [["Partner A", "1.a", "director"]],
+            columns=["Business Name", "Criteria", "Type"],
+        ).to_excel(writer, sheet_name="Related Parties", index=False)
+    return buf.getvalue()
+
+
+def _sample_pdf_path() -> str:
+    from pypdf import PdfWriter
+
+    writer = PdfWriter()
+    writer.add_blank_page(width=612, height=792)
+    writer.add_blank_page(width=612, height=792)
+
+    fd, path = tempfile.mkstemp(suffix=".pdf")
+    with os.fdopen(fd, "wb") as f:
+        writer.write(f)
+    return path
+
+
+def warm_up() -> dict:
+    """
+    Exercises every loader once on a tiny in-memory document so lazy module
+    state (pdfminer font tables, openpyxl styles, compiled regexes, ...) is
+    populated before the first real request.
+
+    Returns {loader_name: "OK" | "ERROR: ..."}; never raises.
+    """
+    from backend.audit.ingestion.acroform_extractor import extract_acroform_data
+    from backend.audit.ingestion.docx_loader import ingest_docx
+    from backend.audit.ingestion.spreadsheet_loader import ingest_spreadsheet
+    from backend.audit.ingestion.text_extractor import extract_pdf_data
+    from backend.audit.normalization.normalizer import normalize_for_validation
+    from backend.audit.validation.validator import validate_document
+
+    report = {}
+
+    def _run(name, func):
+        try:
+            func()
+            report[name] = "OK"
+        except Exception as e:
+            report[name] = f"ERROR: {e}"
+
+    pdf_path = None
+    try:
+        pdf_path = _sample_pdf_path()
+        _run("acroform", lambda: extract_acroform_data(pdf_path))
+        _run("pdf_text", lambda: extract_pdf_data(pdf_path))
+    except Exception as e:
+        report["pdf"] = f"ERROR: {e}"
+    finally:
+        if pdf_path and os.path.exists(pdf_path):
+            os.remove(pdf_path)
+
+    _run("docx", lambda: ingest_docx(_sample_docx()))
+    _run("xlsx", lambda: ingest_spreadsheet(_sample_xlsx(), "warmup.xlsx"))
+    _run(
+        "csv",
+        lambda: ingest_spreadsheet(
+            b"Business Name,Criteria,Type\nPartner A,1.a,director\n", "warmup.csv"
+        ),
+    )
+    _run(
+        "validation",
+        lambda: validate_document(normalize_for_validation({
+            "page_1": {
+                "company_name": "Warmup Corp",
+                "year_period_end": "2024",
+                "completed_by": "J. Doe",
+                "date": "01/01/2024",
+            },
+            "page_2": {"rows": [
+                {"business_name": "Partner A", "criteria_code": "1.a", "transaction_type": "director"},
+                {"business_name": "Partner B", "criteria_code": "2.b", "transaction_type": "affiliate"},
+            ]},
+        })),
+    )
+
+    print(f"[warmup] {report}")
+    return report
+
+
+# ============================================================
+# SERVERS
+# ============================================================
+
+if BaseApplication is not None:
+
+    class PreforkApplication(BaseApplication):
+        """Gunicorn master that imports and warms the app before forking."""
+
+        def __init__(self, options: dict, warm: bool = True):
+            self.options = options
+            self.warm = warm
+            super().__init__()
+
+        def load_config(self):
+            for key, value in self.options.items():
+                if key in self.cfg.settings and value is not None:
+                    self.cfg.set(key, value)
+
+        def load(self):
+            preload_heavy_modules()
+            from backend.main import app
+            if self.warm:
+                warm_up()
+            return app
+
+
+def run_prefork(args):
+    options = {
+        "bind": f"{args.host}:{args.port}",
+        "workers": args.workers,
+        "worker_class": "uvicorn.workers.UvicornWorker",
+        "preload_app": True,
+        "max_requests": args.max_requests,
+        "max_requests_jitter": args.max_requests_jitter,
+        "timeout": args.timeout,
+        "graceful_timeout": args.graceful_timeout,
+    }
+    PreforkApplication(options, warm=not args.no_warmup).run()
+
+
+def run_uvicorn(args):
+    import uvicorn
+
+    # Spawned workers re-import backend.main; the flag makes each of them
+    # run warm_up() on startup (see backend/main.py).
+    os.environ["AUDIT_WARM_START"] = "0" if args.no_warmup else "1"
+
+    uvicorn.run(
+        APP_PATH,
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        limit_max_requests=args.max_requests or None,
+        limit_max_requests_jitter=args.max_requests_jitter,
+        timeout_graceful_shutdown=args.graceful_timeout,
+    )
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    if BaseApplication is not None and os.name != "nt":
+        run_prefork(args)
+    else:
+        run_uvicorn(args)
+
+
+if __name__ == "__main__":
+    main()
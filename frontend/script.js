@@ -5,6 +5,9 @@ const validateBtn = document.getElementById('validateBtn');
 const resultsSection = document.getElementById('resultsSection');
 const statusBanner = document.getElementById('statusBanner');
 const overallStatusLabel = document.getElementById('overallStatusLabel');
+const uploadProgress = document.getElementById('uploadProgress');
+const uploadProgressFill = document.getElementById('uploadProgressFill');
+const uploadProgressLabel = document.getElementById('uploadProgressLabel');
 
 let currentFile = null;
 
@@ -18,30 +21,23 @@ fileInput.addEventListener('change', (e) => {
         fileNameDisplay.textContent = currentFile.name;
         validateBtn.disabled = false;
         resultsSection.classList.add('results-hidden');
+        uploadProgress.classList.add('progress-hidden');
     }
 });
 
 validateBtn.addEventListener('click', async () => {
     if (!currentFile) return;
 
-    validateBtn.textContent = 'Processing...';
+    validateBtn.textContent = 'Uploading...';
     validateBtn.disabled = true;
 
-    const formData = new FormData();
-    formData.append('file', currentFile);
-
     try {
-        const response = await fetch('/api/audit/validate-pdf', {
-            method: 'POST',
-            body: formData
-        });
-
-        if (!response.ok) throw new Error('Upload failed');
-
-        const data = await response.json();
+        const data = await uploadResumable(currentFile);
         renderResults(data);
 
     } catch (error) {
+        // The upload id is kept: clicking again resumes from the last chunk
+        setProgressLabel('Upload interrupted: click Validate to resume');
         alert('Error: ' + error.message);
     } finally {
         validateBtn.textContent = 'Validate Document';
@@ -49,6 +45,140 @@ validateBtn.addEventListener('click', async () => {
     }
 });
 
+// ============================================================
+// RESUMABLE UPLOAD
+// create → PATCH chunks at Upload-Offset → finalize. The upload id
+// is remembered per file, so after a dropped connection (or a page
+// reload) only the missing chunks are sent.
+// ============================================================
+
+const UPLOAD_API = '/api/uploads';
+const MAX_CHUNK_RETRIES = 5;
+
+async function uploadResumable(file) {
+    const storageKey = `audit-upload:${file.name}:${file.size}:${file.lastModified}`;
+    let upload = null;
+
+    const savedId = localStorage.getItem(storageKey);
+    if (savedId) {
+        const response = await fetch(`${UPLOAD_API}/${savedId}`);
+        if (response.ok) upload = await response.json();
+        else localStorage.removeItem(storageKey);
+    }
+
+    if (!upload) {
+        const params = new URLSearchParams({ filename: file.name, length: file.size });
+        const response = await fetch(`${UPLOAD_API}?${params}`, { method: 'POST' });
+        if (!response.ok) throw new Error(await errorDetail(response, 'Upload could not be started'));
+        upload = await response.json();
+        localStorage.setItem(storageKey, upload.upload_id);
+    }
+
+    // Text exports shrink several-fold; PDFs and Office files are already compressed
+    const compressChunks = /\.csv$/i.test(file.name) && 'CompressionStream' in window;
+
+    let offset = upload.offset;
+    let retries = 0;
+    showProgress(offset, file.size, offset > 0 ? 'Resuming' : 'Uploading');
+
+    while (offset < file.size) {
+        const chunk = fileChunk(file, offset, upload.chunk_size);
+        const headers = {
+            'Upload-Offset': String(offset),
+            'Content-Type': 'application/offset+octet-stream'
+        };
+
+        let body = chunk;
+        if (compressChunks) {
+            // Offsets stay in uncompressed bytes; the server inflates each chunk
+            body = await gzipBlob(chunk);
+            headers['Content-Encoding'] = 'gzip';
+        }
+
+        let response;
+        try {
+            response = await fetch(`${UPLOAD_API}/${upload.upload_id}`, {
+                method: 'PATCH',
+                headers,
+                body
+            });
+        } catch (networkError) {
+            // Connection dropped: back off, ask the server how far it got, carry on
+            if (++retries > MAX_CHUNK_RETRIES) throw networkError;
+            setProgressLabel(`Connection lost, retrying (${retries}/${MAX_CHUNK_RETRIES})...`);
+            await sleep(1000 * 2 ** (retries - 1));
+            offset = await serverOffset(upload.upload_id, offset);
+            continue;
+        }
+
+        if (response.status === 409) {
+            // Server has a different offset (e.g. a chunk landed before the drop)
+            offset = Number(response.headers.get('Upload-Offset'));
+            continue;
+        }
+        if (!response.ok) throw new Error(await errorDetail(response, 'Chunk upload failed'));
+
+        offset = (await response.json()).offset;
+        retries = 0;
+        showProgress(offset, file.size, 'Uploading');
+    }
+
+    validateBtn.textContent = 'Processing...';
+    setProgressLabel('Upload complete, validating...');
+
+    const response = await fetch(`${UPLOAD_API}/${upload.upload_id}/finalize`, { method: 'POST' });
+    if (response.status !== 409) localStorage.removeItem(storageKey);
+    if (!response.ok) throw new Error(await errorDetail(response, 'Validation failed'));
+    return response.json();
+}
+
+function fileChunk(file, offset, chunkSize) {
+    return file.slice(offset, Math.min(offset + chunkSize, file.size));
+}
+
+function gzipBlob(blob) {
+    return new Response(blob.stream().pipeThrough(new CompressionStream('gzip'))).blob();
+}
+
+async function serverOffset(uploadId, fallback) {
+    try {
+        const response = await fetch(`${UPLOAD_API}/${uploadId}`);
+        if (response.ok) return (await response.json()).offset;
+    } catch (e) {
+        // still offline; the next PATCH attempt will tell
+    }
+    return fallback;
+}
+
+async function errorDetail(response, fallback) {
+    try {
+        const body = await response.json();
+        return body.detail || fallback;
+    } catch (e) {
+        return fallback;
+    }
+}
+
+function sleep(ms) {
+    return new Promise(resolve => setTimeout(resolve, ms));
+}
+
+function showProgress(sent, total, verb) {
+    const percent = total ? Math.floor((sent / total) * 100) : 100;
+    uploadProgress.classList.remove('progress-hidden');
+    uploadProgressFill.style.width = percent + '%';
+    setProgressLabel(`${verb} ${formatBytes(sent)} / ${formatBytes(total)} (${percent}%)`);
+}
+
+function setProgressLabel(text) {
+    uploadProgressLabel.textContent = text;
+}
+
+function formatBytes(bytes) {
+    if (bytes < 1024 * 1024) return (bytes / 1024).toFixed(0) + ' KB';
+    return (bytes / (1024 * 1024)).toFixed(1) + ' MB';
+}
+
 function renderResults(data) {
     resultsSection.classList.remove('results-hidden');
 
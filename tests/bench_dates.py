@@ -0,0 +1,58 @@
+"""
+Micro-benchmark: fast-path date recognizer vs. the previous
+strptime / dateutil based checks.
+
+    python tests/bench_dates.py
+"""
+import sys
+import os
+import timeit
+from datetime import datetime
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from dateutil import parser as date_parser
+
+from backend.audit.validation.rules import validate_year_period_rule, validate_date_rule
+
+TEXTUAL = ["September 30, 2024", "December 31, 2023", "June 30, 2022"]
+NUMERIC = ["12/31/2023", "06/30/22", "02/29/2024"]
+N = 20000
+
+
+def legacy_year_period(value):
+    # Textual dates used to fall through to dateutil
+    try:
+        return 1900 < date_parser.parse(value).year < 2100
+    except Exception:
+        return False
+
+
+def legacy_date(value):
+    fmt = "%m/%d/%Y" if len(value.split("/")[-1]) == 4 else "%m/%d/%y"
+    try:
+        datetime.strptime(value, fmt)
+        return True
+    except ValueError:
+        return False
+
+
+def bench(label, func, values):
+    seconds = timeit.timeit(lambda: [func(v) for v in values], number=N)
+    per_call = seconds / (N * len(values)) * 1e6
+    print(f"{label:<32} {per_call:8.2f} µs/call")
+    return per_call
+
+
+def main():
+    old = bench("dateutil (textual year/period)", legacy_year_period, TEXTUAL)
+    new = bench("recognizer (textual year/period)", validate_year_period_rule, TEXTUAL)
+    print(f"  speedup: {old / new:.1f}x\n")
+
+    old = bench("strptime (MM/DD/YYYY)", legacy_date, NUMERIC)
+    new = bench("arithmetic (MM/DD/YYYY)", validate_date_rule, NUMERIC)
+    print(f"  speedup: {old / new:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytest
+
+
+# Related-party table only (no page-1 header block): validates PARTIAL_PASS.
+RELATED_PARTIES = (
+    ("Partner A", "1.a", "director"),
+    ("Partner B", "2.b", "employee"),
+)
+
+
+def related_parties_csv(*rows) -> bytes:
+    """CSV upload with the given (business name, criteria, type) rows."""
+    lines = ["Business Name,Criteria,Type", *(",".join(row) for row in rows)]
+    return ("\n".join(lines) + "\n").encode()
+
+
+@pytest.fixture
+def csv_bytes():
+    return related_parties_csv(*RELATED_PARTIES)
+
+
+@pytest.fixture
+def make_csv():
+    return related_parties_csv
+
+
+@pytest.fixture
+def no_sandbox(monkeypatch):
+    """API ingestion runs in the test process (no sandbox worker per request)."""
+    from backend.api import routes
+
+    monkeypatch.setattr(routes, "SANDBOX_ENABLED", False)
@@ -0,0 +1,124 @@
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from pypdf import PdfReader, PdfWriter
+from pypdf.generic import (
+    ArrayObject, DictionaryObject, NameObject, NumberObject, TextStringObject,
+)
+
+from backend.audit.ingestion import acroform_extractor
+from backend.audit.ingestion.acroform_extractor import extract_acroform_data
+
+
+def _field(name, value=None, **extra):
+    field = DictionaryObject({
+        NameObject("/FT"): NameObject("/Tx"),
+        NameObject("/T"): TextStringObject(name),
+    })
+    if value is not None:
+        field[NameObject("/V")] = TextStringObject(value)
+    for key, val in extra.items():
+        field[NameObject(f"/{key}")] = val
+    return field
+
+
+def _widget(writer, page, field):
+    field.update({
+        NameObject("/Type"): NameObject("/Annot"),
+        NameObject("/Subtype"): NameObject("/Widget"),
+        NameObject("/Rect"): ArrayObject([NumberObject(0)] * 4),
+    })
+    ref = writer._add_object(field)
+    page.setdefault(NameObject("/Annots"), ArrayObject()).append(ref)
+    return ref
+
+
+def _form_pdf(path, page_fields, extra_pages=0):
+    """page_fields: {page_num: [field dict, ...]}; extra blank pages are appended."""
+    writer = PdfWriter()
+    page_count = max(page_fields) + extra_pages
+    for _ in range(page_count):
+        writer.add_blank_page(width=612, height=792)
+
+    top_level = ArrayObject()
+    for page_num, fields in page_fields.items():
+        page = writer.pages[page_num - 1]
+        for field in fields:
+            top_level.append(_widget(writer, page, field))
+
+    writer._root_object[NameObject("/AcroForm")] = writer._add_object(
+        DictionaryObject({NameObject("/Fields"): top_level})
+    )
+    with open(path, "wb") as f:
+        writer.write(f)
+
+
+def test_reads_only_form_pages(tmp_path, monkeypatch):
+    print("Testing PAGE-SCOPED ACROFORM...")
+    pdf = str(tmp_path / "form.pdf")
+    _form_pdf(pdf, {
+        1: [_field("Company Name", "Acme"), _field("Year End", "2023"),
+            _field("Completed By", "J Doe"), _field("Date", "01/05/2024")],
+        2: [_field("Business Name Row1", "Partner A"), _field("Criteria Row1", "1.a"),
+            _field("Transaction Row1", "director"), _field("Notes Row1", "ignored")],
+        # An attachment further in the packet with look-alike field names
+        5: [_field("Company Name 2", "Attachment Corp"), _field("Business Name Row9", "X")],
+    })
+
+    def no_full_tree(self, *args, **kwargs):
+        raise AssertionError("get_fields() must not be called")
+
+    monkeypatch.setattr(PdfReader, "get_fields", no_full_tree)
+
+    out = extract_acroform_data(pdf)
+    print(f"Output: {out}")
+    assert out["page_1"] == {
+        "company_name": "Acme", "year_period_end": "2023",
+        "completed_by": "J Doe", "date": "01/05/2024",
+    }
+    assert out["page_2"]["rows"] == [
+        {"business_name": "Partner A", "criteria_code": "1.a", "transaction_type": "director"},
+    ]
+
+    # A template can point at other pages
+    only_5 = extract_acroform_data(pdf, pages=(5,))
+    assert only_5["page_1"]["company_name"] == "Attachment Corp"
+    print("PAGE-SCOPED ACROFORM OK\n")
+
+
+def test_kids_inherit_name_and_value(tmp_path):
+    print("Testing ACROFORM FIELD HIERARCHY...")
+    pdf = str(tmp_path / "kids.pdf")
+
+    writer = PdfWriter()
+    page = writer.add_blank_page(width=612, height=792)
+
+    parent = _field("Company Name", "Parent Corp")
+    parent_ref = writer._add_object(parent)
+    kids = ArrayObject()
+    for _ in range(2):
+        # Pure widgets (no /T): name and /V come from the parent
+        widget = DictionaryObject({NameObject("/Parent"): parent_ref})
+        kids.append(_widget(writer, page, widget))
+    parent[NameObject("/Kids")] = kids
+
+    writer._root_object[NameObject("/AcroForm")] = writer._add_object(
+        DictionaryObject({NameObject("/Fields"): ArrayObject([parent_ref])})
+    )
+    with open(pdf, "wb") as f:
+        writer.write(f)
+
+    fields = list(acroform_extractor.iter_page_fields(PdfReader(pdf)))
+    assert [name for name, _, _ in fields] == ["Company Name"]
+    assert extract_acroform_data(pdf)["page_1"]["company_name"] == "Parent Corp"
+    print("ACROFORM FIELD HIERARCHY OK\n")
+
+
+def test_falls_back_when_form_is_elsewhere(tmp_path):
+    print("Testing ACROFORM FALLBACK...")
+    pdf = str(tmp_path / "late.pdf")
+    _form_pdf(pdf, {4: [_field("Company Name", "Late Corp")]})
+    assert extract_acroform_data(pdf)["page_1"]["company_name"] == "Late Corp"
+    print("ACROFORM FALLBACK OK\n")
@@ -0,0 +1,65 @@
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from fastapi.testclient import TestClient
+
+from backend.main import app
+
+client = TestClient(app)
+
+
+def _post(content, name="doc.csv", params=None, headers=None):
+    return client.post(
+        "/api/validate-document",
+        files={"file": (name, content)},
+        params=params or {},
+        headers=headers or {},
+    )
+
+
+def test_validate_document_response_shape(csv_bytes):
+    print("Testing API RESPONSE...")
+    r = _post(csv_bytes)
+    assert r.status_code == 200
+    data = r.json()
+
+    assert data["success"] is True
+    assert data["overall_status"] == "PARTIAL_PASS"
+    assert data["can_proceed"] is False
+    assert {"field": "Company Name", "message": "Field not extracted or empty."} in data["issues"]
+
+    rows = data["page_2"]["rows"]
+    assert len(rows) == 2
+    assert rows[1]["fields"]["criteria_code"] == {
+        "status": "FOUND_AND_VALID", "value": "2.b", "error": None
+    }
+    print("API RESPONSE OK\n")
+
+
+def test_validate_document_without_rows(csv_bytes):
+    print("Testing API include_rows=false...")
+    data = _post(csv_bytes, params={"include_rows": "false"}).json()
+
+    assert data["page_2"] == {"status": "PASS", "detail": None}
+    assert len(data["issues"]) == 4
+    print("API include_rows=false OK\n")
+
+
+def test_unsupported_extension_rejected():
+    print("Testing API UNSUPPORTED TYPE...")
+    r = _post(b"hello", name="notes.txt")
+    assert r.status_code == 400
+    assert "Unsupported file type" in r.json()["detail"]
+    print("API UNSUPPORTED TYPE OK\n")
+
+
+def test_validate_document_fail_fast_mode(csv_bytes):
+    print("Testing API mode=fail_fast...")
+    data = _post(csv_bytes, params={"mode": "fail_fast"}).json()
+    assert data["overall_status"] == "PARTIAL_PASS"
+    assert data["stopped_early"] is False
+
+    assert _post(csv_bytes, params={"mode": "sometimes"}).status_code == 422
+    print("API mode=fail_fast OK\n")
@@ -0,0 +1,214 @@
+import csv
+import json
+import sys
+import os
+import zipfile
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from backend.audit.__main__ import main
+from backend.audit.batch.manifest import Manifest
+from backend.audit.batch.sources import iter_sources
+
+
+def _make_archive(root, csv_bytes):
+    (root / "sub").mkdir()
+    (root / "sub" / "a.csv").write_bytes(csv_bytes)
+    (root / "b.csv").write_bytes(csv_bytes)
+    (root / "notes.txt").write_text("not a document")
+    with zipfile.ZipFile(root / "bundle.zip", "w") as zf:
+        zf.writestr("inner/c.csv", csv_bytes)
+        zf.writestr("inner/readme.txt", "skip me")
+
+
+def test_iter_sources_walks_dirs_and_zips(tmp_path, csv_bytes):
+    print("Testing SOURCE DISCOVERY...")
+    _make_archive(tmp_path, csv_bytes)
+
+    sources = list(iter_sources([str(tmp_path)]))
+    print(f"Sources: {sources}")
+
+    assert len(sources) == 3
+    assert any(s.endswith("bundle.zip!/inner/c.csv") for s in sources)
+    assert not any(s.endswith(".txt") for s in sources)
+    print("SOURCE DISCOVERY OK\n")
+
+
+def test_validate_cli_jsonl_and_resume(tmp_path, csv_bytes):
+    print("Testing BATCH CLI...")
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    _make_archive(docs, csv_bytes)
+    out = tmp_path / "results.jsonl"
+
+    rc = main(["validate", str(docs), "-o", str(out), "--jobs", "2"])
+    assert rc == 0
+
+    records = [json.loads(line) for line in out.read_text().splitlines()]
+    assert len(records) == 3
+    for rec in records:
+        assert rec["error"] is None
+        assert rec["overall_status"] == "PARTIAL_PASS"
+        assert len(rec["validation"]["page_2"]["rows"]) == 2
+
+    # Resume: everything is checkpointed, nothing is re-validated.
+    rc = main(["validate", str(docs), "-o", str(out), "--jobs", "2", "--resume"])
+    assert rc == 0
+    assert len(out.read_text().splitlines()) == 3
+    print("BATCH CLI OK\n")
+
+
+def test_validate_cli_csv_output(tmp_path, csv_bytes):
+    print("Testing BATCH CSV OUTPUT...")
+    (tmp_path / "a.csv").write_bytes(csv_bytes)
+    out = tmp_path / "out" / "results.csv"
+    out.parent.mkdir()
+
+    main(["validate", str(tmp_path / "a.csv"), "-o", str(out), "--jobs", "1"])
+
+    with open(out, newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == 1
+    assert rows[0]["overall_status"] == "PARTIAL_PASS"
+    assert rows[0]["error_count"] == "4"
+    print("BATCH CSV OUTPUT OK\n")
+
+
+def test_manifest_skips_unchanged_documents(tmp_path, csv_bytes):
+    print("Testing INCREMENTAL MANIFEST...")
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    _make_archive(docs, csv_bytes)
+    out = tmp_path / "results.jsonl"
+    db = tmp_path / "manifest.db"
+
+    def run():
+        main(["validate", str(docs), "-o", str(out), "--jobs", "2", "--manifest", str(db)])
+        return {
+            os.path.basename(r["source"]): r.get("cached", False)
+            for r in map(json.loads, out.read_text().splitlines())
+        }
+
+    first = run()
+    assert not any(first.values())
+
+    second = run()
+    assert all(second.values())
+
+    # Touched but identical -> reused via content hash; modified -> re-validated.
+    os.utime(docs / "b.csv", None)
+    with open(docs / "sub" / "a.csv", "ab") as f:
+        f.write(b"Partner C,1.c,director\n")
+
+    third = run()
+    print(f"Third run cached flags: {third}")
+    assert third["b.csv"] is True
+    assert third["c.csv"] is True
+    assert third["a.csv"] is False
+    print("INCREMENTAL MANIFEST OK\n")
+
+
+def test_manifest_invalidated_by_rules_version(tmp_path):
+    print("Testing MANIFEST RULES VERSION...")
+    db = str(tmp_path / "manifest.db")
+
+    m = Manifest(db, "v1")
+    m.record("doc.pdf", 10, 123, "abc", {"source": "doc.pdf", "overall_status": "PASS"})
+    m.close()
+
+    assert Manifest(db, "v1").lookup("doc.pdf")["content_hash"] == "abc"
+    assert Manifest(db, "v2").lookup("doc.pdf") is None
+    print("MANIFEST RULES VERSION OK\n")
+
+
+def test_parquet_output_streams_row_groups_and_resumes(tmp_path, monkeypatch, csv_bytes):
+    print("Testing BATCH PARQUET SEGMENTS...")
+    import pyarrow.parquet as pq
+    from backend.audit.batch import writers
+
+    monkeypatch.setattr(writers.ParquetWriter, "batch_size", 2)
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    _make_archive(docs, csv_bytes)
+    out = tmp_path / "results.parquet"
+    ckpt = tmp_path / "results.parquet.ckpt"
+
+    assert main(["validate", str(docs), "-o", str(out), "--jobs", "2"]) == 0
+    assert pq.ParquetFile(out).metadata.num_row_groups == 2
+    assert all(line.endswith("\t0") for line in ckpt.read_text().splitlines())
+
+    # Resume with one new document: written to its own segment file.
+    (docs / "d.csv").write_bytes(csv_bytes)
+    assert main(["validate", str(docs), "-o", str(out), "--jobs", "2", "--resume"]) == 0
+    paths = writers.segment_paths(str(out))
+    assert paths == [str(out), str(tmp_path / "results.1.parquet")]
+    assert pq.read_table(paths[1]).column("source").to_pylist() == [str(docs / "d.csv")]
+
+    # A run killed before closing its segment: the file has no footer, so the
+    # documents checkpointed into it are validated again on the next resume.
+    (docs / "e.csv").write_bytes(csv_bytes)
+    killed = tmp_path / "results.2.parquet"
+    killed.write_bytes(b"PAR1 truncated row group")
+    with open(ckpt, "a") as f:
+        f.write(f"{docs / 'e.csv'}\t2\n")
+
+    assert main(["validate", str(docs), "-o", str(out), "--jobs", "2", "--resume"]) == 0
+    assert not killed.exists()
+    paths = writers.segment_paths(str(out))
+    print(f"Segments: {paths}")
+    assert pq.read_table(paths[-1]).column("source").to_pylist() == [str(docs / "e.csv")]
+
+    rows = sum(pq.read_table(p).num_rows for p in paths)
+    assert rows == 5
+    print("BATCH PARQUET SEGMENTS OK\n")
+
+
+def test_field_rows_exported_to_parquet_and_arrow(tmp_path, monkeypatch, csv_bytes):
+    print("Testing BATCH FIELD EXPORT...")
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    from backend.audit.batch import writers
+
+    monkeypatch.setattr(writers.FieldsParquetWriter, "batch_size", 2)
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    (docs / "a.csv").write_bytes(csv_bytes)
+    (docs / "b.csv").write_bytes(csv_bytes)
+    (docs / "broken.pdf").write_bytes(b"not a pdf")
+
+    out = tmp_path / "fields.parquet"
+    main(["validate", str(docs), "-o", str(out), "--format", "fields-parquet", "--jobs", "2"])
+    table = pq.read_table(out)
+    assert table.column_names == writers.FIELD_COLUMNS
+    assert pq.ParquetFile(out).metadata.num_row_groups == 2
+
+    rows = table.to_pylist()
+    a = [r for r in rows if r["document"] == str(docs / "a.csv")]
+    partner = [r for r in a if r["page"] == 2 and r["row_number"] == 1]
+    assert {(r["field"], r["value"]) for r in partner} == {
+        ("business_person_name", "Partner A"),
+        ("criteria_code", "1.a"),
+        ("transaction_type", "director"),
+    }
+    assert {r["field"] for r in a if r["page"] == 1} >= {"company_name", "date"}
+
+    # A document without results still has one (document-level) row
+    broken = [r for r in rows if r["document"] == str(docs / "broken.pdf")]
+    print(f"Broken document: {broken}")
+    assert len(broken) == 1 and broken[0]["field"] is None
+
+    stream_out = tmp_path / "fields.arrows"
+    main(["validate", str(docs), "-o", str(stream_out), "--jobs", "2"])
+    with pa.ipc.open_stream(stream_out) as reader:
+        streamed = reader.read_all()
+    assert streamed.schema == table.schema
+    assert sorted(map(str, streamed.to_pylist())) == sorted(map(str, rows))
+
+    # .arrow is the IPC file format (Feather v2)
+    import pandas as pd
+
+    file_out = tmp_path / "fields.arrow"
+    main(["validate", str(docs), "-o", str(file_out), "--jobs", "2"])
+    assert pa.ipc.open_file(file_out).read_all().schema == table.schema
+    assert len(pd.read_feather(file_out)) == len(rows)
+    print("BATCH FIELD EXPORT OK\n")
@@ -0,0 +1,126 @@
+import sys
+import os
+import asyncio
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from fastapi.testclient import TestClient
+
+from backend.main import app
+from backend.api import routes
+from backend.api.coalesce import SingleFlight, content_key
+
+
+def test_content_key():
+    print("Testing CONTENT KEY...")
+    assert content_key(b"abc", ".pdf", "full", "v1") == content_key(b"abc", ".pdf", "full", "v1")
+    assert content_key(b"abc", ".pdf", "full", "v1") != content_key(b"abd", ".pdf", "full", "v1")
+    assert content_key(b"abc", ".pdf", "full", "v1") != content_key(b"abc", ".pdf", "full", "v2")
+    print("CONTENT KEY OK\n")
+
+
+def test_single_flight_shares_one_run():
+    print("Testing SINGLE FLIGHT...")
+    calls = []
+
+    async def work(name):
+        calls.append(name)
+        await asyncio.sleep(0.05)
+        return {"doc": name}
+
+    async def scenario():
+        flight = SingleFlight()
+        same = [flight.do("k1", lambda: work("k1")) for _ in range(5)]
+        other = flight.do("k2", lambda: work("k2"))
+        results = await asyncio.gather(*same, other)
+        assert flight.stats() == {"in_flight": 0, "started": 2, "coalesced": 4}
+
+        # Finished runs are not cached
+        again, shared = await flight.do("k1", lambda: work("k1"))
+        assert not shared
+        return results
+
+    results = asyncio.run(scenario())
+    assert calls == ["k1", "k2", "k1"]
+    assert [shared for _, shared in results] == [False, True, True, True, True, False]
+    assert all(result is results[0][0] for result, _ in results[:5])
+    print("SINGLE FLIGHT OK\n")
+
+
+def test_single_flight_errors_reach_every_waiter():
+    print("Testing SINGLE FLIGHT ERRORS...")
+
+    async def boom():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("bad document")
+
+    async def scenario():
+        flight = SingleFlight()
+        results = await asyncio.gather(
+            *[flight.do("k", boom) for _ in range(3)], return_exceptions=True
+        )
+        assert flight.stats()["in_flight"] == 0
+        return results
+
+    results = asyncio.run(scenario())
+    assert all(isinstance(r, RuntimeError) for r in results)
+    print("SINGLE FLIGHT ERRORS OK\n")
+
+
+def test_single_flight_survives_cancelled_waiter():
+    print("Testing CANCELLED WAITER...")
+
+    async def work():
+        await asyncio.sleep(0.05)
+        return "done"
+
+    async def scenario():
+        flight = SingleFlight()
+        first = asyncio.create_task(flight.do("k", work))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(flight.do("k", work))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second
+
+    assert asyncio.run(scenario()) == ("done", True)
+    print("CANCELLED WAITER OK\n")
+
+
+def test_api_coalesces_concurrent_duplicates(monkeypatch, csv_bytes, no_sandbox):
+    print("Testing API COALESCING...")
+    runs = []
+    real_pipeline = routes.run_pipeline
+
+    def slow_pipeline(*args, **kwargs):
+        runs.append(args[1])
+        time.sleep(0.3)
+        return real_pipeline(*args, **kwargs)
+
+    monkeypatch.setattr(routes, "run_pipeline", slow_pipeline)
+
+    async def post_all(client):
+        loop = asyncio.get_running_loop()
+        post = lambda include_rows: client.post(
+            f"/api/validate-document?include_rows={include_rows}",
+            files={"file": ("doc.csv", csv_bytes)},
+        )
+        return await asyncio.gather(
+            loop.run_in_executor(None, post, "true"),
+            loop.run_in_executor(None, post, "false"),
+            loop.run_in_executor(None, post, "true"),
+        )
+
+    # One client context: every request is served on the same event loop
+    with TestClient(app) as client:
+        responses = asyncio.run(post_all(client))
+    print(f"Pipeline runs: {len(runs)}")
+    assert all(r.status_code == 200 for r in responses)
+    assert len(runs) < 3
+    assert sum(r.headers.get("X-Coalesced") == "1" for r in responses) == 3 - len(runs)
+
+    # include_rows is still honoured per request
+    assert "rows" in responses[0].json()["page_2"]
+    assert "rows" not in responses[1].json()["page_2"]
+    print("API COALESCING OK\n")
@@ -0,0 +1,128 @@
+import sys
+import os
+import gzip
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from backend.main import app
+from backend.api import compression
+from backend.api.compression import CompressionMiddleware, negotiate
+
+
+@pytest.fixture
+def large_csv(make_csv):
+    # big enough for the validation response to cross COMPRESS_MIN_BYTES
+    return make_csv(*((f"Partner {i}", "1.a", "director") for i in range(200)))
+
+
+def _echo_app():
+    echo = FastAPI()
+    echo.add_middleware(CompressionMiddleware, minimum_size=100)
+
+    @echo.post("/echo")
+    async def echo_body(request: Request):
+        body = await request.body()
+        return {"length": len(body), "head": body[:20].decode("latin-1")}
+
+    @echo.get("/stream")
+    async def stream():
+        lines = (b'{"row": %d}\n' % i for i in range(50))
+        return StreamingResponse(lines, media_type="application/x-ndjson")
+
+    return echo
+
+
+def test_negotiate():
+    print("Testing NEGOTIATE...")
+    assert negotiate("gzip, deflate, br") == "gzip"
+    assert negotiate("gzip;q=0") is None
+    assert negotiate("br") is None
+    assert negotiate("*") in ("zstd", "gzip")
+    assert negotiate("") is None
+    print("NEGOTIATE OK\n")
+
+
+def test_gzip_request_body_is_inflated(large_csv):
+    print("Testing GZIP REQUEST...")
+    client = TestClient(_echo_app())
+    response = client.post(
+        "/echo",
+        content=gzip.compress(large_csv),
+        headers={"Content-Encoding": "gzip", "Accept-Encoding": "identity"},
+    )
+    assert response.status_code == 200
+    assert response.json() == {"length": len(large_csv), "head": large_csv[:20].decode()}
+
+    corrupt = client.post("/echo", content=b"not gzip", headers={"Content-Encoding": "gzip"})
+    assert corrupt.status_code == 400
+
+    # Cut off mid-stream, or with bytes after the end of the stream
+    compressed = gzip.compress(large_csv)
+    truncated = client.post("/echo", content=compressed[:-8], headers={"Content-Encoding": "gzip"})
+    assert truncated.status_code == 400 and "Truncated" in truncated.text
+    trailing = client.post("/echo", content=compressed + b"junk",
+                           headers={"Content-Encoding": "gzip"})
+    assert trailing.status_code == 400 and "Trailing" in trailing.text
+
+    unknown = client.post("/echo", content=b"x", headers={"Content-Encoding": "br"})
+    assert unknown.status_code == 415
+    print("GZIP REQUEST OK\n")
+
+
+def test_compression_bomb_is_rejected(monkeypatch):
+    print("Testing BOMB GUARD...")
+    monkeypatch.setattr(compression, "DECOMPRESS_FREE_BYTES", 1024 * 1024)
+    bomb = gzip.compress(b"\0" * (50 * 1024 * 1024))
+    print(f"{len(bomb)} bytes -> 50 MB")
+
+    response = TestClient(_echo_app()).post(
+        "/echo", content=bomb, headers={"Content-Encoding": "gzip"},
+    )
+    assert response.status_code == 413
+    print("BOMB GUARD OK\n")
+
+
+def test_json_and_ndjson_responses_are_compressed():
+    print("Testing RESPONSE COMPRESSION...")
+    client = TestClient(_echo_app())
+
+    # Small body: left alone
+    small = client.post("/echo", content=b"abc", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in small.headers
+    assert small.headers["vary"] == "Accept-Encoding"
+
+    stream = client.get("/stream", headers={"Accept-Encoding": "gzip"})
+    assert stream.headers["content-encoding"] == "gzip"
+    lines = stream.text.splitlines()  # httpx inflates transparently
+    assert len(lines) == 50 and lines[-1] == '{"row": 49}'
+    print("RESPONSE COMPRESSION OK\n")
+
+
+def test_validation_response_compressed_end_to_end(large_csv, no_sandbox):
+    print("Testing VALIDATE GZIP...")
+    client = TestClient(app)
+
+    plain = client.post(
+        "/api/validate-document",
+        files={"file": ("doc.csv", large_csv)},
+        headers={"Accept-Encoding": "identity"},
+    )
+    compressed = client.post(
+        "/api/validate-document",
+        files={"file": ("doc.csv", large_csv)},
+        headers={"Accept-Encoding": "gzip"},
+    )
+    assert compressed.headers["content-encoding"] == "gzip"
+    compressed_body, plain_body = compressed.json(), plain.json()
+    compressed_body.pop("result_id"), plain_body.pop("result_id")
+    assert compressed_body == plain_body
+
+    wire = int(compressed.headers["content-length"])
+    print(f"Response: {len(plain.content)} -> {wire} bytes")
+    assert wire < len(plain.content) / 4
+    print("VALIDATE GZIP OK\n")
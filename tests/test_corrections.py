@@ -0,0 +1,122 @@
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.main import app
+from backend.api import routes
+from backend.api.validations import ValidationStore
+from backend.audit.validation.profiles import DEFAULT_PROFILE
+from backend.audit.validation.validator import apply_corrections, validate_document
+
+NORMALIZED = {
+    "page_1": {
+        "company_name": "Acme Ltd",
+        "year_period_end": "2024",
+        "completed_by": "J. Smith",
+        "date": "2024-03-31",
+    },
+    "page_2": {"rows": [
+        {"business_name": "Partner A", "criteria_code": "1.a", "transaction_type": "director"},
+        {"business_name": "Partner B", "criteria_code": "9.z", "transaction_type": "employee"},
+    ]},
+}
+
+PAGE_1_FIXED = {"company_name": "Acme Ltd", "year": "2024", "completed_by": "J. Smith", "date": "03/31/2024"}
+
+
+def test_apply_corrections_revalidates_only_changed_fields():
+    print("Testing APPLY CORRECTIONS...")
+    previous = validate_document(NORMALIZED)
+    assert previous["overall_status"] == "FAIL"
+
+    corrected, result = apply_corrections(
+        NORMALIZED, previous,
+        {"page_1": {"date": "03/31/2024"}, "rows": {2: {"criteria_code": "2.b"}}},
+    )
+
+    # Untouched results are the very same objects
+    assert result["page_1"]["fields"]["company_name"] is previous["page_1"]["fields"]["company_name"]
+    assert result["page_2"]["rows"][0]["fields"]["criteria_code"] is \
+        previous["page_2"]["rows"][0]["fields"]["criteria_code"]
+
+    assert corrected["page_1"]["date"] == "03/31/2024"
+    assert NORMALIZED["page_1"]["date"] == "2024-03-31"  # input left alone
+
+    # Same outcome as validating the corrected document from scratch
+    assert result == validate_document(corrected)
+    assert result["overall_status"] == "PASS"
+
+    with pytest.raises(ValueError):
+        apply_corrections(NORMALIZED, previous, {"page_1": {"colour": "blue"}})
+    with pytest.raises(ValueError):
+        apply_corrections(NORMALIZED, previous, {"rows": {3: {"criteria_code": "1.a"}}})
+    print("APPLY CORRECTIONS OK\n")
+
+
+def test_apply_corrections_fills_fields_fail_fast_skipped():
+    print("Testing CORRECT FAIL_FAST...")
+    previous = validate_document(NORMALIZED, mode="fail_fast")
+    assert previous["stopped_early"] is True
+
+    _, result = apply_corrections(
+        NORMALIZED, previous, {"page_1": {"date": "03/31/2024"}, "rows": {2: {"criteria_code": "2.b"}}},
+    )
+    assert result["overall_status"] == "PASS"
+    assert len(result["page_2"]["rows"]) == 2
+    assert "stopped_early" not in result
+    print("CORRECT FAIL_FAST OK\n")
+
+
+def test_store_round_trip_and_expiry(tmp_path):
+    print("Testing VALIDATION STORE...")
+    store = ValidationStore(str(tmp_path), ttl=60)
+    result = validate_document(NORMALIZED)
+    result_id = store.put(NORMALIZED, {**result, "normalized": NORMALIZED}, DEFAULT_PROFILE, "doc.pdf")
+
+    record = store.get(result_id)
+    assert record["normalized"] == NORMALIZED
+    assert record["result"] == result
+    assert record["tenant"] == DEFAULT_PROFILE.name
+    assert store.get("0" * 32) is None
+    assert store.get("../../etc/passwd") is None
+
+    expired = ValidationStore(str(tmp_path), ttl=-1)
+    assert expired.get(expired.put(NORMALIZED, result, DEFAULT_PROFILE)) is None
+    print("VALIDATION STORE OK\n")
+
+
+def test_api_patch_corrects_without_reingest(tmp_path, monkeypatch, make_csv, no_sandbox):
+    print("Testing CORRECTION API...")
+    monkeypatch.setattr(routes, "get_validation_store", lambda: ValidationStore(str(tmp_path)))
+    client = TestClient(app)
+    upload = make_csv(("Partner A", "1.a", "director"), ("Partner B", "9.z", "employee"))
+
+    first = client.post("/api/validate-document", files={"file": ("doc.csv", upload)}).json()
+    assert first["overall_status"] == "FAIL"
+    result_id = first["result_id"]
+
+    def no_ingest(*args, **kwargs):
+        raise AssertionError("corrections must not re-ingest")
+    monkeypatch.setattr(routes, "run_pipeline", no_ingest)
+
+    partial = client.patch(
+        f"/api/validations/{result_id}",
+        json={"rows": [{"row_number": 2, "fields": {"criteria_code": "2.b"}}]},
+    ).json()
+    assert partial["overall_status"] == "PARTIAL_PASS"
+    assert partial["page_2"]["rows"][1]["fields"]["criteria_code"]["value"] == "2.b"
+
+    # Corrections accumulate on the stored result
+    fixed = client.patch(f"/api/validations/{result_id}", json={"page_1": PAGE_1_FIXED}).json()
+    assert fixed["overall_status"] == "PASS" and fixed["can_proceed"] is True
+    assert fixed["issues"] == []
+    assert fixed["result_id"] == result_id
+
+    bad_field = client.patch(f"/api/validations/{result_id}", json={"page_1": {"colour": "x"}})
+    assert bad_field.status_code == 400
+    assert client.patch(f"/api/validations/{'f' * 32}", json={}).status_code == 404
+    print("CORRECTION API OK\n")
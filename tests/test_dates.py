@@ -0,0 +1,85 @@
+import sys
+import os
+from datetime import date, timedelta
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from backend.audit.validation.dates import recognize_date, excel_serial_to_ymd, is_valid_ymd
+from backend.audit.validation.rules import validate_year_period_rule, validate_date_rule
+
+
+def test_recognizer_formats():
+    print("Testing DATE RECOGNIZER...")
+    assert recognize_date("2024") == ("year", 2024, None, None)
+    assert recognize_date("12/31/24") == ("mdy", 2024, 12, 31)
+    assert recognize_date("1/5/2024") == ("mdy", 2024, 1, 5)
+    assert recognize_date("September 30, 2024") == ("textual", 2024, 9, 30)
+    assert recognize_date("Sept. 30 2024") == ("textual", 2024, 9, 30)
+    assert recognize_date("31 December 2023") == ("textual", 2023, 12, 31)
+    assert recognize_date("31-Dec-2023") == ("textual", 2023, 12, 31)
+    assert recognize_date("2023-12-31") == ("iso", 2023, 12, 31)
+    assert recognize_date("2023-12-31 00:00:00") == ("iso", 2023, 12, 31)
+    assert recognize_date("45291") == ("serial", 2023, 12, 31)
+    assert recognize_date("45291.0") == ("serial", 2023, 12, 31)
+
+    # day-first only when the first number cannot be a month
+    assert recognize_date("31/12/2023") == ("dmy", 2023, 12, 31)
+    assert recognize_date("01/02/2024") == ("mdy", 2024, 1, 2)
+    assert recognize_date("December 2023") == ("month_year", 2023, 12, None)
+    assert recognize_date("Dec. 2023") == ("month_year", 2023, 12, None)
+
+    assert recognize_date("202") is None
+    assert recognize_date("31/02/2023") is None
+    assert recognize_date("Smarch 2023") is None
+    assert recognize_date("02/29/2023") is None
+    assert recognize_date("Smarch 1, 2024") is None
+    assert recognize_date("31 June 2024") is None
+    print("DATE RECOGNIZER OK\n")
+
+
+def test_calendar_arithmetic_matches_datetime():
+    print("Testing CALENDAR ARITHMETIC...")
+    for serial in (10000, 25569, 36526, 45291, 60000):
+        d = date(1899, 12, 30) + timedelta(days=serial)
+        assert excel_serial_to_ymd(serial) == (d.year, d.month, d.day)
+
+    for year in (1900, 2000, 2023, 2024):
+        for month in range(1, 13):
+            for day in range(1, 32):
+                try:
+                    date(year, month, day)
+                    expected = True
+                except ValueError:
+                    expected = False
+                assert is_valid_ymd(year, month, day) == expected
+    print("CALENDAR ARITHMETIC OK\n")
+
+
+def test_year_period_rule_without_dateutil():
+    print("Testing YEAR / PERIOD RULE...")
+    for ok in ("2024", "12/31/2024", "September 30, 2024", "31 December 2023", "2024-09-30", "45565",
+               "31/12/2023", "December 2023"):
+        assert validate_year_period_rule(ok)[0] is True, ok
+
+    for bad in ("202", "FY24", "02/30/2024", "January 1, 1850", "31/12/1850", "June 1850", ""):
+        assert validate_year_period_rule(bad)[0] is False, bad
+    print("YEAR / PERIOD RULE OK\n")
+
+
+def test_date_rule_calendar_checks():
+    print("Testing DATE RULE...")
+    assert validate_date_rule("12/15/2025") == (True, None)
+    assert validate_date_rule("02/29/24") == (True, None)
+    assert validate_date_rule("02/29/23") == (False, "Invalid calendar date.")
+    assert validate_date_rule("04/31/2024") == (False, "Invalid calendar date.")
+    assert validate_date_rule("2025-12-15")[1] == "Date must be in MM/DD/YY or MM/DD/YYYY format."
+    print("DATE RULE OK\n")
+
+
+def test_rules_version_covers_the_validation_package():
+    print("Testing RULES VERSION SOURCES...")
+    from backend.audit.validation import version
+
+    sources = version._rule_sources()
+    assert {"rules.py", "validator.py", "dates.py", "memo.py", "models.py"} <= set(sources)
+    print("RULES VERSION SOURCES OK\n")
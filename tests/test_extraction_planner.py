@@ -0,0 +1,156 @@
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import backend.audit.ingestion.planner as planner
+import backend.audit.ingestion.text_extractor as text_extractor
+import backend.audit.ingestion.ocr_extractor as ocr_extractor
+import backend.audit.ingestion.page_index as page_index
+
+ROWS = [
+    {"business_name": "Partner A", "criteria_code": "1.a", "transaction_type": "director"},
+    {"business_name": "Partner B", "criteria_code": "2.b", "transaction_type": "employee"},
+]
+
+HEADER_TEXT = "Company Name: Text Corp\nYear End: 2023\nCompleted By: Jane Doe\nDate: 02/02/2024"
+
+
+def _acroform(page_1, rows=()):
+    def fake(path):
+        return {"page_1": page_1, "page_2": {"rows": list(rows)}}
+    return fake
+
+
+def _install(monkeypatch, acro, pages_text=None, tables=None, ocr_text=None, index=None):
+    calls = {"text": [], "ocr": []}
+    pages_text = pages_text or {}
+
+    def fake_index(path):
+        return index or {
+            "header_pages": [],
+            "table_page": None,
+            "text_pages": {p for p, t in pages_text.items() if t.strip()},
+            "page_count": len(pages_text),
+        }
+
+    def fake_text(path, pages=None, table_page=2):
+        calls["text"].append(set(pages) if pages is not None else None)
+        text = {p: t for p, t in pages_text.items() if pages is None or p in pages}
+        return text, dict(tables or {})
+
+    def fake_ocr(path, pages):
+        calls["ocr"].append(list(pages))
+        return {p: t for p, t in (ocr_text or {}).items() if p in pages}
+
+    monkeypatch.setattr(planner, "extract_acroform_data", acro)
+    monkeypatch.setattr(page_index, "build_page_index", fake_index)
+    monkeypatch.setattr(text_extractor, "extract_pdf_data", fake_text)
+    monkeypatch.setattr(ocr_extractor, "extract_ocr_text", fake_ocr)
+    return calls
+
+
+def test_complete_acroform_skips_other_tiers(monkeypatch):
+    print("Testing PLANNER (AcroForm complete)...")
+    header = {"company_name": "Form Corp", "year_period_end": "2023",
+              "completed_by": "J. Doe", "date": "01/01/2024"}
+    calls = _install(monkeypatch, _acroform(header, ROWS))
+
+    result = planner.extract_pdf("doc.pdf")
+
+    assert result["page_1"] == header
+    assert result["page_2"]["rows"] == ROWS
+    assert calls == {"text": [], "ocr": []}
+    assert result["provenance"]["company_name"] == {"source": "acroform", "confidence": 0.95}
+    print("PLANNER (AcroForm complete) OK\n")
+
+
+def test_partial_acroform_is_merged_with_text(monkeypatch):
+    print("Testing PLANNER (merge)...")
+    calls = _install(
+        monkeypatch,
+        _acroform({"company_name": "Form Corp", "year_period_end": None}, ROWS),
+        pages_text={1: HEADER_TEXT, 2: "related parties"},
+    )
+
+    result = planner.extract_pdf("doc.pdf")
+    page_1, prov = result["page_1"], result["provenance"]
+    print(f"Page 1: {page_1}\nProvenance: {prov}")
+
+    # AcroForm wins where it had a value; text fills only the gaps.
+    assert page_1["company_name"] == "Form Corp"
+    assert page_1["year_period_end"] == "2023"
+    assert prov["company_name"]["source"] == "acroform"
+    assert prov["year_period_end"] == {"source": "text", "confidence": 0.8}
+    assert prov["page_2_rows"]["source"] == "acroform"
+
+    # Rows already known: only page 1 text is extracted, no OCR.
+    assert calls["text"] == [{1}]
+    assert calls["ocr"] == []
+    print("PLANNER (merge) OK\n")
+
+
+def test_ocr_only_for_pages_without_text_layer(monkeypatch):
+    print("Testing PLANNER (OCR)...")
+    calls = _install(
+        monkeypatch,
+        _acroform({}),
+        pages_text={1: "", 2: "Page two has a text layer"},
+        ocr_text={1: HEADER_TEXT},
+    )
+
+    result = planner.extract_pdf("doc.pdf")
+
+    assert result["page_1"]["company_name"] == "Text Corp"
+    assert result["provenance"]["date"] == {"source": "ocr", "confidence": 0.6}
+    assert calls["text"] == [{1, 2}]
+    assert calls["ocr"] == [[1]]
+    print("PLANNER (OCR) OK\n")
+
+
+def test_page_index_routes_header_extraction(monkeypatch):
+    print("Testing PLANNER (page index)...")
+    calls = _install(
+        monkeypatch,
+        _acroform({}),
+        pages_text={1: "Cover page", 2: "Table of Contents", 3: HEADER_TEXT, 4: "Related Party table"},
+        tables={4: [["Business", "Criteria", "Type"]]},
+        index={"header_pages": [3], "table_page": 4, "text_pages": {1, 2, 3, 4}, "page_count": 4},
+    )
+
+    result = planner.extract_pdf("doc.pdf")
+
+    assert result["page_1"]["company_name"] == "Text Corp"
+    assert result["page_1"]["date"] == "02/02/2024"
+    # Only the flagged header page and table page are fully extracted.
+    assert calls["text"] == [{3, 4}]
+    assert calls["ocr"] == []
+    print("PLANNER (page index) OK\n")
+
+
+ROW_TEXT = "Business / Person's Name: Partner A\nCriteria 1.a\nType of Transactions: director"
+
+
+def test_rows_from_page_text_stop_the_plan(monkeypatch):
+    print("Testing PLANNER (rows from text)...")
+    calls = _install(
+        monkeypatch,
+        _acroform({}),
+        pages_text={1: "", 2: ROW_TEXT},
+        ocr_text={1: HEADER_TEXT},
+    )
+
+    result = planner.extract_pdf("doc.pdf")
+
+    assert result["page_2"]["rows"] == [ROWS[0]]
+    assert result["provenance"]["page_2_rows"] == {"source": "text", "confidence": 0.8}
+    assert calls["ocr"] == [[1]]
+
+    # Fully scanned: the OCR text of page 2 supplies the rows
+    calls = _install(monkeypatch, _acroform({}), pages_text={1: "", 2: ""},
+                     ocr_text={1: HEADER_TEXT, 2: ROW_TEXT})
+    result = planner.extract_pdf("doc.pdf")
+    assert calls["ocr"] == [[1, 2]]
+    assert result["page_2"]["rows"] == [ROWS[0]]
+    assert result["provenance"]["page_2_rows"]["source"] == "ocr"
+    print("PLANNER (rows from text) OK\n")
@@ -0,0 +1,91 @@
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import backend.audit.pipeline as pipeline
+from backend.audit.validation.validator import validate_document
+
+VALID_ROW = {"business_name": "Partner A", "criteria_code": "1.a", "transaction_type": "director"}
+BAD_ROW = {"business_name": "Partner B", "criteria_code": "9.z", "transaction_type": "bogus"}
+
+HEADER = {
+    "company_name": "Acme Corp",
+    "year_period_end": "2023",
+    "completed_by": "John Doe",
+    "date": "01/01/2023",
+}
+
+
+def test_fail_fast_stops_on_page_1():
+    print("Testing FAIL FAST (Page 1)...")
+    content = {
+        "page_1": {**HEADER, "company_name": "!!!"},
+        "page_2": {"rows": [BAD_ROW, BAD_ROW]},
+    }
+
+    full = validate_document(content)
+    fast = validate_document(content, mode="fail_fast")
+
+    assert full["overall_status"] == fast["overall_status"] == "FAIL"
+    assert fast["stopped_early"] is True
+    assert list(fast["page_1"]["fields"]) == ["company_name"]
+    assert fast["page_2"] == {}
+    assert len(fast["errors"]) == 1
+    assert "stopped_early" not in full
+    print("FAIL FAST (Page 1) OK\n")
+
+
+def test_fail_fast_stops_on_first_bad_row_field():
+    print("Testing FAIL FAST (Page 2)...")
+    content = {
+        "page_1": HEADER,
+        "page_2": {"rows": [VALID_ROW, BAD_ROW, BAD_ROW]},
+    }
+
+    fast = validate_document(content, mode="fail_fast")
+    rows = fast["page_2"]["rows"]
+
+    assert fast["overall_status"] == "FAIL"
+    assert len(rows) == 2
+    assert list(rows[1]["fields"]) == ["business_person_name", "criteria_code"]
+    print("FAIL FAST (Page 2) OK\n")
+
+
+def test_fail_fast_matches_full_on_pass():
+    print("Testing FAIL FAST (PASS)...")
+    content = {"page_1": HEADER, "page_2": {"rows": [VALID_ROW, VALID_ROW]}}
+
+    fast = validate_document(content, mode="fail_fast")
+    full = validate_document(content)
+
+    assert fast["overall_status"] == full["overall_status"] == "PASS"
+    assert fast["stopped_early"] is False
+    assert fast["page_2"] == full["page_2"]
+    print("FAIL FAST (PASS) OK\n")
+
+
+def test_pipeline_skips_page_2_ingestion(monkeypatch):
+    print("Testing FAIL FAST PIPELINE...")
+    calls = []
+
+    def fake_ingest(file_path, filename, pages=None):
+        calls.append(pages)
+        result = {}
+        if pages is None or 1 in pages:
+            result["page_1"] = {**HEADER, "date": "2023-01-01"}
+        if pages is None or 2 in pages:
+            result["page_2"] = {"rows": [VALID_ROW, VALID_ROW]}
+        return result
+
+    monkeypatch.setattr(pipeline, "ingest_file", fake_ingest)
+
+    res = pipeline.run_pipeline("doc.docx", "doc.docx", mode="fail_fast")
+    assert res["overall_status"] == "FAIL"
+    assert calls == [{1}]
+
+    calls.clear()
+    res = pipeline.run_pipeline("doc.docx", "doc.docx")
+    assert res["overall_status"] == "FAIL"
+    assert calls == [None]
+    print("FAIL FAST PIPELINE OK\n")
@@ -0,0 +1,108 @@
+import sys
+import os
+import io
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from docx import Document
+
+from backend.audit.ingestion.docx_loader import ingest_docx
+from backend.audit.ingestion.field_extractor import extract_headers, extract_headers_from_lines
+from backend.audit.normalization.normalizer import normalize_for_validation
+
+
+def test_stops_pulling_lines_once_complete():
+    print("Testing HEADER EARLY STOP...")
+    consumed = []
+
+    def lines():
+        for line in [
+            "Company Name: Acme",
+            "Year End: 2023",
+            "Completed By: J Doe",
+            "Date: 01/05/2024",
+            "Appendix A",
+            "Appendix B",
+        ]:
+            consumed.append(line)
+            yield line
+
+    headers = extract_headers_from_lines(lines())
+    assert headers == {
+        "company_name": "Acme", "year_period_end": "2023",
+        "completed_by": "J Doe", "date": "01/05/2024",
+    }
+    # "Date" is evaluated when the next line arrives; nothing after that is read
+    assert consumed[-1] == "Appendix A"
+    print("HEADER EARLY STOP OK\n")
+
+
+def test_value_on_next_line_stays_within_page():
+    print("Testing HEADER NEXT-LINE VALUES...")
+    headers, meta = extract_headers({
+        1: "Company Name:\nAcme Corp\nCompleted By:",
+        2: "J Doe\nYear End 2023",
+    })
+    assert headers["company_name"] == "Acme Corp"
+    assert headers["completed_by"] is None
+    assert headers["year_period_end"] == "2023"
+    assert meta["scanned_pages"] == 2
+    print("HEADER NEXT-LINE VALUES OK\n")
+
+
+def test_docx_header_fields_reach_the_normalizer():
+    print("Testing DOCX HEADER FIELDS...")
+    doc = Document()
+    doc.add_paragraph("Related Party Questionnaire")
+    doc.add_paragraph("Company Name: Acme Holdings")
+    doc.add_paragraph("Year End: 2023")
+
+    # Remaining header fields laid out as a two-column table
+    header_table = doc.add_table(rows=2, cols=2)
+    header_table.cell(0, 0).text = "Completed By"
+    header_table.cell(0, 1).text = "J Doe"
+    header_table.cell(1, 0).text = "Date"
+    header_table.cell(1, 1).text = "01/05/2024"
+
+    buf = io.BytesIO()
+    doc.save(buf)
+
+    out = ingest_docx(buf.getvalue(), pages={1})
+    normalized = normalize_for_validation(out)
+    assert normalized["page_1"] == {
+        "company_name": "Acme Holdings", "year_period_end": "2023",
+        "completed_by": "J Doe", "date": "01/05/2024",
+    }
+    print("DOCX HEADER FIELDS OK\n")
+
+
+def test_header_aliases_are_regexes():
+    print("Testing HEADER ALIAS REGEXES...")
+    # Aliases are regex fragments (Company\s*Name); they used to be
+    # re.escape'd, which only matched the literal text "Company\s*Name".
+    headers, _ = extract_headers({1: "CompanyName: Acme\nYear/Period   End: 2023\nPrepared by: J Doe"})
+    assert headers["company_name"] == "Acme"
+    assert headers["year_period_end"] == "2023"
+    assert headers["completed_by"] == "J Doe"
+
+    headers, _ = extract_headers({1: r"Company\s*Name: Acme"})
+    assert headers["company_name"] is None
+    print("HEADER ALIAS REGEXES OK\n")
+
+
+def test_csv_header_rows_are_streamed():
+    print("Testing CSV HEADER STREAMING...")
+    from backend.audit.ingestion.spreadsheet_loader import ingest_spreadsheet
+
+    # pandas cannot parse the ragged rows below the header block; the
+    # header pass stops before it reaches them.
+    content = (
+        b"Field,Value\nCompany Name,Acme\nYear End,2023\nCompleted By,J Doe\n"
+        b"Date,01/05/2024\nAppendix\n" + b"a,b,c,d,e,f\n" * 1000
+    )
+    out = ingest_spreadsheet(content, "doc.csv", pages={1})
+    assert out["page_1"] == {
+        "company_name": "Acme", "year_period_end": "2023",
+        "completed_by": "J Doe", "date": "01/05/2024",
+    }
+    print("CSV HEADER STREAMING OK\n")
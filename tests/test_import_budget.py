@@ -0,0 +1,36 @@
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+HEAVY_MODULES = ["pandas", "numpy", "openpyxl", "pdfplumber", "pdfminer", "pypdf", "docx"]
+
+# Generous ceiling for `import backend.main` (FastAPI + pydantic dominate).
+IMPORT_BUDGET_SECONDS = 3.0
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import backend.main
+elapsed = time.perf_counter() - start
+print(json.dumps({
+    "elapsed": elapsed,
+    "loaded": [m for m in %r if m in sys.modules],
+}))
+""" % (HEAVY_MODULES,)
+
+
+def test_app_import_is_lazy_and_within_budget():
+    print("Testing IMPORT BUDGET...")
+    out = subprocess.run(
+        [sys.executable, "-c", PROBE],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    result = json.loads(out.stdout.strip().splitlines()[-1])
+    print(f"Import: {result['elapsed']:.3f}s, heavy modules loaded: {result['loaded']}")
+
+    assert result["loaded"] == []
+    assert result["elapsed"] < IMPORT_BUDGET_SECONDS
+    print("IMPORT BUDGET OK\n")
@@ -0,0 +1,78 @@
+import sys
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from pypdf import PdfWriter
+
+import backend.audit.ingestion.ocr_extractor as ocr
+from backend.audit.ingestion.router import ingest_file
+
+OCR_PAGE_1 = "AUDIT HEADER\nCompany Name: Scanned Corp\nYear End: 2023\nCompleted By: Jane Doe\nDate: 02/02/2024\n"
+
+
+def _blank_pdf(path, pages=3):
+    writer = PdfWriter()
+    for _ in range(pages):
+        writer.add_blank_page(width=200, height=200)
+    with open(path, "wb") as f:
+        writer.write(f)
+
+
+def _fake_engine(monkeypatch, calls):
+    def fake_ocr(bitmap, lang):
+        calls.append(bitmap[1])
+        return OCR_PAGE_1
+
+    monkeypatch.setattr(ocr, "ocr_available", lambda: True)
+    monkeypatch.setattr(ocr, "_ocr_bitmap", fake_ocr)
+    monkeypatch.setattr(ocr, "_get_pool", lambda: ThreadPoolExecutor(max_workers=2))
+    monkeypatch.setattr(ocr, "OCR_DPI", 36)
+    ocr._cache.clear()
+
+
+def test_scanned_pdf_goes_through_ocr_tier(tmp_path, monkeypatch):
+    print("Testing OCR TIER...")
+    calls = []
+    _fake_engine(monkeypatch, calls)
+    pdf = str(tmp_path / "scan.pdf")
+    _blank_pdf(pdf)
+
+    extracted = ingest_file(pdf, "scan.pdf")
+    page_1 = extracted["page_1"]
+    print(f"Page 1: {page_1}")
+
+    assert page_1["company_name"] == "Scanned Corp"
+    assert page_1["year_period_end"] == "2023"
+    assert page_1["date"] == "02/02/2024"
+
+    # Identical blank pages 1 and 2 share a page hash; page 3 is never rendered.
+    assert len(calls) <= 2
+    print("OCR TIER OK\n")
+
+
+def test_ocr_results_cached_by_page_hash(tmp_path, monkeypatch):
+    print("Testing OCR CACHE...")
+    calls = []
+    _fake_engine(monkeypatch, calls)
+    pdf = str(tmp_path / "scan.pdf")
+    _blank_pdf(pdf, pages=1)
+
+    assert ocr.extract_ocr_text(pdf) == {1: OCR_PAGE_1}
+    assert ocr.extract_ocr_text(pdf) == {1: OCR_PAGE_1}
+    assert len(calls) == 1
+    print("OCR CACHE OK\n")
+
+
+def test_ocr_skipped_when_engine_missing(tmp_path, monkeypatch):
+    print("Testing OCR UNAVAILABLE...")
+    monkeypatch.setattr(ocr, "ocr_available", lambda: False)
+    pdf = str(tmp_path / "scan.pdf")
+    _blank_pdf(pdf, pages=2)
+
+    assert ocr.extract_ocr_text(pdf) == {}
+    extracted = ingest_file(pdf, "scan.pdf")
+    assert extracted["page_1"] == {}
+    assert extracted["page_2"] == {"rows": []}
+    print("OCR UNAVAILABLE OK\n")
@@ -0,0 +1,87 @@
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from backend.audit.ingestion.page_index import build_page_index
+from backend.audit.ingestion.router import ingest_file
+
+
+def _text_pdf(path, pages):
+    """Writes a minimal PDF with one Helvetica text line per list entry."""
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        None,  # pages tree, filled below
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    kids = []
+    for lines in pages:
+        ops = ["BT /F1 11 Tf 14 TL 50 750 Td"]
+        for line in lines:
+            escaped = line.replace("\\\\", "\\\\\\\\").replace("(", "\\\\(").replace(")", "\\\\)")
+            ops.append(f"({escaped}) Tj T*")
+        ops.append("ET")
+        stream = "\n".join(ops).encode()
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+        content_id = len(objects)
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % content_id
+        )
+        kids.append(len(objects))
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+        " ".join(f"{k} 0 R" for k in kids).encode(), len(kids)
+    )
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for i, obj in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % i + obj + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for off in offsets:
+        out += b"%010d 00000 n \n" % off
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+
+    with open(path, "wb") as f:
+        f.write(bytes(out))
+
+
+PAGES = [
+    ["ANNUAL AUDIT PACKET", "Prepared for the board"],
+    ["Table of Contents", "Company Name ........ 3", "Related Party Transactions ........ 4"],
+    ["AUDIT HEADER", "Company Name: Valid Corp", "Year End: 2023",
+     "Completed By: Jane Doe", "Date: 02/02/2023"],
+    ["Related Party Transactions", "Business / Person's Name  Criteria  Type of Transactions"],
+]
+
+
+def test_page_index_flags_header_and_table_pages(tmp_path):
+    print("Testing PAGE INDEX...")
+    pdf = str(tmp_path / "packet.pdf")
+    _text_pdf(pdf, PAGES)
+
+    index = build_page_index(pdf)
+    print(f"Index: {index}")
+
+    assert index["page_count"] == 4
+    assert index["header_pages"] == [3]
+    assert index["table_page"] == 4
+    assert index["text_pages"] == {1, 2, 3, 4}
+    print("PAGE INDEX OK\n")
+
+
+def test_header_found_behind_cover_and_toc(tmp_path):
+    print("Testing MULTI-PAGE HEADER SCAN...")
+    pdf = str(tmp_path / "packet.pdf")
+    _text_pdf(pdf, PAGES)
+
+    page_1 = ingest_file(pdf, "packet.pdf")["page_1"]
+    print(f"Page 1: {page_1}")
+
+    assert page_1["company_name"] == "Valid Corp"
+    assert page_1["year_period_end"] == "2023"
+    assert page_1["completed_by"] == "Jane Doe"
+    assert page_1["date"] == "02/02/2023"
+    print("MULTI-PAGE HEADER SCAN OK\n")
@@ -0,0 +1,126 @@
+import sys
+import os
+import json
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from fastapi.testclient import TestClient
+
+from backend.main import app
+from backend.audit.validation import profiles
+from backend.audit.validation.memo import rule_cache_stats
+from backend.audit.validation.validator import validate_document
+
+CONTENT = {
+    "page_1": {"company_name": "Acme", "year_period_end": "2024",
+               "completed_by": "J. Doe", "date": "31/12/2024"},
+    "page_2": {"rows": [
+        {"business_name": "Partner A", "criteria_code": "1.a", "transaction_type": "Officer"},
+        {"business_name": "Partner B", "criteria_code": "2.b", "transaction_type": "Trustee"},
+    ]},
+}
+
+
+def _write(directory, name, config):
+    path = os.path.join(directory, f"{name}.json")
+    with open(path, "w") as f:
+        json.dump(config, f)
+    return path
+
+
+def _bump(path):
+    # Filesystems with coarse mtimes: make the change visible to the scan.
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def test_profile_changes_rules(tmp_path):
+    print("Testing TENANT PROFILE...")
+    _write(tmp_path, "acme", {
+        "transaction_types": ["officer", "trustee"],
+        "date_formats": ["dmy"],
+    })
+    report = profiles.reload_profiles(str(tmp_path))
+    assert report["loaded"] == ["acme"]
+
+    default = validate_document(CONTENT)
+    assert default["overall_status"] == "FAIL"
+
+    acme = validate_document(CONTENT, profile=profiles.get_profile("acme"))
+    print(f"Errors: {acme['errors']}")
+    assert acme["overall_status"] == "PASS"
+    assert acme["page_2"]["rows"][0]["fields"]["transaction_type"].value == "Officer"
+
+    # Year / Period End follows the profile's DD/MM order too
+    acme_profile = profiles.get_profile("acme")
+    period = {**CONTENT, "page_1": {**CONTENT["page_1"], "year_period_end": "31/12/2023"}}
+    assert validate_document(period, profile=acme_profile)["page_1"]["fields"]["year"].status == "FOUND_AND_VALID"
+    month_first = {**CONTENT, "page_1": {**CONTENT["page_1"], "year_period_end": "12/31/2023"}}
+    assert validate_document(month_first)["page_1"]["fields"]["year"].status == "FOUND_AND_VALID"
+    assert validate_document(month_first, profile=acme_profile)["page_1"]["fields"]["year"].status == "FOUND_BUT_INVALID"
+
+    # Built-in criteria codes are kept when the profile does not override them
+    assert profiles.get_profile("acme").page_2_fields[1] == profiles.DEFAULT_PROFILE.page_2_fields[1]
+    assert "Transaction Type@acme" in rule_cache_stats()
+    print("TENANT PROFILE OK\n")
+
+
+def test_profile_hot_reload_and_bad_file(tmp_path):
+    print("Testing PROFILE HOT RELOAD...")
+    path = _write(tmp_path, "acme", {"transaction_types": ["officer"]})
+    profiles.reload_profiles(str(tmp_path))
+    first = profiles.get_profile("acme")
+
+    # Unchanged file: nothing is recompiled
+    assert profiles.reload_profiles(str(tmp_path))["loaded"] == []
+    assert profiles.get_profile("acme") is first
+
+    _write(tmp_path, "acme", {"transaction_types": ["officer", "trustee"]})
+    _bump(path)
+    assert profiles.reload_profiles(str(tmp_path))["loaded"] == ["acme"]
+    second = profiles.get_profile("acme")
+    assert second is not first
+    assert second.version != first.version
+
+    # A broken edit keeps the last good version
+    with open(path, "w") as f:
+        f.write("{not json")
+    _bump(path)
+    report = profiles.reload_profiles(str(tmp_path))
+    assert "acme" in report["errors"]
+    assert profiles.get_profile("acme") is second
+
+    _write(tmp_path, "other", {"colour": ["red"]})
+    assert "Unknown profile keys" in profiles.reload_profiles(str(tmp_path))["errors"]["other"]
+
+    os.remove(path)
+    assert profiles.reload_profiles(str(tmp_path))["removed"] == ["acme"]
+    assert profiles.get_profile("acme") is None
+    assert profiles.get_profile(None) is profiles.DEFAULT_PROFILE
+    print("PROFILE HOT RELOAD OK\n")
+
+
+def test_profile_selected_by_header_or_param(tmp_path, make_csv):
+    print("Testing API TENANT SELECTION...")
+    _write(tmp_path, "acme", {"transaction_types": ["officer", "trustee"]})
+    profiles.reload_profiles(str(tmp_path))
+    client = TestClient(app)
+    upload = make_csv(("Partner A", "1.a", "officer"), ("Partner B", "2.b", "trustee"))
+
+    def post(**kwargs):
+        return client.post(
+            "/api/validate-document", files={"file": ("doc.csv", upload)}, **kwargs
+        )
+
+    assert post().json()["page_2"]["rows"][0]["fields"]["transaction_type"]["status"] == "FOUND_BUT_INVALID"
+
+    for kwargs in ({"headers": {"X-Tenant-ID": "acme"}}, {"params": {"tenant": "acme"}}):
+        row = post(**kwargs).json()["page_2"]["rows"][0]
+        assert row["fields"]["transaction_type"]["status"] == "FOUND_AND_VALID"
+
+    r = post(params={"tenant": "nobody"})
+    assert r.status_code == 400
+    assert "Unknown rule profile" in r.json()["detail"]
+
+    assert "acme" in client.get("/api/profiles").json()
+    print("API TENANT SELECTION OK\n")
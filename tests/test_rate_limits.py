@@ -0,0 +1,180 @@
+import sys
+import os
+import asyncio
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from fastapi.testclient import TestClient
+
+from backend.main import app
+from backend.api import routes
+from backend.api.limits import RateLimiter, ClientPolicy
+from backend.api.scheduler import FairScheduler
+
+
+def test_token_bucket_limits_and_refills():
+    print("Testing TOKEN BUCKET...")
+    limiter = RateLimiter({"bulk": ClientPolicy(rate=20, burst=2)})
+
+    assert limiter.consume("bulk").allowed
+    second = limiter.consume("bulk")
+    assert second.allowed and int(second.remaining) == 0
+
+    denied = limiter.consume("bulk")
+    assert not denied.allowed
+    assert denied.headers()["Retry-After"] == "1"
+    assert denied.headers()["X-RateLimit-Limit"] == "2"
+
+    # Other clients have their own (default) bucket
+    assert limiter.consume("interactive").allowed
+
+    time.sleep(0.06)
+    assert limiter.consume("bulk").allowed
+    print("TOKEN BUCKET OK\n")
+
+
+def test_sqlite_buckets_are_shared(tmp_path):
+    print("Testing SQLITE BUCKETS...")
+    db = str(tmp_path / "limits.db")
+    policies = {"k": ClientPolicy(rate=0.01, burst=2)}
+
+    worker_a = RateLimiter(policies, db_path=db)
+    worker_b = RateLimiter(policies, db_path=db)
+    try:
+        assert worker_a.consume("k").allowed
+        assert worker_b.consume("k").allowed
+        assert not worker_a.consume("k").allowed
+    finally:
+        worker_a.close()
+        worker_b.close()
+
+    # Survives a restart
+    restarted = RateLimiter(policies, db_path=db)
+    assert not restarted.consume("k").allowed
+    restarted.close()
+    print("SQLITE BUCKETS OK\n")
+
+
+def test_unknown_keys_share_the_address_bucket_and_idle_buckets_are_dropped():
+    print("Testing CLIENT IDS...")
+    from types import SimpleNamespace
+    from backend.api.limits import client_id
+
+    def request(key):
+        return SimpleNamespace(headers={"X-API-Key": key} if key else {},
+                               client=SimpleNamespace(host="10.0.0.7"))
+
+    policies = {"bulk": ClientPolicy()}
+    assert client_id(request("bulk"), policies) == "bulk"
+    assert client_id(request("made-up-1"), policies) == "ip:10.0.0.7"
+    assert client_id(request("made-up-2"), policies) == client_id(request(None), policies)
+
+    limiter = RateLimiter(policies)
+    limiter.default_policy = ClientPolicy(rate=100, burst=1)
+    limiter.consume("ip:10.0.0.7")
+    limiter.consume("bulk")
+    time.sleep(0.05)
+    limiter._next_sweep = 0
+    limiter.consume("ip:10.0.0.8")
+    # the first bucket refilled (1 token at 100/s) and is gone; "bulk" is still draining
+    assert set(limiter._buckets) == {"bulk", "ip:10.0.0.8"}
+    print("CLIENT IDS OK\n")
+
+
+def test_fair_scheduler_serves_interactive_before_bulk_backlog():
+    print("Testing FAIR SCHEDULER...")
+    order = []
+
+    def job(name):
+        time.sleep(0.02)
+        order.append(name)
+        return name
+
+    async def scenario():
+        scheduler = FairScheduler(concurrency=1)
+        bulk = [
+            asyncio.create_task(scheduler.run("bulk", 1.0, job, f"bulk-{i}"))
+            for i in range(5)
+        ]
+        await asyncio.sleep(0)  # bulk backlog is queued first
+        interactive = asyncio.create_task(scheduler.run("user", 1.0, job, "user"))
+        results = await asyncio.gather(*bulk, interactive)
+        assert scheduler.running == 0
+        return results
+
+    results = asyncio.run(scenario())
+    print(f"Order: {order}")
+    assert results[-1] == "user"
+    assert order.index("user") <= 1
+    assert sorted(order) == sorted(results)
+    print("FAIR SCHEDULER OK\n")
+
+
+def test_fair_scheduler_forgets_one_off_clients_under_load():
+    print("Testing FAIR SCHEDULER HISTORY...")
+
+    def job(name):
+        time.sleep(0.002)
+        return name
+
+    async def scenario():
+        scheduler = FairScheduler(concurrency=1)
+        bulk = [
+            asyncio.create_task(scheduler.run("bulk", 1.0, job, f"bulk-{i}"))
+            for i in range(60)
+        ]
+        await asyncio.sleep(0)
+        sizes = []
+        for i in range(20):  # distinct callers while the queue never drains
+            await scheduler.run(f"ip:10.0.0.{i}", 1.0, job, i)
+            sizes.append(len(scheduler._last_finish))
+        await asyncio.gather(*bulk)
+        return sizes
+
+    sizes = asyncio.run(scenario())
+    print(f"Clients remembered: {sizes}")
+    assert max(sizes) <= 3
+    print("FAIR SCHEDULER HISTORY OK\n")
+
+
+def test_api_never_builds_the_limiter_when_disabled(monkeypatch, csv_bytes, no_sandbox):
+    print("Testing RATE LIMIT OFF...")
+
+    def no_limiter():
+        raise AssertionError("limiter built with rate limiting off")
+
+    monkeypatch.setattr(routes, "get_limiter", no_limiter)
+    monkeypatch.setattr(routes, "RATE_LIMIT_ENABLED", False)
+    response = TestClient(app).post(
+        "/api/validate-document", files={"file": ("doc.csv", csv_bytes)},
+    )
+    assert response.status_code == 200
+    assert "X-RateLimit-Limit" not in response.headers
+    print("RATE LIMIT OFF OK\n")
+
+
+def test_api_reports_limits_and_rejects(monkeypatch, csv_bytes):
+    print("Testing API RATE LIMIT...")
+    limiter = RateLimiter({"small-key": ClientPolicy(rate=0.01, burst=1)})
+    monkeypatch.setattr(routes, "get_limiter", lambda: limiter)
+    monkeypatch.setattr(routes, "get_policies", lambda: limiter.policies)
+    monkeypatch.setattr(routes, "RATE_LIMIT_ENABLED", True)
+    client = TestClient(app)
+
+    def post():
+        return client.post(
+            "/api/validate-document",
+            files={"file": ("doc.csv", csv_bytes)},
+            headers={"X-API-Key": "small-key"},
+        )
+
+    ok = post()
+    assert ok.status_code == 200
+    assert ok.headers["X-RateLimit-Limit"] == "1"
+    assert ok.headers["X-RateLimit-Remaining"] == "0"
+
+    limited = post()
+    assert limited.status_code == 429
+    assert int(limited.headers["Retry-After"]) > 0
+    print("API RATE LIMIT OK\n")
@@ -0,0 +1,88 @@
+import json
+import sys
+import os
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from backend.api.routes import build_frontend_response
+from backend.audit.validation.models import FieldResult, FieldStatus, field_label, json_default, result_to_dict
+from backend.audit.validation.validator import validate_document, validate_field
+from backend.audit.validation.rules import validate_criteria_code
+
+PAYLOAD = {
+    "page_1": {
+        "company_name": "Acme Corp",
+        "year_period_end": "2023",
+        "completed_by": "John Doe",
+        "date": "13/01/2023",
+    },
+    "page_2": {"rows": [
+        {"business_name": "Partner A", "criteria_code": "1.A", "transaction_type": "director"},
+        {"business_name": "Partner B", "criteria_code": "9.z", "transaction_type": None},
+    ]},
+}
+
+
+def test_field_result_is_compact_and_dict_compatible():
+    print("Testing FIELD RESULT...")
+    res = validate_field(" 1.A ", validate_criteria_code, "Criteria Code")
+
+    assert isinstance(res, FieldResult)
+    assert not hasattr(res, "__dict__")
+    assert res.status is FieldStatus.VALID
+    assert res["status"] == "FOUND_AND_VALID"
+    assert res.get("value") == "1.a"
+    assert res.get("missing", "x") == "x"
+
+    # Only the dataclass fields are mapping keys, never methods or dunders
+    for key in ("to_dict", "keys", "__class__", 0):
+        with pytest.raises(KeyError):
+            res[key]
+        assert res.get(key) is None
+
+    # NOT_FOUND results are shared, not rebuilt per field.
+    assert validate_field(None, validate_criteria_code, "Criteria Code") is \
+        validate_field("   ", validate_criteria_code, "Criteria Code")
+    print("FIELD RESULT OK\n")
+
+
+def test_result_serializes_to_plain_json():
+    print("Testing RESULT SERIALIZATION...")
+    res = validate_document(PAYLOAD)
+
+    via_default = json.loads(json.dumps(res, default=json_default))
+    via_walk = json.loads(json.dumps(result_to_dict(res)))
+
+    assert via_default == via_walk
+    assert via_walk["page_1"]["fields"]["date"] == {
+        "status": "FOUND_BUT_INVALID",
+        "value": "13/01/2023",
+        "error": "Date must be in MM/DD/YY or MM/DD/YYYY format.",
+    }
+    assert via_walk["page_2"]["rows"][1]["fields"]["transaction_type"]["status"] == "NOT_FOUND"
+    print("RESULT SERIALIZATION OK\n")
+
+
+def test_frontend_response_labels_and_rows():
+    print("Testing FRONTEND RESPONSE...")
+    resp = build_frontend_response(validate_document(PAYLOAD))
+
+    assert resp["overall_status"] == "FAIL"
+    assert resp["can_proceed"] is False
+
+    fields = [issue["field"] for issue in resp["issues"]]
+    assert fields == [
+        "Date",
+        "Criteria Code (Row 2)",
+        "Transaction Type (Row 2)",
+    ]
+
+    # Rows are already plain JSON.
+    json.dumps(resp)
+    assert resp["page_2"]["rows"][0]["fields"]["criteria_code"]["value"] == "1.a"
+
+    assert field_label("business_person_name") == "business_person_name".replace("_", " ").title()
+    assert field_label("some_new_field") == "Some New Field"
+    print("FRONTEND RESPONSE OK\n")
@@ -0,0 +1,156 @@
+import sys
+import os
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.main import app
+from backend.api import routes
+from backend.audit.__main__ import main
+from backend.audit.results_store import ResultsStore
+from backend.audit.validation.validator import validate_document
+
+
+def _normalized(company, criteria="1.a"):
+    return {
+        "page_1": {"company_name": company, "year_period_end": "2024",
+                   "completed_by": "J. Smith", "date": "03/31/2024"},
+        "page_2": {"rows": [
+            {"business_name": "Partner A", "criteria_code": "1.a", "transaction_type": "director"},
+            {"business_name": "Partner B", "criteria_code": criteria, "transaction_type": "employee"},
+        ]},
+    }
+
+
+def _fill(store, count=25):
+    base = time.time() - count
+    for i in range(count):
+        company = "Acme Ltd" if i % 2 else "Globex Corp"
+        criteria = "9.z" if i % 5 == 0 else "2.b"
+        store.add(
+            f"{i:032x}", validate_document(_normalized(company, criteria)),
+            source=f"doc{i}.pdf", tenant="default", rules_version="v1",
+            validated_at=base + i,
+        )
+    store.flush()
+
+
+def test_batched_writes_filters_and_pagination(tmp_path):
+    print("Testing RESULTS STORE...")
+    store = ResultsStore(str(tmp_path / "results.db"), batch_size=10)
+    _fill(store)
+
+    # Keyset pages, newest first, no gaps or repeats
+    seen, cursor = [], None
+    while True:
+        page = store.list_documents(limit=7, cursor=cursor)
+        seen += [item["result_id"] for item in page["items"]]
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    assert seen == [f"{i:032x}" for i in reversed(range(25))]
+
+    acme = store.list_documents(company="  ACME   ltd ")["items"]
+    assert len(acme) == 12 and {d["company_name"] for d in acme} == {"Acme Ltd"}
+
+    failed = store.list_documents(status="FAIL")["items"]
+    assert len(failed) == 5 and all(d["issues"] == 1 for d in failed)
+
+    recent = store.list_documents(since=time.time() - 5.5)["items"]
+    assert len(recent) == 5
+
+    assert store.list_documents(rules_version="v2")["items"] == []
+
+    with pytest.raises(ValueError):
+        store.list_documents(cursor="nonsense")
+    with pytest.raises(ValueError):
+        store.list_documents(since="last tuesday")
+
+    # Re-adding a result id replaces document and field rows
+    store.add(f"{0:032x}", validate_document(_normalized("Globex Corp")), rules_version="v1")
+    store.flush()
+    assert len(store.list_documents(status="FAIL")["items"]) == 4
+    conn = store._reader()
+    assert conn.execute("SELECT COUNT(*) FROM fields").fetchone()[0] == 25 * 10
+    store.close()
+    print("RESULTS STORE OK\n")
+
+
+def test_summary_counts(tmp_path):
+    print("Testing RESULTS SUMMARY...")
+    store = ResultsStore(str(tmp_path / "results.db"))
+    _fill(store)
+
+    summary = store.summary()
+    assert summary["total"] == 25
+    assert summary["by_status"] == {"PASS": 20, "FAIL": 5}
+    assert summary["by_field"]["criteria_code"] == {"FOUND_AND_VALID": 45, "FOUND_BUT_INVALID": 5}
+    assert "groups" not in summary
+
+    by_company = store.summary(group_by="company", status="PASS")
+    assert {g["key"]: g["total"] for g in by_company["groups"]} == {"acme ltd": 10, "globex corp": 10}
+
+    assert sum(g["total"] for g in store.summary(group_by="day")["groups"]) == 25
+
+    with pytest.raises(ValueError):
+        store.summary(group_by="colour")
+    store.close()
+    print("RESULTS SUMMARY OK\n")
+
+
+def test_api_records_and_serves_results(tmp_path, monkeypatch, csv_bytes, no_sandbox):
+    print("Testing RESULTS API...")
+    store = ResultsStore(str(tmp_path / "results.db"), flush_seconds=0.01)
+    monkeypatch.setattr(routes, "get_results_store", lambda: store)
+    client = TestClient(app)
+
+    result_ids = [
+        client.post("/api/validate-document", files={"file": ("doc.csv", csv_bytes)}).json()["result_id"]
+        for _ in range(3)
+    ]
+    store.flush()
+
+    listing = client.get("/api/results", params={"limit": 2}).json()
+    assert [d["result_id"] for d in listing["items"]] == result_ids[:0:-1]
+    more = client.get("/api/results", params={"limit": 2, "cursor": listing["next_cursor"]}).json()
+    assert [d["result_id"] for d in more["items"]] == result_ids[:1]
+    assert more["next_cursor"] is None
+
+    one = client.get(f"/api/results/{result_ids[0]}").json()
+    assert one["source"] == "doc.csv" and one["overall_status"] == "PARTIAL_PASS"
+    assert len(one["result"]["page_2"]["rows"]) == 2
+
+    summary = client.get("/api/results/summary").json()
+    assert summary["by_status"] == {"PARTIAL_PASS": 3}
+
+    assert client.get(f"/api/results/{'0' * 32}").status_code == 404
+    assert client.get("/api/results", params={"since": "yesterday"}).status_code == 400
+
+    monkeypatch.setattr(routes, "get_results_store", lambda: None)
+    assert client.get("/api/results").status_code == 503
+    store.close()
+    print("RESULTS API OK\n")
+
+
+def test_batch_cli_writes_results_db(tmp_path, csv_bytes):
+    print("Testing BATCH RESULTS DB...")
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    (docs / "a.csv").write_bytes(csv_bytes)
+    (docs / "b.csv").write_bytes(csv_bytes)
+    db = str(tmp_path / "results.db")
+    out = str(tmp_path / "out.jsonl")
+
+    for _ in range(2):  # a re-run replaces, never duplicates
+        assert main(["validate", str(docs), "-o", out, "--jobs", "1", "--results-db", db]) == 0
+
+    store = ResultsStore(db)
+    assert store.summary()["by_status"] == {"PARTIAL_PASS": 2}
+    assert {d["source"] for d in store.list_documents()["items"]} == {
+        str(docs / "a.csv"), str(docs / "b.csv")
+    }
+    store.close()
+    print("BATCH RESULTS DB OK\n")
@@ -0,0 +1,179 @@
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.main import app
+from backend.api import routes
+from backend.api.uploads import UploadStore, UploadError
+
+
+def test_store_tracks_offsets_and_rejects_gaps(tmp_path):
+    print("Testing UPLOAD STORE...")
+    store = UploadStore(str(tmp_path), max_bytes=1000, chunk_bytes=4)
+    upload = store.create("doc.csv", 10)
+    upload_id = upload["upload_id"]
+    assert upload["offset"] == 0 and upload["chunk_size"] == 4
+
+    assert store.append(upload_id, 0, b"abcd") == 4
+
+    # Replayed chunk after a dropped connection: told where to resume
+    with pytest.raises(UploadError) as replay:
+        store.append(upload_id, 0, b"abcd")
+    assert replay.value.status == 409 and replay.value.offset == 4
+
+    with pytest.raises(UploadError) as too_big:
+        store.append(upload_id, 4, b"abcde")
+    assert too_big.value.status == 413
+
+    with pytest.raises(UploadError) as early:
+        store.claim(upload_id)
+    assert early.value.status == 409
+
+    store.append(upload_id, 4, b"efgh")
+    with pytest.raises(UploadError) as past_end:
+        store.append(upload_id, 8, b"ijk")
+    assert past_end.value.status == 413
+    store.append(upload_id, 8, b"ij")
+
+    path, filename = store.claim(upload_id)
+    assert filename == "doc.csv" and path.endswith(".csv")
+    with open(path, "rb") as f:
+        assert f.read() == b"abcdefghij"
+
+    # Claimed once only; ids that are not ours never reach the filesystem
+    with pytest.raises(UploadError):
+        store.status(upload_id)
+    with pytest.raises(UploadError):
+        store.status("../../etc/passwd")
+    print("UPLOAD STORE OK\n")
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="flock is POSIX only")
+def test_append_waits_for_another_workers_lock(tmp_path):
+    print("Testing UPLOAD FILE LOCK...")
+    import fcntl
+    import threading
+
+    store = UploadStore(str(tmp_path), max_bytes=1000, chunk_bytes=4)
+    upload_id = store.create("doc.csv", 8)["upload_id"]
+    results = []
+
+    def append():
+        try:
+            results.append(store.append(upload_id, 0, b"abcd"))
+        except UploadError as e:
+            results.append(e)
+
+    # Another worker holds the spool file and writes the same chunk
+    with open(tmp_path / (upload_id + ".part"), "r+b") as other:
+        fcntl.flock(other.fileno(), fcntl.LOCK_EX)
+        worker = threading.Thread(target=append)
+        worker.start()
+        worker.join(0.3)
+        assert worker.is_alive()
+        other.write(b"abcd")
+        other.flush()
+    worker.join(5)
+
+    # Offset re-checked under the lock: no duplicate bytes
+    assert isinstance(results[0], UploadError) and results[0].offset == 4
+    assert store.status(upload_id)["offset"] == 4
+    print("UPLOAD FILE LOCK OK\n")
+
+
+def test_store_limits_and_purge(tmp_path):
+    print("Testing UPLOAD LIMITS...")
+    store = UploadStore(str(tmp_path), max_bytes=100, chunk_bytes=4, ttl=0)
+    with pytest.raises(UploadError) as too_large:
+        store.create("doc.pdf", 101)
+    assert too_large.value.status == 413
+
+    upload_id = store.create("doc.pdf", 10)["upload_id"]
+    store.append(upload_id, 0, b"1234")
+    assert upload_id in store._locks
+    assert store.purge_expired() == 2
+    assert os.listdir(tmp_path) == []
+    assert store._locks == {}
+    print("UPLOAD LIMITS OK\n")
+
+
+def test_api_chunked_upload_resume_and_finalize(tmp_path, monkeypatch, csv_bytes, no_sandbox):
+    print("Testing CHUNKED UPLOAD API...")
+    store = UploadStore(str(tmp_path), chunk_bytes=16)
+    monkeypatch.setattr(routes, "get_upload_store", lambda: store)
+    client = TestClient(app)
+
+    created = client.post("/api/uploads", params={"filename": "doc.csv", "length": len(csv_bytes)})
+    assert created.status_code == 201
+    upload_id = created.json()["upload_id"]
+    assert created.headers["Location"].endswith(upload_id)
+
+    def patch(offset, chunk):
+        return client.patch(
+            f"/api/uploads/{upload_id}",
+            content=chunk,
+            headers={"Upload-Offset": str(offset)},
+        )
+
+    assert patch(0, csv_bytes[:16]).json() == {"offset": 16}
+
+    # Client lost track: resumes from the server's offset
+    stale = patch(0, csv_bytes[:16])
+    assert stale.status_code == 409
+    offset = int(stale.headers["Upload-Offset"])
+    assert client.get(f"/api/uploads/{upload_id}").json()["offset"] == offset == 16
+
+    assert patch(offset, csv_bytes[16:48]).status_code == 413
+
+    # No Content-Length to trust: the body is capped while it streams in,
+    # before the store ever sees it
+    appended = []
+    store.append = lambda *args: appended.append(args) or 0
+    unsized = client.patch(
+        f"/api/uploads/{upload_id}",
+        content=iter([csv_bytes[16:24], csv_bytes[24:48]]),
+        headers={"Upload-Offset": str(offset)},
+    )
+    assert unsized.status_code == 413 and appended == []
+    del store.append
+    assert client.get(f"/api/uploads/{upload_id}").json()["offset"] == 16
+    assert client.post(f"/api/uploads/{upload_id}/finalize").status_code == 409
+
+    while offset < len(csv_bytes):
+        offset = patch(offset, csv_bytes[offset:offset + 16]).json()["offset"]
+
+    result = client.post(f"/api/uploads/{upload_id}/finalize", params={"include_rows": "false"})
+    assert result.status_code == 200
+    body = result.json()
+    assert body["success"] and "rows" not in body["page_2"]
+
+    # Same response as a one-shot upload of the same bytes
+    direct = client.post(
+        "/api/validate-document?include_rows=false",
+        files={"file": ("doc.csv", csv_bytes)},
+    )
+    direct_body = direct.json()
+    assert direct_body.pop("result_id") != body.pop("result_id")
+    assert direct_body == body
+
+    assert client.post(f"/api/uploads/{upload_id}/finalize").status_code == 404
+    assert os.listdir(tmp_path) == []
+    print("CHUNKED UPLOAD API OK\n")
+
+
+def test_api_rejects_unsupported_and_abandoned(tmp_path, monkeypatch):
+    print("Testing UPLOAD REJECTS...")
+    store = UploadStore(str(tmp_path))
+    monkeypatch.setattr(routes, "get_upload_store", lambda: store)
+    client = TestClient(app)
+
+    assert client.post("/api/uploads", params={"filename": "x.exe", "length": 3}).status_code == 400
+
+    upload_id = client.post("/api/uploads", params={"filename": "a.pdf", "length": 3}).json()["upload_id"]
+    assert client.delete(f"/api/uploads/{upload_id}").status_code == 204
+    assert client.get(f"/api/uploads/{upload_id}").status_code == 404
+    print("UPLOAD REJECTS OK\n")
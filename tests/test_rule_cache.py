@@ -0,0 +1,65 @@
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from backend.audit.validation.memo import clear_rule_caches, rule_cache_stats
+from backend.audit.validation.rules import validate_business_name, validate_criteria_code
+from backend.audit.validation.validator import validate_field, validate_document
+
+
+def test_repeated_values_hit_the_cache():
+    print("Testing RULE CACHE...")
+    clear_rule_caches()
+
+    first = validate_field("Partner A", validate_business_name, "Business Name")
+    second = validate_field("Partner A", validate_business_name, "Business Name")
+    assert first is second
+
+    stats = rule_cache_stats()["Business Name"]
+    print(f"Stats: {stats}")
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == 0.5
+    print("RULE CACHE OK\n")
+
+
+def test_criteria_codes_are_precomputed():
+    print("Testing PRECOMPUTED CRITERIA...")
+    clear_rule_caches()
+
+    res = validate_field("2.F", validate_criteria_code, "Criteria Code")
+    assert res.status == "FOUND_AND_VALID"
+    assert res.value == "2.f"
+
+    bad = validate_field("3.a", validate_criteria_code, "Criteria Code")
+    assert bad.status == "FOUND_BUT_INVALID"
+
+    stats = rule_cache_stats()["Criteria Code"]
+    assert stats["precomputed"] == 24
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    print("PRECOMPUTED CRITERIA OK\n")
+
+
+def test_cached_results_match_uncached_document():
+    print("Testing CACHED DOCUMENT...")
+    rows = [
+        {"business_name": "Partner A", "criteria_code": "1.a", "transaction_type": "Director"},
+        {"business_name": "Partner A", "criteria_code": "1.a", "transaction_type": "Director"},
+    ]
+    content = {
+        "page_1": {"company_name": "Acme", "year_period_end": "2024",
+                   "completed_by": "J. Doe", "date": "12/31/2024"},
+        "page_2": {"rows": rows},
+    }
+
+    clear_rule_caches()
+    cold = validate_document(content)
+    warm = validate_document(content)
+
+    assert cold == warm
+    assert cold["overall_status"] == "PASS"
+    assert warm["page_2"]["rows"][0]["fields"]["business_person_name"] is \
+        warm["page_2"]["rows"][1]["fields"]["business_person_name"]
+    print("CACHED DOCUMENT OK\n")
@@ -0,0 +1,172 @@
+import sys
+import os
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytest
+
+from backend.audit import pipeline
+from backend.audit.ingestion.sandbox import SandboxPool, SandboxAbort, resource
+
+
+# Stand-ins for pathological documents; top-level so sandbox workers can import them.
+
+def _spin(file_path, filename, pages=None):
+    while True:
+        pass
+
+
+def _sleep(file_path, filename, pages=None):
+    time.sleep(60)
+
+
+def _hog(file_path, filename, pages=None):
+    return bytearray(512 * 1024 * 1024)
+
+
+def _fine(file_path, filename, pages=None):
+    return {"page_1": {"company_name": filename}, "pid": os.getpid()}
+
+
+def _broken(file_path, filename, pages=None):
+    raise ValueError("bad xref table")
+
+
+class _FakeTesseract:
+    @staticmethod
+    def image_to_string(image, lang=None):
+        return f"Company Name: Scanned Corp\nOCR pid {os.getpid()}"
+
+
+def _scan(file_path, filename, pages=None):
+    from backend.audit.ingestion import ocr_extractor, planner
+
+    ocr_extractor.ocr_available = lambda: True
+    return planner.extract_pdf(file_path, pages={1})
+
+
+def _pool(func, **kwargs):
+    options = {"size": 1, "timeout": 20, "cpu_seconds": 0, "memory_mb": 0, "func": func}
+    options.update(kwargs)
+    return SandboxPool(**options)
+
+
+def test_sandbox_returns_result_and_reuses_worker():
+    print("Testing SANDBOX OK PATH...")
+    pool = _pool(_fine)
+    try:
+        first = pool.ingest("doc.pdf", "Acme")
+        second = pool.ingest("doc.pdf", "Acme")
+        assert first["page_1"] == {"company_name": "Acme"}
+        assert first["pid"] == second["pid"] != os.getpid()
+
+        with pytest.raises(RuntimeError, match="bad xref table"):
+            _pool(_broken).ingest("doc.pdf", "doc.pdf")
+    finally:
+        pool.shutdown()
+    print("SANDBOX OK PATH OK\n")
+
+
+def test_sandbox_wall_clock_timeout_recycles_worker():
+    print("Testing SANDBOX TIMEOUT...")
+    pool = _pool(_sleep, timeout=0.5)
+    start = time.monotonic()
+    with pytest.raises(SandboxAbort) as info:
+        pool.ingest("doc.pdf", "doc.pdf")
+    assert info.value.reason == "timeout"
+    assert time.monotonic() - start < 10
+    assert pool._idle == []
+    print("SANDBOX TIMEOUT OK\n")
+
+
+@pytest.mark.skipif(resource is None, reason="rlimits need the resource module")
+def test_sandbox_cpu_and_memory_limits():
+    print("Testing SANDBOX RLIMITS...")
+    with pytest.raises(SandboxAbort) as info:
+        _pool(_spin, cpu_seconds=1).ingest("doc.pdf", "doc.pdf")
+    assert info.value.reason == "cpu_limit"
+
+    with pytest.raises(SandboxAbort) as info:
+        _pool(_hog, memory_mb=256).ingest("doc.pdf", "doc.pdf")
+    assert info.value.reason == "memory_limit"
+    print("SANDBOX RLIMITS OK\n")
+
+
+def test_pipeline_reports_aborted_document(monkeypatch):
+    print("Testing SANDBOX PIPELINE RESULT...")
+
+    def killed(file_path, filename, pages=None):
+        raise SandboxAbort("timeout", "Document processing exceeded 60s and was stopped.")
+
+    monkeypatch.setattr(pipeline, "sandboxed_ingest", killed)
+    res = pipeline.run_pipeline("doc.pdf", "doc.pdf", sandbox=True)
+    assert res["overall_status"] == "INSUFFICIENT_DATA"
+    assert res["aborted"] == "timeout"
+    assert res["errors"] == ["Document processing exceeded 60s and was stopped."]
+    print("SANDBOX PIPELINE RESULT OK\n")
+
+
+def test_ocr_tier_uses_the_parents_ocr_pool(tmp_path, monkeypatch):
+    print("Testing SANDBOX OCR...")
+    from collections import OrderedDict
+    from pypdf import PdfWriter
+    from backend.audit.ingestion import ocr_extractor, sandbox
+
+    pdf = str(tmp_path / "scan.pdf")
+    writer = PdfWriter()
+    writer.add_blank_page(width=200, height=200)
+    with open(pdf, "wb") as f:
+        writer.write(f)
+
+    monkeypatch.setattr(ocr_extractor, "pytesseract", _FakeTesseract)
+    monkeypatch.setattr(ocr_extractor, "ocr_available", lambda: True)
+    monkeypatch.setattr(ocr_extractor, "_pool", None)
+    monkeypatch.setattr(ocr_extractor, "_cache", OrderedDict())
+
+    # Sandbox workers are daemonic: they render the page and hand it back,
+    # the OCR itself runs in this process's capped pool.
+    pool = _pool(_scan)
+    monkeypatch.setattr(sandbox, "get_pool", lambda: pool)
+    try:
+        result = sandbox.sandboxed_ingest(pdf, "scan.pdf")
+        ocr_pids = set(ocr_extractor._pool._processes)
+    finally:
+        pool.shutdown()
+        if ocr_extractor._pool is not None:
+            ocr_extractor._pool.shutdown()
+
+    print(f"Result: {result}")
+    assert "ocr_pending" not in result
+    assert result["page_1"]["company_name"] == "Scanned Corp"
+    assert result["provenance"]["company_name"]["source"] == "ocr"
+    ocr_pid = int(result["page_1"]["raw_text"].rsplit(" ", 1)[1])
+    assert ocr_pid in ocr_pids and ocr_pid != os.getpid()
+    print("SANDBOX OCR OK\n")
+
+
+def test_ingest_document_wrapper(tmp_path, monkeypatch, csv_bytes):
+    print("Testing INGEST_DOCUMENT...")
+    import asyncio
+    from types import SimpleNamespace
+    from backend.audit.ingestion import sandbox
+    from backend.audit.ingestion.router import ingest_document
+
+    path = tmp_path / "upload.csv"
+    path.write_bytes(csv_bytes)
+    upload = SimpleNamespace(filename="parties.csv")
+
+    monkeypatch.setattr(sandbox, "SANDBOX_ENABLED", False)
+    result = asyncio.run(ingest_document(upload, str(path)))
+    assert [r["business_name"] for r in result["page_2"]["rows"]] == ["Partner A", "Partner B"]
+
+    pool = _pool(_fine)
+    monkeypatch.setattr(sandbox, "SANDBOX_ENABLED", True)
+    monkeypatch.setattr(sandbox, "get_pool", lambda: pool)
+    try:
+        result = asyncio.run(ingest_document(upload, str(path)))
+    finally:
+        pool.shutdown()
+    assert result["page_1"] == {"company_name": "parties.csv"}
+    assert result["pid"] != os.getpid()
+    print("INGEST_DOCUMENT OK\n")
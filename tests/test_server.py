@@ -0,0 +1,36 @@
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from backend.server import parse_args, warm_up
+
+
+def test_parse_args_env_defaults(monkeypatch):
+    print("Testing SERVER ARGS...")
+    monkeypatch.setenv("AUDIT_WORKERS", "3")
+    monkeypatch.setenv("AUDIT_MAX_REQUESTS", "250")
+
+    monkeypatch.delenv("AUDIT_HOST", raising=False)
+    args = parse_args([])
+    assert args.host == "127.0.0.1"
+    assert args.workers == 3
+    assert args.max_requests == 250
+
+    args = parse_args(["--workers", "5", "--max-requests", "0"])
+    assert args.workers == 5
+    assert args.max_requests == 0
+
+    monkeypatch.setenv("AUDIT_HOST", "0.0.0.0")
+    assert parse_args([]).host == "0.0.0.0"
+    print("SERVER ARGS OK\n")
+
+
+def test_warm_up_exercises_every_loader():
+    print("Testing WARM-UP...")
+    report = warm_up()
+    print(f"Report: {report}")
+
+    for loader in ("acroform", "pdf_text", "docx", "xlsx", "csv", "validation"):
+        assert report.get(loader) == "OK"
+    print("WARM-UP OK\n")
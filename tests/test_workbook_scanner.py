@@ -0,0 +1,156 @@
+import sys
+import os
+import io
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from openpyxl import Workbook
+
+from backend.audit.ingestion.spreadsheet_loader import ingest_spreadsheet
+from backend.audit.ingestion.workbook_scanner import table_columns, header_labels
+
+
+def _save(wb) -> bytes:
+    buf = io.BytesIO()
+    wb.save(buf)
+    return buf.getvalue()
+
+
+def test_single_sheet_header_and_table_below():
+    print("Testing SINGLE-SHEET WORKBOOK...")
+    wb = Workbook()
+    ws = wb.active
+    ws.append(["Audit packet"])
+    ws.append(["Company Name:", "Acme"])
+    ws.append(["Year End", 2023])
+    ws.append(["Completed By", "J Doe"])
+    ws.append([])
+    ws.append(["Related parties"])
+    ws.append([None, "Type of Transaction", "Business / Person's Name", "Criteria"])
+    ws.append([None, "director", "Partner A", "1.a"])
+    ws.append([None, "employee", "Partner B", "2.b"])
+    ws.append([])
+    ws.append(["Reviewed and signed"])
+
+    out = ingest_spreadsheet(_save(wb), "doc.xlsx")
+    print(f"Output: {out}")
+
+    assert out["page_1"] == {
+        "company_name": "Acme", "year_period_end": "2023",
+        "completed_by": "J Doe", "date": None,
+    }
+    assert out["page_2"]["rows"] == [
+        {"business_name": "Partner A", "criteria_code": "1.a", "transaction_type": "director"},
+        {"business_name": "Partner B", "criteria_code": "2.b", "transaction_type": "employee"},
+    ]
+    print("SINGLE-SHEET WORKBOOK OK\n")
+
+
+def test_mislabeled_sheet_order():
+    print("Testing SWAPPED SHEETS...")
+    wb = Workbook()
+    table = wb.active
+    table.title = "Sheet1"
+    table.append(["Business Name", "Criteria Code", "Transaction Type"])
+    table.append(["Partner A", "1.a", "director"])
+
+    summary = wb.create_sheet("Summary")
+    summary.append(["See Company Name on the header tab"])
+
+    header = wb.create_sheet("Sheet3")
+    header.append(["Company Name", "Acme"])
+    header.append(["Prepared By", "J Doe"])
+    header.append(["Date", "01/05/2024"])
+
+    out = ingest_spreadsheet(_save(wb), "doc.xlsx")
+    assert out["page_1"] == {
+        "company_name": "Acme", "year_period_end": None,
+        "completed_by": "J Doe", "date": "01/05/2024",
+    }
+    assert out["page_2"]["rows"] == [
+        {"business_name": "Partner A", "criteria_code": "1.a", "transaction_type": "director"},
+    ]
+    print("SWAPPED SHEETS OK\n")
+
+
+def test_unanchored_workbook_keeps_old_layout():
+    print("Testing UNANCHORED WORKBOOK...")
+    wb = Workbook()
+    wb.active.append(["Client Company Name: Acme Holdings"])
+    rows = wb.create_sheet("Data")
+    rows.append(["A", "B", "C"])
+    rows.append(["Partner A", "1.a", "director"])
+
+    out = ingest_spreadsheet(_save(wb), "doc.xlsx")
+    assert out["page_1"]["company_name"] == "Acme Holdings"
+    assert out["page_2"]["rows"] == [
+        {"business_name": "Partner A", "criteria_code": "1.a", "transaction_type": "director"},
+    ]
+    print("UNANCHORED WORKBOOK OK\n")
+
+
+def test_header_values_on_the_row_below_their_labels():
+    print("Testing LABEL ROW / VALUE ROW...")
+    wb = Workbook()
+    ws = wb.active
+    ws.append(["Company Name:"])
+    ws.append(["Acme"])
+    ws.append(["Year End", 2023])
+    ws.append(["Completed By"])
+    ws.append(["J Doe"])
+    ws.append(["Unrelated note"])
+
+    out = ingest_spreadsheet(_save(wb), "doc.xlsx", pages={1})
+    assert out["page_1"] == {
+        "company_name": "Acme", "year_period_end": "2023",
+        "completed_by": "J Doe", "date": None,
+    }
+    print("LABEL ROW / VALUE ROW OK\n")
+
+
+def test_anchor_matching():
+    print("Testing ANCHORS...")
+    assert table_columns(["Business Name", "Criteria", "Type"]) == {
+        "business_name": 0, "criteria_code": 1, "transaction_type": 2,
+    }
+    assert table_columns(["Company Name", "Acme"]) == {}
+    assert header_labels(["Year / Period End:", "2023"]) == {"year_period_end"}
+    assert header_labels(["The date this packet was completed by the client is below."]) == set()
+    print("ANCHORS OK\n")
+
+
+def test_anchored_workbook_reads_each_sheet_once():
+    print("Testing SINGLE PASS...")
+    from openpyxl import load_workbook
+    from backend.audit.ingestion.workbook_scanner import scan_workbook
+
+    wb = Workbook()
+    header = wb.active
+    header.append(["Company Name", "Acme"])
+    for i in range(200):
+        header.append([f"note {i}"])
+    table = wb.create_sheet("Parties")
+    table.append(["Business Name", "Criteria Code", "Transaction Type"])
+    table.append(["Partner A", "1.a", "director"])
+
+    passes = []
+
+    def counted(ws):
+        iter_rows = ws.iter_rows
+
+        def wrapper(*args, **kwargs):
+            passes.append(ws.title)
+            return iter_rows(*args, **kwargs)
+        return wrapper
+
+    wb = load_workbook(io.BytesIO(_save(wb)), read_only=True)
+    for ws in wb.worksheets:
+        ws.iter_rows = counted(ws)
+
+    regions = scan_workbook(wb)
+    wb.close()
+
+    assert passes == ["Sheet", "Parties"]
+    assert regions["header"]["rows"] == [["Company Name", "Acme"]]
+    assert len(regions["table"]["rows"]) == 1
+    print("SINGLE PASS OK\n")